@@ -1,19 +1,37 @@
+import os
 import random
+import sys
 import tkinter as tk
 from tkinter import font
 
 from PIL import Image, ImageOps, ImageTk
 
+# Los módulos del simulador están en el directorio padre
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from eventos import BusEventos
+from memoria import Memoria
+from planificador import ALGORITMOS
+from proceso import Proceso
+from swap import GestorSwap
+
+MB = 1024 * 1024
+
 # =========================================================
 
 
-# --- CLASE DE PRUEBA PARA EL BACKEND DE MEMORIA ---
+# --- ADAPTADOR ENTRE LA MEMORIA DEL SIMULADOR Y LAS BARRAS DE LA INTERFAZ ---
 class GestionMemoria:
-    def __init__(self, ram_mb=2048, swap_mb=4096, block_size_mb=64):
-        num_bloques_ram = ram_mb // block_size_mb
-        num_bloques_swap = swap_mb // block_size_mb
-        self.ram = self._inicializar_memoria(num_bloques_ram)
-        self.swap = self._inicializar_memoria(num_bloques_swap)
+    """
+    Expone la RAM (Memoria) y el swap (GestorSwap) reales como listas de
+    bloques de tamaño fijo para dibujarlas en las barras de la interfaz.
+    """
+
+    def __init__(self, ram_mb=2048, swap_mb=4096, block_size_mb=64, memoria=None):
+        self.block_size = block_size_mb * MB
+        self.memoria = memoria or Memoria(tamano_total_gb=ram_mb / 1024, eventos=BusEventos())
+        self.gestor_swap = self.memoria.swap or GestorSwap(self.memoria, capacidad_gb=swap_mb / 1024)
+        self.procesos = {}
         self.procesos_colores = {}
         self._colores_disponibles = [
             "#FF5733",
@@ -26,6 +44,28 @@ class GestionMemoria:
             "#DAF7A6",
         ]
 
+    @property
+    def ram(self):
+        bloques = self._inicializar_memoria(self.memoria.tamano_total // self.block_size)
+        for bloque in self.memoria.bloques_ocupados:
+            primero = bloque.inicio // self.block_size
+            ultimo = (bloque.inicio + bloque.tamano - 1) // self.block_size
+            for i in range(primero, min(ultimo + 1, len(bloques))):
+                bloques[i] = {"estado": "ocupado", "proceso_id": bloque.pid_proceso}
+        return bloques
+
+    @property
+    def swap(self):
+        # El swap no tiene direcciones: se dibujan los procesos uno tras otro
+        bloques = self._inicializar_memoria(self.gestor_swap.capacidad // self.block_size)
+        i = 0
+        for pid, proceso in self.gestor_swap.procesos_en_swap.items():
+            for _ in range(-(-proceso.tamano_memoria // self.block_size)):
+                if i < len(bloques):
+                    bloques[i] = {"estado": "ocupado", "proceso_id": pid}
+                i += 1
+        return bloques
+
     def _inicializar_memoria(self, num_bloques):
         return [{"estado": "libre", "proceso_id": None} for _ in range(num_bloques)]
 
@@ -35,27 +75,33 @@ class GestionMemoria:
             self.procesos_colores[proceso_id] = {"color": color}
 
     def asignar_memoria_a_proceso(self, proceso_id, memoria_requerida_mb):
-        bloques_necesarios = (memoria_requerida_mb + 63) // 64
-        for i in range(len(self.ram) - bloques_necesarios + 1):
-            if all(
-                self.ram[j]["estado"] == "libre"
-                for j in range(i, i + bloques_necesarios)
-            ):
-                for j in range(i, i + bloques_necesarios):
-                    self.ram[j]["estado"] = "ocupado"
-                    self.ram[j]["proceso_id"] = proceso_id
-                return True
+        proceso = Proceso(proceso_id, 0, 1, memoria_requerida_mb * MB)
+        if self.memoria.asignar_memoria(proceso):
+            self.procesos[proceso_id] = proceso
+            self.gestor_swap.registrar_candidato(proceso)
+            return True
         return False
 
+    def enviar_a_swap(self, proceso_id):
+        proceso = self.procesos.get(proceso_id)
+        if proceso is None or not self.gestor_swap.cabe(proceso):
+            return False
+        self.gestor_swap.desalojar(proceso)
+        return True
+
     def liberar_memoria_de_proceso(self, proceso_id):
-        for bloque in self.ram:
-            if bloque["proceso_id"] == proceso_id:
-                bloque["estado"] = "libre"
-                bloque["proceso_id"] = None
-        for bloque in self.swap:
-            if bloque["proceso_id"] == proceso_id:
-                bloque["estado"] = "libre"
-                bloque["proceso_id"] = None
+        proceso = self.procesos.pop(proceso_id, None)
+        if proceso is None:
+            return
+        self.gestor_swap.retirar_candidato(proceso)
+        self.memoria.liberar_memoria(proceso)
+        self.gestor_swap.descartar(proceso)
+
+    def porcentajes(self):
+        return (
+            self.memoria.obtener_uso_memoria()["porcentaje_uso"],
+            self.gestor_swap.obtener_uso_swap()["porcentaje_uso"],
+        )
 
 
 # =========================================================
@@ -92,6 +138,7 @@ class SimuladorUI:
         self.gestor_memoria.asignar_memoria_a_proceso("P1", 300)  # Asigna 5 bloques
         self.gestor_memoria.registrar_nuevo_proceso("P2")
         self.gestor_memoria.asignar_memoria_a_proceso("P2", 500)  # Asigna 8 bloques
+        self.gestor_memoria.enviar_a_swap("P1")  # P1 pasa al swap
 
         # --- CORRECCIÓN: Llamar a la función de dibujo después de un breve retraso ---
         self.master.after(100, self._actualizar_ui_memoria)
@@ -146,9 +193,9 @@ class SimuladorUI:
             self.gestor_memoria.procesos_colores,
         )
 
-        # Actualizar porcentajes (a implementar)
-        self.label_ram_porcentaje.config(text="-- %")
-        self.label_swap_porcentaje.config(text="-- %")
+        porcentaje_ram, porcentaje_swap = self.gestor_memoria.porcentajes()
+        self.label_ram_porcentaje.config(text=f"{porcentaje_ram:.0f} %")
+        self.label_swap_porcentaje.config(text=f"{porcentaje_swap:.0f} %")
 
     def _crear_layout(self):
         """
@@ -286,7 +333,7 @@ class SimuladorUI:
         Revisa el valor del radio button y habilita o deshabilita
         la entrada de quantum según corresponda.
         """
-        if self.algoritmo_seleccionado.get() == "RR":
+        if ALGORITMOS[self.algoritmo_seleccionado.get()].usa_quantum:
             self.entrada_quantum.config(state=tk.NORMAL)
         else:
             self.entrada_quantum.config(state=tk.DISABLED)
@@ -424,27 +471,29 @@ class SimuladorUI:
             "highlightthickness": 0,
         }
 
-        # Radio button para SJF
-        self.radio_sjf = tk.Radiobutton(
-            form_container,
-            text="SJF",
-            variable=self.algoritmo_seleccionado,
-            value="SJF",
-            command=self._actualizar_estado_quantum,
-            **estilo_form_opt
-        )
-        self.radio_sjf.pack(side="left", padx=20, pady=10)
-
-        # Radio button para Round Robin
-        self.radio_rr = tk.Radiobutton(
-            form_container,
-            text="Round Robin",
-            variable=self.algoritmo_seleccionado,
-            value="RR",
-            command=self._actualizar_estado_quantum,
-            **estilo_form_opt
-        )
-        self.radio_rr.pack(side="left", padx=(0, 10), pady=10)
+        # Un radio button por algoritmo del registro del planificador (texto, nombre registrado)
+        algoritmos = [
+            ("SJF", "SJF"),
+            ("SRTF", "SRTF"),
+            ("Round Robin", "RR"),
+            ("MLFQ", "MLFQ"),
+            ("Prioridad", "Prioridad"),
+            ("Lotería", "Loteria"),
+            ("Stride", "Stride"),
+            ("CFS", "CFS"),
+        ]
+        self.radios_algoritmo = {}
+        for i, (texto, valor) in enumerate(algoritmos):
+            radio = tk.Radiobutton(
+                form_container,
+                text=texto,
+                variable=self.algoritmo_seleccionado,
+                value=valor,
+                command=self._actualizar_estado_quantum,
+                **estilo_form_opt
+            )
+            radio.pack(side="left", padx=(20 if i == 0 else 0, 10), pady=10)
+            self.radios_algoritmo[valor] = radio
 
         # Etiqueta para Quantum
         self.label_quantum = tk.Label(
@@ -0,0 +1,61 @@
+class ArbolFenwick:
+    """
+    Árbol de Fenwick (árbol binario indexado) de sumas de prefijos.
+
+    sumar() y prefijo() cuestan O(log n); buscar() localiza la posición donde
+    la suma acumulada supera un valor, también en O(log n), lo que permite
+    sortear un elemento con probabilidad proporcional a su peso.
+    """
+
+    def __init__(self, tamano):
+        self._arbol = [0] * (tamano + 1)
+        self._tamano = tamano
+        self._total = 0
+
+    @classmethod
+    def desde_valores(cls, valores):
+        """Construye el árbol en O(n) a partir de los pesos iniciales"""
+        arbol = cls(len(valores))
+        datos = arbol._arbol
+        for i, valor in enumerate(valores, 1):
+            datos[i] += valor
+            padre = i + (i & -i)
+            if padre <= arbol._tamano:
+                datos[padre] += datos[i]
+        arbol._total = sum(valores)
+        return arbol
+
+    def __len__(self):
+        return self._tamano
+
+    def sumar(self, posicion, delta):
+        """Suma 'delta' al peso de 'posicion' (base 0)"""
+        self._total += delta
+        i = posicion + 1
+        while i <= self._tamano:
+            self._arbol[i] += delta
+            i += i & -i
+
+    def prefijo(self, posicion):
+        """Suma de los pesos en [0, posicion)"""
+        suma = 0
+        i = posicion
+        while i > 0:
+            suma += self._arbol[i]
+            i -= i & -i
+        return suma
+
+    def total(self):
+        return self._total
+
+    def buscar(self, valor):
+        """Menor posición p (base 0) tal que prefijo(p + 1) > valor"""
+        posicion = 0
+        paso = 1 << self._tamano.bit_length()
+        while paso:
+            siguiente = posicion + paso
+            if siguiente <= self._tamano and self._arbol[siguiente] <= valor:
+                posicion = siguiente
+                valor -= self._arbol[siguiente]
+            paso >>= 1
+        return posicion
@@ -0,0 +1,102 @@
+import csv
+import itertools
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from eventos import BusEventos
+from planificador import ALGORITMOS
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+# Métricas de calcular_estadisticas() que se copian a cada fila del barrido
+METRICAS = ("procesos_terminados", "tiempo_promedio_retorno", "tiempo_promedio_respuesta",
+            "tiempo_promedio_espera", "tiempo_total_simulacion", "throughput", "indice_equidad_jain")
+PARAMETROS = ("algoritmo", "quantum", "num_nucleos", "memoria_gb", "semilla", "num_procesos")
+
+
+def generar_configuraciones(algoritmos, quantums=(2,), nucleos=(2,), memorias_gb=(2,), semillas=(0,),
+                            num_procesos=20):
+    """
+    Producto cartesiano de la grilla como lista de diccionarios. Los algoritmos sin
+    quantum se simulan una sola vez por combinación (con quantum None)
+    """
+    configuraciones = []
+    for algoritmo in algoritmos:
+        if algoritmo not in ALGORITMOS:
+            raise ValueError(f"Algoritmo de planificación no reconocido: {algoritmo}")
+        valores_quantum = quantums if ALGORITMOS[algoritmo].usa_quantum else (None,)
+        for quantum, num_nucleos, memoria_gb, semilla in itertools.product(valores_quantum, nucleos,
+                                                                          memorias_gb, semillas):
+            configuraciones.append({"algoritmo": algoritmo, "quantum": quantum, "num_nucleos": num_nucleos,
+                                    "memoria_gb": memoria_gb, "semilla": semilla, "num_procesos": num_procesos})
+    return configuraciones
+
+
+def crear_carga(semilla, num_procesos=20):
+    """Carga aleatoria reproducible: la misma semilla da los mismos procesos en todas las configuraciones"""
+    rng = random.Random(semilla)
+    return [Proceso(pid, rng.randint(0, 30), rng.randint(2, 15), rng.randint(50, 400) * MB,
+                    prioridad=rng.randint(-5, 5))
+            for pid in range(1, num_procesos + 1)]
+
+
+def simular_configuracion(configuracion):
+    """Ejecuta una configuración sin salida por consola y retorna su fila de resultados"""
+    simulador = Simulador(num_nucleos=configuracion["num_nucleos"], memoria_gb=configuracion["memoria_gb"],
+                          eventos=BusEventos.silencioso(), tiempo_limite=None)
+    simulador.configurar_algoritmo(configuracion["algoritmo"])
+    if configuracion["quantum"] is not None:
+        simulador.set_quantum(configuracion["quantum"])
+    simulador.agregar_procesos(crear_carga(configuracion["semilla"], configuracion["num_procesos"]))
+    estadisticas = simulador.ejecutar()
+    fila = dict(configuracion)
+    for metrica in METRICAS:
+        fila[metrica] = estadisticas.get(metrica)
+    return fila
+
+
+def _simular_bloque(configuraciones):
+    return [simular_configuracion(configuracion) for configuracion in configuraciones]
+
+
+def ejecutar_barrido(configuraciones, max_procesos=None, tamano_bloque=None):
+    """
+    Reparte las configuraciones en bloques entre procesos del sistema y entrega las
+    filas a medida que termina cada bloque (no en el orden de entrada). Los bloques
+    amortizan el costo de enviar cada tarea al proceso trabajador
+    """
+    configuraciones = list(configuraciones)
+    if not configuraciones:
+        return
+    max_procesos = max_procesos or os.cpu_count() or 1
+    if tamano_bloque is None:
+        # Unos cuatro bloques por trabajador para repartir bien la carga
+        tamano_bloque = max(1, math.ceil(len(configuraciones) / (max_procesos * 4)))
+    bloques = [configuraciones[i:i + tamano_bloque] for i in range(0, len(configuraciones), tamano_bloque)]
+    with ProcessPoolExecutor(max_workers=max_procesos) as ejecutor:
+        pendientes = [ejecutor.submit(_simular_bloque, bloque) for bloque in bloques]
+        for terminado in as_completed(pendientes):
+            yield from terminado.result()
+
+
+def escribir_tabla(filas, ruta):
+    """Escribe las filas en un CSV consolidado, ordenadas por parámetros"""
+    filas = sorted(filas, key=lambda fila: tuple(str(fila[p]) for p in PARAMETROS))
+    with open(ruta, "w", newline="", encoding="utf-8") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=PARAMETROS + METRICAS)
+        escritor.writeheader()
+        escritor.writerows(filas)
+    return len(filas)
+
+
+def resumir(filas, por=("algoritmo",), metrica="tiempo_promedio_retorno"):
+    """Promedio de 'metrica' agrupando por las columnas 'por'"""
+    grupos = {}
+    for fila in filas:
+        if fila[metrica] is not None:
+            grupos.setdefault(tuple(fila[c] for c in por), []).append(fila[metrica])
+    return {clave: sum(valores) / len(valores) for clave, valores in sorted(grupos.items(), key=str)}
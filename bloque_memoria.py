@@ -1,10 +1,108 @@
 class BloqueMemoria:
+    """
+    Vista ligera de un bloque de memoria.
+
+    Los bloques de Memoria viven como filas de una TablaBloques; un
+    BloqueMemoria creado con vista() solo guarda la tabla y el número de
+    fila, y lee/escribe sus atributos directamente en las columnas (por eso
+    refleja al instante las reubicaciones de la compactación). Un bloque
+    creado con el constructor es independiente y guarda sus propios valores.
+    """
+
+    __slots__ = ("_tabla", "_fila")
+
     def __init__(self, id_bloque, inicio, tamano, ocupado=False, pid_proceso=None):
-        self.id = id_bloque
-        self.inicio = inicio
-        self.tamano = tamano
-        self.ocupado = ocupado
-        self.pid_proceso = pid_proceso
+        self._tabla = [id_bloque, inicio, tamano, ocupado, pid_proceso]
+        self._fila = None
+
+    @classmethod
+    def vista(cls, tabla, fila):
+        bloque = cls.__new__(cls)
+        bloque._tabla = tabla
+        bloque._fila = fila
+        return bloque
+
+    def desvincular(self):
+        """Copia los valores actuales y deja de depender de la tabla (antes de reciclar la fila)"""
+        if self._fila is not None:
+            self._tabla = [self.id, self.inicio, self.tamano, self.ocupado, self.pid_proceso]
+            self._fila = None
+
+    @property
+    def id(self):
+        if self._fila is None:
+            return self._tabla[0]
+        return self._tabla.id[self._fila]
+
+    @id.setter
+    def id(self, valor):
+        if self._fila is None:
+            self._tabla[0] = valor
+        else:
+            self._tabla.id[self._fila] = valor
+
+    @property
+    def inicio(self):
+        if self._fila is None:
+            return self._tabla[1]
+        return self._tabla.inicio[self._fila]
+
+    @inicio.setter
+    def inicio(self, valor):
+        if self._fila is None:
+            self._tabla[1] = valor
+        else:
+            self._tabla.inicio[self._fila] = valor
+
+    @property
+    def tamano(self):
+        if self._fila is None:
+            return self._tabla[2]
+        return self._tabla.tamano[self._fila]
+
+    @tamano.setter
+    def tamano(self, valor):
+        if self._fila is None:
+            self._tabla[2] = valor
+        else:
+            self._tabla.tamano[self._fila] = valor
+
+    @property
+    def ocupado(self):
+        if self._fila is None:
+            return self._tabla[3]
+        return self._tabla.esta_ocupado(self._fila)
+
+    @ocupado.setter
+    def ocupado(self, valor):
+        if self._fila is None:
+            self._tabla[3] = valor
+        else:
+            self._tabla.marcar_ocupado(self._fila, valor)
+
+    @property
+    def pid_proceso(self):
+        if self._fila is None:
+            return self._tabla[4]
+        return self._tabla.pid_de(self._fila)
+
+    @pid_proceso.setter
+    def pid_proceso(self, valor):
+        if self._fila is None:
+            self._tabla[4] = valor
+        else:
+            self._tabla.asignar_pid(self._fila, valor)
+
+    def __eq__(self, otro):
+        if not isinstance(otro, BloqueMemoria):
+            return NotImplemented
+        if self._fila is not None and otro._fila is not None:
+            return self._tabla is otro._tabla and self._fila == otro._fila
+        return (self.id, self.inicio, self.tamano, self.ocupado, self.pid_proceso) == \
+               (otro.id, otro.inicio, otro.tamano, otro.ocupado, otro.pid_proceso)
+
+    def __hash__(self):
+        return hash((self.id, self.pid_proceso))
 
     def __repr__(self):
         return f"Bloque {self.id} (Inicio: {self.inicio}, Tam: {self.tamano}, Ocupado: {self.ocupado}, PID: {self.pid_proceso})"
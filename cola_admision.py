@@ -0,0 +1,80 @@
+import itertools
+import math
+
+from treap import Treap
+
+
+class ColaAdmision:
+    """
+    Procesos que ya llegaron pero esperan memoria, indexados por tamaño solicitado.
+
+    El simulador solo recorre la cola cuando el mayor espacio asignable alcanza
+    la solicitud más chica (tamano_minimo), o cuando cambió el swap. Órdenes
+    de admisión:
+      - "fifo": por orden de llegada, saltando a los que no caben
+      - "menor_primero": primero las solicitudes más chicas
+      - "mayor_que_cabe": primero la solicitud más grande que cabe
+    Los dos últimos evitan que un proceso grande al frente bloquee a los demás.
+    """
+
+    ORDENES = ("fifo", "menor_primero", "mayor_que_cabe")
+
+    def __init__(self, orden="fifo"):
+        if orden not in self.ORDENES:
+            raise ValueError(f"Orden de admisión no reconocido: {orden}")
+        self.orden = orden
+        self._por_tamano = Treap()  # (tamaño, orden de llegada) -> proceso
+        self._por_pid = {}          # pid -> (clave en _por_tamano, proceso), en orden de llegada
+        self._contador = itertools.count()
+
+    def agregar(self, proceso):
+        clave = (proceso.tamano_memoria, next(self._contador))
+        self._por_tamano.insertar(clave, proceso)
+        self._por_pid[proceso.pid] = (clave, proceso)
+
+    def quitar(self, proceso):
+        """Retira 'proceso' de la cola. Retorna False si no estaba"""
+        entrada = self._por_pid.pop(proceso.pid, None)
+        if entrada is None:
+            return False
+        self._por_tamano.eliminar(entrada[0])
+        return True
+
+    @property
+    def tamano_minimo(self):
+        """Menor solicitud en espera, o None si la cola está vacía"""
+        minimo = self._por_tamano.minimo()
+        return minimo[0][0] if minimo is not None else None
+
+    def en_orden(self, hasta=None):
+        """Procesos en orden de admisión; con 'hasta', solo los que piden a lo sumo 'hasta' bytes"""
+        if hasta is None:
+            hasta = math.inf
+        if self.orden == "fifo":
+            return [proceso for clave, proceso in self._por_pid.values() if clave[0] <= hasta]
+        if self.orden == "menor_primero":
+            procesos = []
+            for (tamano, _), proceso in self._por_tamano:
+                if tamano > hasta:
+                    break
+                procesos.append(proceso)
+            return procesos
+        procesos = []
+        par = self._por_tamano.suelo((hasta, math.inf))
+        while par is not None:
+            procesos.append(par[1])
+            par = self._por_tamano.predecesor(par[0])
+        return procesos
+
+    def __len__(self):
+        return len(self._por_pid)
+
+    def __bool__(self):
+        return bool(self._por_pid)
+
+    def __iter__(self):
+        """Procesos en orden de llegada"""
+        return iter([proceso for _, proceso in self._por_pid.values()])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._por_pid
@@ -0,0 +1,613 @@
+import collections
+import heapq
+import itertools
+import math
+import random
+from fractions import Fraction
+
+from arbol_fenwick import ArbolFenwick
+from treap import Treap
+
+# Peso de cada nivel nice (-20..19), la tabla sched_prio_to_weight del CFS de Linux:
+# cada nivel reparte ~10% más o menos CPU que el siguiente
+PESOS_NICE = (
+    88761, 71755, 56483, 46273, 36291,
+    29154, 23254, 18705, 14949, 11916,
+    9548, 7620, 6100, 4904, 3906,
+    3121, 2501, 1991, 1586, 1277,
+    1024, 820, 655, 526, 423,
+    335, 272, 215, 172, 137,
+    110, 87, 70, 56, 45,
+    36, 29, 23, 18, 15,
+)
+PESO_NICE_0 = 1024
+
+
+def peso_nice(nice):
+    """Peso CFS de un proceso según su nice (Proceso.prioridad), acotado a [-20, 19]"""
+    return PESOS_NICE[min(max(nice, -20), 19) + 20]
+
+
+class ColaListos:
+    """
+    Interfaz de las colas de procesos listos.
+
+    Cada implementación fija el orden de servicio: extraer() devuelve (y quita)
+    el siguiente proceso a despachar, y quitar() retira un proceso concreto
+    (por ejemplo, una víctima enviada a swap).
+    """
+
+    def agregar(self, proceso):
+        raise NotImplementedError
+
+    def extraer(self):
+        """Quita y retorna el siguiente proceso, o None si la cola está vacía"""
+        raise NotImplementedError
+
+    def extraer_varios(self, k):
+        """Quita y retorna hasta k procesos en orden de servicio"""
+        procesos = []
+        while len(procesos) < k:
+            proceso = self.extraer()
+            if proceso is None:
+                break
+            procesos.append(proceso)
+        return procesos
+
+    def ver_primero(self):
+        """Siguiente proceso a despachar sin quitarlo (lo usan los algoritmos expropiativos)"""
+        raise NotImplementedError
+
+    def quitar(self, proceso):
+        """Retira 'proceso' de la cola. Retorna False si no estaba"""
+        raise NotImplementedError
+
+    def __len__(self):
+        raise NotImplementedError
+
+    def __iter__(self):
+        """Procesos en orden de servicio"""
+        raise NotImplementedError
+
+    def al_avanzar_tiempo(self, tiempo):
+        """Gancho por paso de simulación (p. ej. boost periódico de MLFQ)"""
+
+    def proximo_evento(self, tiempo):
+        """Próximo instante en que la cola cambia por sí sola (p. ej. boost de MLFQ), o None"""
+        return None
+
+    def __bool__(self):
+        return len(self) > 0
+
+
+class ColaFIFO(ColaListos):
+    """
+    Cola en orden de llegada (Round Robin) sobre un deque.
+
+    Un índice pid -> orden de la entrada vigente da pertenencia en O(1);
+    quitar() invalida la entrada y extraer() descarta las invalidadas al
+    llegar al frente, así despachar, desalojar y reencolar son O(1).
+    """
+
+    def __init__(self, procesos=()):
+        self._orden = itertools.count()
+        self._vigentes = {}  # pid -> orden de la entrada vigente
+        self._cola = collections.deque()
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def agregar(self, proceso):
+        orden = next(self._orden)
+        self._vigentes[proceso.pid] = orden
+        self._cola.append((orden, proceso.pid, proceso))
+
+    def extraer(self):
+        while self._cola:
+            orden, pid, proceso = self._cola.popleft()
+            if self._vigentes.get(pid) == orden:
+                del self._vigentes[pid]
+                return proceso
+        return None
+
+    def quitar(self, proceso):
+        if self._vigentes.pop(proceso.pid, None) is None:
+            return False
+        # Descartar las entradas invalidadas cuando dominan la cola
+        if len(self._cola) > 2 * len(self._vigentes) + 64:
+            self._cola = collections.deque(e for e in self._cola if self._vigentes.get(e[1]) == e[0])
+        return True
+
+    def __len__(self):
+        return len(self._vigentes)
+
+    def __iter__(self):
+        return iter([e[2] for e in self._cola if self._vigentes.get(e[1]) == e[0]])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._vigentes
+
+
+class ColaPorClave(ColaListos):
+    """
+    Cola ordenada por una clave numérica (menor primero) sobre un heap binario.
+
+    Las entradas son (clave, orden, pid, proceso); el orden de llegada desempata.
+    quitar() es un borrado perezoso: solo invalida la entrada, que extraer()
+    descarta al salir del heap. Las subclases definen _clave().
+    """
+
+    def __init__(self, procesos=()):
+        self._orden = itertools.count()
+        self._vigentes = {}  # pid -> orden de la entrada vigente
+        self._heap = []
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def _clave(self, proceso):
+        raise NotImplementedError
+
+    def agregar(self, proceso):
+        orden = next(self._orden)
+        self._vigentes[proceso.pid] = orden
+        heapq.heappush(self._heap, (self._clave(proceso), orden, proceso.pid, proceso))
+
+    def extraer(self):
+        while self._heap:
+            _, orden, pid, proceso = heapq.heappop(self._heap)
+            if self._vigentes.get(pid) == orden:
+                del self._vigentes[pid]
+                return proceso
+        return None
+
+    def ver_primero(self):
+        """Siguiente proceso a despachar sin quitarlo, o None"""
+        while self._heap:
+            _, orden, pid, proceso = self._heap[0]
+            if self._vigentes.get(pid) == orden:
+                return proceso
+            heapq.heappop(self._heap)
+        return None
+
+    def quitar(self, proceso):
+        if self._vigentes.pop(proceso.pid, None) is None:
+            return False
+        # Reconstruir el heap cuando las entradas invalidadas dominan
+        if len(self._heap) > 2 * len(self._vigentes) + 64:
+            self._heap = [e for e in self._heap if self._vigentes.get(e[2]) == e[1]]
+            heapq.heapify(self._heap)
+        return True
+
+    def __len__(self):
+        return len(self._vigentes)
+
+    def __iter__(self):
+        return iter([e[3] for e in sorted(self._heap) if self._vigentes.get(e[2]) == e[1]])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._vigentes
+
+
+class ColaSJF(ColaPorClave):
+    """
+    Cola ordenada por tiempo restante (Shortest Job First / SRTF).
+    El orden de llegada desempata igual que el sorted() estable original.
+    """
+
+    def _clave(self, proceso):
+        return proceso.tiempo_restante
+
+
+class ColaPrioridad(ColaPorClave):
+    """
+    Cola por prioridad estática (menor valor primero) con envejecimiento.
+
+    La prioridad efectiva de un proceso mejora un punto cada
+    'intervalo_envejecimiento' unidades de tiempo de espera: prioridad - espera / intervalo.
+    Como el término del tiempo actual es común a todos, ordenar por
+    prioridad * intervalo + tiempo_de_encolado da el mismo orden, y la clave no
+    cambia mientras el proceso espera: el envejecimiento no requiere recorrer la cola.
+
+    La espera acumulada se guarda en Proceso.espera_envejecida al salir de la cola:
+    un proceso despachado conserva la prioridad que alcanzó mientras corre, y si lo
+    expropian vuelve a la cola sin perder lo que ya había envejecido.
+    """
+
+    def __init__(self, procesos=(), intervalo_envejecimiento=10):
+        if intervalo_envejecimiento <= 0:
+            raise ValueError("El intervalo de envejecimiento debe ser positivo.")
+        self.intervalo_envejecimiento = intervalo_envejecimiento
+        self.tiempo = 0
+        self._encolado = {}  # pid -> tiempo de encolado, descontada la espera previa
+        super().__init__(procesos)
+
+    def al_avanzar_tiempo(self, tiempo):
+        self.tiempo = tiempo
+
+    def agregar(self, proceso):
+        self._encolado[proceso.pid] = self.tiempo - proceso.espera_envejecida
+        super().agregar(proceso)
+
+    def _clave(self, proceso):
+        return proceso.prioridad * self.intervalo_envejecimiento + self._encolado[proceso.pid]
+
+    def _espera(self, proceso):
+        if proceso.pid in self._vigentes:
+            return self.tiempo - self._encolado[proceso.pid]
+        return proceso.espera_envejecida
+
+    def prioridad_efectiva(self, proceso):
+        """Prioridad con envejecimiento, esté el proceso en la cola o en ejecución"""
+        return proceso.prioridad - self._espera(proceso) / self.intervalo_envejecimiento
+
+    def clave_efectiva(self, proceso):
+        """prioridad_efectiva() escalada por el intervalo: mismo orden, sin redondeo de divisiones"""
+        return proceso.prioridad * self.intervalo_envejecimiento - self._espera(proceso)
+
+    def instante_de_superar(self, proceso, clave):
+        """Primer instante entero en que clave_efectiva() de 'proceso' (en la cola) queda por debajo de 'clave'"""
+        return math.floor(self._clave(proceso) - clave) + 1
+
+    def _salir(self, proceso):
+        proceso.espera_envejecida = self.tiempo - self._encolado.pop(proceso.pid)
+
+    def extraer(self):
+        proceso = super().extraer()
+        if proceso is not None:
+            self._salir(proceso)
+        return proceso
+
+    def quitar(self, proceso):
+        if not super().quitar(proceso):
+            return False
+        self._salir(proceso)
+        return True
+
+
+class ColaStride(ColaPorClave):
+    """
+    Planificación por pasos (stride): cada proceso avanza su 'pase' en
+    PASO_GRANDE / boletos cada vez que es despachado, y siempre se despacha el
+    de menor pase. Reparte la CPU en proporción a los boletos de forma determinista.
+    """
+
+    PASO_GRANDE = 1 << 20
+
+    def __init__(self, procesos=()):
+        self._pase_global = 0  # Pase del último despachado: punto de entrada de los nuevos
+        super().__init__(procesos)
+
+    def _clave(self, proceso):
+        if proceso.pase_stride < self._pase_global:
+            proceso.pase_stride = self._pase_global  # Sin crédito acumulado por haber estado ausente
+        return proceso.pase_stride
+
+    def extraer(self):
+        proceso = super().extraer()
+        if proceso is not None:
+            self._pase_global = proceso.pase_stride
+            proceso.pase_stride += self.PASO_GRANDE // max(1, proceso.boletos)
+        return proceso
+
+
+class ColaLoteria(ColaListos):
+    """
+    Planificación por lotería: cada proceso listo tiene 'boletos' y se sortea
+    uno entre todos. Los boletos viven en un árbol de Fenwick indexado por
+    ranura, de modo que agregar, quitar y sortear cuestan O(log n).
+    """
+
+    def __init__(self, procesos=(), semilla=0):
+        self._rng = random.Random(semilla)
+        self._boletos = ArbolFenwick(64)
+        self._procesos = [None] * 64    # ranura -> proceso
+        self._ranuras = {}              # pid -> ranura
+        self._ranuras_libres = list(range(63, -1, -1))
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def agregar(self, proceso):
+        if not self._ranuras_libres:
+            self._crecer()
+        ranura = self._ranuras_libres.pop()
+        self._procesos[ranura] = proceso
+        self._ranuras[proceso.pid] = ranura
+        self._boletos.sumar(ranura, max(1, proceso.boletos))
+
+    def extraer(self):
+        if not self._ranuras:
+            return None
+        ganador = self._rng.randrange(self._boletos.total())
+        proceso = self._procesos[self._boletos.buscar(ganador)]
+        self.quitar(proceso)
+        return proceso
+
+    def quitar(self, proceso):
+        ranura = self._ranuras.pop(proceso.pid, None)
+        if ranura is None:
+            return False
+        self._boletos.sumar(ranura, -max(1, proceso.boletos))
+        self._procesos[ranura] = None
+        self._ranuras_libres.append(ranura)
+        return True
+
+    def _crecer(self):
+        capacidad = len(self._procesos)
+        self._procesos.extend([None] * capacidad)
+        self._boletos = ArbolFenwick.desde_valores(
+            [max(1, p.boletos) if p is not None else 0 for p in self._procesos])
+        self._ranuras_libres = list(range(2 * capacidad - 1, capacidad - 1, -1))
+
+    def __len__(self):
+        return len(self._ranuras)
+
+    def __iter__(self):
+        return iter([p for p in self._procesos if p is not None])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._ranuras
+
+
+class ColaMLFQ(ColaListos):
+    """
+    Cola multinivel con retroalimentación (MLFQ).
+
+    Hay un deque FIFO por nivel (0 = máxima prioridad) y cada nivel tiene su
+    propio quantum. Un bit por nivel no vacío permite hallar el primer nivel
+    con procesos en O(1) (bit menos significativo de la máscara). Al agotar su
+    quantum un proceso baja un nivel; cada 'periodo_boost' unidades de tiempo
+    todos vuelven al nivel 0. Los procesos en CPU se promueven de forma
+    perezosa comparando su época de boost al volver a la cola.
+    """
+
+    def __init__(self, procesos=(), quantums=(1, 2, 4), periodo_boost=20):
+        if not quantums or any(q <= 0 for q in quantums):
+            raise ValueError("Cada nivel de MLFQ necesita un quantum positivo.")
+        self.quantums = tuple(quantums)
+        self.periodo_boost = periodo_boost
+        self._niveles = [collections.deque() for _ in self.quantums]
+        self._no_vacios = 0  # Bit i encendido si el nivel i puede tener entradas
+        self._orden = itertools.count()
+        self._vigentes = {}  # pid -> orden de la entrada vigente
+        self._epoca = 0      # Número de boosts realizados
+        self._ultimo_boost = 0
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def nivel_de(self, proceso):
+        if proceso.epoca_mlfq != self._epoca:
+            proceso.nivel_mlfq = 0
+            proceso.epoca_mlfq = self._epoca
+        return proceso.nivel_mlfq
+
+    def quantum_de(self, proceso):
+        return self.quantums[self.nivel_de(proceso)]
+
+    def degradar(self, proceso):
+        """El proceso agotó su quantum: pasa al nivel inferior"""
+        proceso.nivel_mlfq = min(self.nivel_de(proceso) + 1, len(self.quantums) - 1)
+
+    def al_avanzar_tiempo(self, tiempo):
+        if self.periodo_boost and tiempo - self._ultimo_boost >= self.periodo_boost:
+            # Alineado al periodo aunque el reloj haya saltado varios periodos
+            self.boost(tiempo - (tiempo - self._ultimo_boost) % self.periodo_boost)
+
+    def proximo_evento(self, tiempo):
+        if not self.periodo_boost:
+            return None
+        return self._ultimo_boost + self.periodo_boost
+
+    def boost(self, tiempo=0):
+        """Sube todos los procesos al nivel 0 conservando su orden"""
+        self._epoca += 1
+        self._ultimo_boost = tiempo
+        primer_nivel = self._niveles[0]
+        for cola in self._niveles[1:]:
+            for orden, pid, proceso in cola:
+                if self._vigentes.get(pid) == orden:
+                    primer_nivel.append((orden, pid, proceso))
+            cola.clear()
+        self._no_vacios = 1 if primer_nivel else 0
+
+    def agregar(self, proceso):
+        nivel = self.nivel_de(proceso)
+        orden = next(self._orden)
+        self._vigentes[proceso.pid] = orden
+        self._niveles[nivel].append((orden, proceso.pid, proceso))
+        self._no_vacios |= 1 << nivel
+
+    def extraer(self):
+        while self._no_vacios:
+            nivel = (self._no_vacios & -self._no_vacios).bit_length() - 1
+            cola = self._niveles[nivel]
+            while cola:
+                orden, pid, proceso = cola.popleft()
+                if self._vigentes.get(pid) == orden:
+                    del self._vigentes[pid]
+                    if not cola:
+                        self._no_vacios &= ~(1 << nivel)
+                    return proceso
+            self._no_vacios &= ~(1 << nivel)
+        return None
+
+    def quitar(self, proceso):
+        if self._vigentes.pop(proceso.pid, None) is None:
+            return False
+        if not self._vigentes:
+            for cola in self._niveles:
+                cola.clear()
+            self._no_vacios = 0
+        return True
+
+    def __len__(self):
+        return len(self._vigentes)
+
+    def __iter__(self):
+        return iter([proceso for cola in self._niveles
+                     for orden, pid, proceso in cola if self._vigentes.get(pid) == orden])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._vigentes
+
+
+class ColasPorNucleo(ColaListos):
+    """
+    Una cola de listos por núcleo, presentada como una sola ColaListos.
+
+    Un proceso que vuelve a la cola (desalojo, swap) regresa a la cola del
+    último núcleo donde corrió; los que nunca corrieron se reparten con la
+    política de balanceo:
+      - "menos_cargada": la cola más corta (contando el proceso en ejecución)
+      - "rotativa": los núcleos por turno
+      - "dos_opciones": la menos cargada entre dos núcleos al azar
+    Un núcleo libre toma de su propia cola y, si está vacía, roba de la cola
+    más cargada (extraer_para indica si hubo migración).
+    """
+
+    BALANCEOS = ("menos_cargada", "rotativa", "dos_opciones")
+
+    def __init__(self, colas, nucleos, balanceo="menos_cargada", semilla=0):
+        if balanceo not in self.BALANCEOS:
+            raise ValueError(f"Política de balanceo no reconocida: {balanceo}")
+        self.colas = colas
+        self._nucleos = nucleos   # Lista CPU.nucleos, para conocer la carga de cada núcleo
+        self.balanceo = balanceo
+        self._rng = random.Random(semilla)
+        self._turno = 0
+        self._cola_de = {}        # pid -> índice de la cola donde está el proceso
+        self.robos = 0
+
+    def _carga(self, i):
+        return len(self.colas[i]) + (1 if self._nucleos[i] is not None else 0)
+
+    def _elegir_cola(self, proceso):
+        if proceso.ultimo_nucleo is not None:
+            return proceso.ultimo_nucleo
+        if self.balanceo == "rotativa":
+            i = self._turno
+            self._turno = (self._turno + 1) % len(self.colas)
+            return i
+        if self.balanceo == "dos_opciones":
+            a, b = self._rng.randrange(len(self.colas)), self._rng.randrange(len(self.colas))
+            return a if self._carga(a) <= self._carga(b) else b
+        return min(range(len(self.colas)), key=self._carga)
+
+    def agregar(self, proceso):
+        i = self._elegir_cola(proceso)
+        self._cola_de[proceso.pid] = i
+        self.colas[i].agregar(proceso)
+
+    def extraer_para(self, nucleo):
+        """Siguiente proceso para 'nucleo': (proceso, migrado) o (None, False)"""
+        proceso = self.colas[nucleo].extraer()
+        migrado = False
+        if proceso is None:
+            mas_cargada = max(range(len(self.colas)), key=lambda i: len(self.colas[i]))
+            proceso = self.colas[mas_cargada].extraer()
+            if proceso is None:
+                return None, False
+            migrado = True
+            self.robos += 1
+        del self._cola_de[proceso.pid]
+        return proceso, migrado
+
+    def extraer(self):
+        for i in range(len(self.colas)):
+            if self.colas[i]:
+                return self.extraer_para(i)[0]
+        return None
+
+    def quitar(self, proceso):
+        i = self._cola_de.pop(proceso.pid, None)
+        if i is None:
+            return False
+        return self.colas[i].quitar(proceso)
+
+    def al_avanzar_tiempo(self, tiempo):
+        for cola in self.colas:
+            cola.al_avanzar_tiempo(tiempo)
+
+    def __len__(self):
+        return len(self._cola_de)
+
+    def __iter__(self):
+        return iter([proceso for cola in self.colas for proceso in cola])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._cola_de
+
+
+class ColaCFS(ColaListos):
+    """
+    Cola del planificador completamente justo (CFS).
+
+    Los procesos listos viven en un treap ordenado por (vruntime, orden), así
+    que el de menor tiempo virtual se obtiene y extrae en O(log n). El vruntime
+    avanza más lento cuanto mayor es el peso (menor nice) del proceso y se
+    guarda como Fraction: el orden y los empates no dependen de si la ejecución
+    se cargó en un solo paso o unidad por unidad. El timeslice reparte 'latencia_objetivo' entre los procesos ejecutables en
+    proporción a su peso, sin bajar de 'granularidad_minima'.
+    """
+
+    def __init__(self, procesos=(), latencia_objetivo=6, granularidad_minima=1):
+        self.latencia_objetivo = latencia_objetivo
+        self.granularidad_minima = granularidad_minima
+        self.min_vruntime = 0
+        self._arbol = Treap()
+        self._claves = {}  # pid -> clave (vruntime, orden) en el árbol
+        self._orden = itertools.count()
+        self._peso_total = 0
+        for proceso in procesos:
+            self.agregar(proceso)
+
+    def agregar(self, proceso):
+        # Quien vuelve tras esperar no acumula crédito frente a los que siguieron corriendo
+        if proceso.vruntime < self.min_vruntime:
+            proceso.vruntime = self.min_vruntime
+        clave = (proceso.vruntime, next(self._orden))
+        self._arbol.insertar(clave, proceso)
+        self._claves[proceso.pid] = clave
+        self._peso_total += peso_nice(proceso.prioridad)
+
+    def extraer(self):
+        minimo = self._arbol.minimo()
+        if minimo is None:
+            return None
+        clave, proceso = minimo
+        self._retirar(clave, proceso)
+        self.min_vruntime = max(self.min_vruntime, clave[0])
+        return proceso
+
+    def ver_primero(self):
+        minimo = self._arbol.minimo()
+        return minimo[1] if minimo is not None else None
+
+    def quitar(self, proceso):
+        clave = self._claves.get(proceso.pid)
+        if clave is None:
+            return False
+        self._retirar(clave, proceso)
+        return True
+
+    def _retirar(self, clave, proceso):
+        self._arbol.eliminar(clave)
+        del self._claves[proceso.pid]
+        self._peso_total -= peso_nice(proceso.prioridad)
+
+    def timeslice(self, proceso):
+        """Parte de la latencia objetivo que corresponde al proceso según su peso"""
+        peso = peso_nice(proceso.prioridad)
+        peso_total = self._peso_total if proceso.pid in self._claves else self._peso_total + peso
+        return max(self.granularidad_minima, round(self.latencia_objetivo * peso / peso_total))
+
+    def cargar_ejecucion(self, proceso, tiempo):
+        """Suma al vruntime el tiempo ejecutado, ponderado por el peso del proceso"""
+        proceso.vruntime += Fraction(tiempo * PESO_NICE_0, peso_nice(proceso.prioridad))
+
+    def __len__(self):
+        return len(self._claves)
+
+    def __iter__(self):
+        return iter([proceso for _, proceso in self._arbol])
+
+    def __contains__(self, proceso):
+        return proceso.pid in self._claves
@@ -0,0 +1,103 @@
+import heapq
+import itertools
+
+
+class ColaLlegadas:
+    """
+    Procesos que todavía no llegan al sistema, en orden de tiempo de llegada.
+
+    Los procesos cargados de una vez (cargar) se ordenan en un arreglo que se
+    recorre con un cursor; los agregados uno a uno van a un montículo. Una
+    fuente perezosa ya ordenada (conectar, p. ej. una traza) se lee de a un
+    proceso por adelantado, a medida que avanza el reloj. Cada paso solo toca
+    los procesos que ya llegaron, en lugar de recorrer todos los pendientes.
+    A igual tiempo de llegada se respeta el orden de alta.
+    """
+
+    def __init__(self, procesos=()):
+        self._orden = itertools.count()
+        self._ordenados = []  # (tiempo_llegada, orden, proceso) ordenados; se consumen desde _cursor
+        self._cursor = 0
+        self._heap = []       # (tiempo_llegada, orden, proceso) agregados individualmente
+        self._fuente = None   # Iterador perezoso en orden de llegada (conectar)
+        self._de_fuente = None  # (tiempo_llegada, orden, proceso) leído por adelantado de _fuente
+        self.cargar(procesos)
+
+    def cargar(self, procesos):
+        """Agrega muchos procesos de una vez (O(n log n) una sola vez, O(1) por llegada después)"""
+        nuevos = [(proceso.tiempo_llegada, next(self._orden), proceso) for proceso in procesos]
+        if not nuevos:
+            return
+        pendientes = self._ordenados[self._cursor:]
+        self._ordenados = pendientes + nuevos
+        self._ordenados.sort(key=lambda entrada: entrada[:2])
+        self._cursor = 0
+
+    def agregar(self, proceso):
+        heapq.heappush(self._heap, (proceso.tiempo_llegada, next(self._orden), proceso))
+
+    def conectar(self, procesos):
+        """
+        Toma los procesos de un iterable perezoso, que debe venir ordenado por llegada.
+        Solo se mantiene en memoria el siguiente proceso por llegar
+        """
+        if self._fuente is not None:
+            raise ValueError("Ya hay una fuente de procesos conectada.")
+        self._fuente = iter(procesos)
+        self._leer_fuente()
+
+    def _leer_fuente(self):
+        anterior = self._de_fuente[0] if self._de_fuente else None
+        proceso = next(self._fuente, None)
+        if proceso is None:
+            self._fuente = None
+            self._de_fuente = None
+            return
+        if anterior is not None and proceso.tiempo_llegada < anterior:
+            self._fuente = None
+            raise ValueError(f"La fuente no está ordenada por llegada: P{proceso.pid} llega en "
+                             f"{proceso.tiempo_llegada}, antes que el anterior ({anterior}).")
+        self._de_fuente = (proceso.tiempo_llegada, next(self._orden), proceso)
+
+    def proxima_llegada(self):
+        """Tiempo de llegada del siguiente proceso pendiente, o None"""
+        primero = self._primero()
+        return primero[0] if primero else None
+
+    def extraer_llegados(self, tiempo):
+        """Quita y retorna, en orden de llegada, los procesos con tiempo_llegada <= tiempo"""
+        llegados = []
+        primero = self._primero()
+        while primero and primero[0] <= tiempo:
+            if primero is self._de_fuente:
+                self._leer_fuente()
+            elif self._heap and self._heap[0] is primero:
+                heapq.heappop(self._heap)
+            else:
+                self._cursor += 1
+            llegados.append(primero[2])
+            primero = self._primero()
+        if self._cursor and self._cursor == len(self._ordenados):
+            self._ordenados = []
+            self._cursor = 0
+        return llegados
+
+    def _primero(self):
+        primero = self._ordenados[self._cursor] if self._cursor < len(self._ordenados) else None
+        for entrada in (self._heap[0] if self._heap else None, self._de_fuente):
+            if entrada is not None and (primero is None or entrada[:2] < primero[:2]):
+                primero = entrada
+        return primero
+
+    def __len__(self):
+        """Procesos pendientes ya leídos (de una fuente conectada solo cuenta el siguiente)"""
+        return len(self._ordenados) - self._cursor + len(self._heap) + (self._de_fuente is not None)
+
+    def __bool__(self):
+        return len(self) > 0
+
+    def __iter__(self):
+        """Procesos pendientes en orden de llegada"""
+        pendientes = self._ordenados[self._cursor:] + self._heap + ([self._de_fuente] if self._de_fuente else [])
+        pendientes.sort(key=lambda entrada: entrada[:2])
+        return iter([proceso for _, _, proceso in pendientes])
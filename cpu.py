@@ -3,6 +3,9 @@ class CPU:
         self.num_nucleos = num_nucleos
         self.nucleos = [None] * num_nucleos  # Cada elemento puede contener un Proceso
         self.tiempo_ocioso = [0] * num_nucleos # Para estadísticas
+        self.colas = None # Colas de listos por núcleo (solo en modo colas_por_nucleo)
+        self.penalizacion = [0] * num_nucleos # Tiempo pendiente de migración por núcleo
+        self.tiempo_migracion = [0] * num_nucleos # Para estadísticas
 
     def asignar_proceso(self, nucleo_id, proceso):
         self.nucleos[nucleo_id] = proceso
@@ -12,6 +15,7 @@ class CPU:
     def desalojar_proceso(self, nucleo_id):
         proceso = self.nucleos[nucleo_id]
         self.nucleos[nucleo_id] = None
+        self.penalizacion[nucleo_id] = 0 # La penalización era del proceso que se va
         return proceso
 
     def esta_libre(self, nucleo_id):
@@ -20,9 +24,44 @@ class CPU:
     def get_proceso_en_nucleo(self, nucleo_id):
         return self.nucleos[nucleo_id]
 
+    def penalizar(self, nucleo_id, tiempo):
+        """El núcleo pierde 'tiempo' (p. ej. calentando caché tras una migración) antes de avanzar"""
+        self.penalizacion[nucleo_id] += tiempo
+
+    def tiempo_hasta_desalojo(self, quantums_restantes):
+        """
+        Unidades que pueden avanzar todos los núcleos sin que ninguno termine su ráfaga
+        ni agote su quantum (quantums_restantes[i] es None si el núcleo i no tiene
+        quantum). Retorna None si no hay procesos en ejecución
+        """
+        minimo = None
+        for i, proceso in enumerate(self.nucleos):
+            if proceso:
+                restante = self.penalizacion[i] + proceso.tiempo_restante
+                if quantums_restantes[i] is not None:
+                    restante = min(restante, quantums_restantes[i])
+                if minimo is None or restante < minimo:
+                    minimo = restante
+        return minimo
+
+    def detener(self, tiempo):
+        """Todo el sistema queda parado 'tiempo' unidades (p. ej. compactando): ningún núcleo avanza"""
+        for i in range(self.num_nucleos):
+            self.tiempo_ocioso[i] += tiempo
+
     def avanzar_tiempo(self, tiempo_unidad):
+        """
+        Avanza 'tiempo_unidad' unidades en todos los núcleos de una vez: primero se consume
+        la penalización de migración y el resto va a la ráfaga; los núcleos libres suman ocio
+        """
         for i in range(self.num_nucleos):
-            if self.nucleos[i]:
+            if self.nucleos[i] and self.penalizacion[i]:
+                perdido = min(self.penalizacion[i], tiempo_unidad)
+                self.penalizacion[i] -= perdido
+                self.tiempo_migracion[i] += perdido
+                if tiempo_unidad > perdido:
+                    self.nucleos[i].actualizar_tiempo_restante(tiempo_unidad - perdido)
+            elif self.nucleos[i]:
                 self.nucleos[i].actualizar_tiempo_restante(tiempo_unidad)
             else:
                 self.tiempo_ocioso[i] += tiempo_unidad
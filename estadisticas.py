@@ -0,0 +1,218 @@
+import math
+
+
+class EstadisticaEnLinea:
+    """
+    Media y varianza incrementales (Welford), O(1) por valor.
+
+    La media se calcula como suma / n para que coincida exactamente con el
+    promedio directo; la suma de cuadrados de desvíos (m2) sigue la
+    recurrencia de Welford. combinar() une dos resúmenes (Chan et al.), por
+    ejemplo de simulaciones corridas en paralelo.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.suma = 0
+        self.m2 = 0.0
+        self.minimo = None
+        self.maximo = None
+
+    def agregar(self, valor):
+        media_anterior = self.media
+        self.n += 1
+        self.suma += valor
+        self.m2 += (valor - media_anterior) * (valor - self.media)
+        self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+        self.maximo = valor if self.maximo is None else max(self.maximo, valor)
+
+    @property
+    def media(self):
+        return self.suma / self.n if self.n else 0
+
+    @property
+    def varianza(self):
+        """Varianza muestral (n - 1); 0 con menos de dos valores"""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desviacion(self):
+        return math.sqrt(self.varianza)
+
+    def combinar(self, otra):
+        """Incorpora los valores resumidos en 'otra' (otra EstadisticaEnLinea)"""
+        if not otra.n:
+            return self
+        if self.n:
+            diferencia = otra.media - self.media
+            self.m2 += otra.m2 + diferencia * diferencia * self.n * otra.n / (self.n + otra.n)
+        else:
+            self.m2 = otra.m2
+        self.n += otra.n
+        self.suma += otra.suma
+        self.minimo = otra.minimo if self.minimo is None else min(self.minimo, otra.minimo)
+        self.maximo = otra.maximo if self.maximo is None else max(self.maximo, otra.maximo)
+        return self
+
+
+class BosquejoCuantiles:
+    """
+    Bosquejo de cuantiles con error relativo acotado (DDSketch).
+
+    Cada valor positivo cae en la cubeta ceil(log_gamma(valor)), con
+    gamma = (1 + alfa) / (1 - alfa); el cuantil estimado se aleja a lo sumo un
+    factor alfa del valor real. Agregar es O(1), la memoria crece con el
+    logaritmo del rango de valores y dos bosquejos se combinan sumando cuentas.
+    """
+
+    def __init__(self, precision_relativa=0.01):
+        if not 0 < precision_relativa < 1:
+            raise ValueError("La precisión relativa debe estar entre 0 y 1.")
+        self.precision_relativa = precision_relativa
+        self.gamma = (1 + precision_relativa) / (1 - precision_relativa)
+        self._log_gamma = math.log(self.gamma)
+        self._cubetas = {}  # índice -> cantidad de valores
+        self.ceros = 0
+        self.n = 0
+
+    def agregar(self, valor):
+        if valor < 0:
+            raise ValueError("El bosquejo solo admite valores no negativos.")
+        self.n += 1
+        if valor == 0:
+            self.ceros += 1
+            return
+        indice = math.ceil(math.log(valor) / self._log_gamma)
+        self._cubetas[indice] = self._cubetas.get(indice, 0) + 1
+
+    def cuantil(self, q):
+        """Valor aproximado del cuantil q (0 <= q <= 1), o None si está vacío"""
+        if not 0 <= q <= 1:
+            raise ValueError("El cuantil debe estar entre 0 y 1.")
+        if not self.n:
+            return None
+        rango = q * (self.n - 1)
+        acumulado = self.ceros
+        if rango < acumulado:
+            return 0.0
+        for indice in sorted(self._cubetas):
+            acumulado += self._cubetas[indice]
+            if acumulado > rango:
+                # Punto de la cubeta (gamma^(i-1), gamma^i] con error relativo alfa
+                return 2 * self.gamma ** indice / (self.gamma + 1)
+        return 2 * self.gamma ** max(self._cubetas) / (self.gamma + 1)
+
+    def combinar(self, otro):
+        if otro.precision_relativa != self.precision_relativa:
+            raise ValueError("Solo se combinan bosquejos con la misma precisión relativa.")
+        for indice, cantidad in otro._cubetas.items():
+            self._cubetas[indice] = self._cubetas.get(indice, 0) + cantidad
+        self.ceros += otro.ceros
+        self.n += otro.n
+        return self
+
+
+class ResumenTiempos:
+    """Media, desviación y percentiles en línea de una métrica de tiempo"""
+
+    PERCENTILES = (50, 95, 99)
+
+    def __init__(self, precision_relativa=0.01):
+        self.momentos = EstadisticaEnLinea()
+        self.cuantiles = BosquejoCuantiles(precision_relativa)
+
+    def agregar(self, valor):
+        self.momentos.agregar(valor)
+        self.cuantiles.agregar(valor)
+
+    @property
+    def n(self):
+        return self.momentos.n
+
+    @property
+    def media(self):
+        return self.momentos.media
+
+    def combinar(self, otro):
+        self.momentos.combinar(otro.momentos)
+        self.cuantiles.combinar(otro.cuantiles)
+        return self
+
+    def como_dict(self):
+        resumen = {"media": self.media, "desviacion": self.momentos.desviacion}
+        for percentil in self.PERCENTILES:
+            resumen[f"p{percentil}"] = self.cuantiles.cuantil(percentil / 100)
+        return resumen
+
+
+class SumasJain:
+    """
+    Sumas del índice de equidad de Jain, (suma x)^2 / (n * suma x^2), acumuladas
+    en línea y combinables
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.suma = 0.0
+        self.suma_cuadrados = 0.0
+
+    def agregar(self, valor):
+        self.n += 1
+        self.suma += valor
+        self.suma_cuadrados += valor * valor
+
+    def combinar(self, otras):
+        self.n += otras.n
+        self.suma += otras.suma
+        self.suma_cuadrados += otras.suma_cuadrados
+        return self
+
+    @property
+    def indice(self):
+        """1 si todos los valores son iguales, 1/n en el peor caso"""
+        if not self.suma_cuadrados:
+            return 1.0
+        return self.suma ** 2 / (self.n * self.suma_cuadrados)
+
+
+class MetricasSimulacion:
+    """
+    Métricas de los procesos terminados, actualizadas al finalizar cada uno
+    (retorno, respuesta, espera y sumas de equidad), y combinables entre simulaciones
+    """
+
+    def __init__(self, precision_relativa=0.01):
+        self.retorno = ResumenTiempos(precision_relativa)
+        self.respuesta = ResumenTiempos(precision_relativa)
+        self.espera = ResumenTiempos(precision_relativa)
+        self.equidad = SumasJain()  # Participación de CPU ponderada, fija desde que el proceso termina
+
+    @property
+    def terminados(self):
+        return self.retorno.n
+
+    def al_terminar(self, proceso, participacion=None):
+        """
+        Registra un proceso con tiempo_inicio_ejecucion y tiempo_finalizacion ya
+        asignados; 'participacion' es su participación de CPU para el índice de Jain
+        """
+        retorno = proceso.tiempo_finalizacion - proceso.tiempo_llegada
+        self.retorno.agregar(retorno)
+        self.respuesta.agregar(proceso.tiempo_inicio_ejecucion - proceso.tiempo_llegada)
+        self.espera.agregar(retorno - proceso.duracion)
+        if participacion is not None:
+            self.equidad.agregar(participacion)
+
+    def combinar(self, otras):
+        self.retorno.combinar(otras.retorno)
+        self.respuesta.combinar(otras.respuesta)
+        self.espera.combinar(otras.espera)
+        self.equidad.combinar(otras.equidad)
+        return self
+
+
+def utilizacion_nucleos(cpu, tiempo):
+    """Fracción del tiempo que cada núcleo estuvo ocupado, a partir de CPU.tiempo_ocioso (incluye las paradas)"""
+    if tiempo <= 0:
+        return [0.0] * cpu.num_nucleos
+    return [1 - ocioso / tiempo for ocioso in cpu.tiempo_ocioso]
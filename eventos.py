@@ -0,0 +1,182 @@
+import collections
+import json
+
+
+class TipoEvento:
+    """Tipos de eventos emitidos por la memoria y el simulador"""
+
+    MEMORIA_INICIADA = "MEMORIA_INICIADA"
+    ALLOC = "ALLOC"
+    ALLOC_FALLIDA = "ALLOC_FALLIDA"
+    FREE = "FREE"
+    MERGE = "MERGE"
+    COMPACT = "COMPACT"
+    ESTADO_MEMORIA = "ESTADO_MEMORIA"
+    NUEVO = "NUEVO"
+    ALGORITMO = "ALGORITMO"
+    ARRIVAL = "ARRIVAL"
+    TICK = "TICK"
+    DISPATCH = "DISPATCH"
+    PREEMPT = "PREEMPT"
+    EXPROPIACION = "EXPROPIACION"
+    FINISH = "FINISH"
+    SWAP_OUT = "SWAP_OUT"
+    SWAP_IN = "SWAP_IN"
+    FIN_SIMULACION = "FIN_SIMULACION"
+
+
+class Evento:
+    __slots__ = ("tipo", "tiempo", "datos")
+
+    def __init__(self, tipo, tiempo, datos):
+        self.tipo = tipo
+        self.tiempo = tiempo
+        self.datos = datos
+
+    def __repr__(self):
+        return f"Evento({self.tipo}, t={self.tiempo}, {self.datos})"
+
+    def como_dict(self):
+        return {"tipo": self.tipo, "tiempo": self.tiempo, **self.datos}
+
+
+class BusEventos:
+    """
+    Bus de eventos estructurados con sumideros intercambiables.
+
+    Los emisores deben consultar 'activo' antes de llamar a emitir(), de modo
+    que sin sumideros (o solo con SumideroNulo) no se construye ningún evento
+    ni se formatea ningún texto:
+
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.ALLOC, pid=pid, inicio=inicio, tamano=tamano)
+    """
+
+    def __init__(self, sumideros=None):
+        self._sumideros = []
+        self.activo = False
+        self.tiempo = 0  # Reloj de simulación; lo actualiza el Simulador en cada paso
+        for sumidero in sumideros or ():
+            self.agregar_sumidero(sumidero)
+
+    @classmethod
+    def consola(cls):
+        """Bus que imprime los eventos en la terminal (comportamiento interactivo por defecto)"""
+        return cls([SumideroConsola()])
+
+    @classmethod
+    def silencioso(cls):
+        """Bus sin sumideros: emitir nunca se llega a invocar"""
+        return cls()
+
+    @property
+    def sumideros(self):
+        return tuple(self._sumideros)
+
+    def agregar_sumidero(self, sumidero):
+        self._sumideros.append(sumidero)
+        self._actualizar_activo()
+
+    def quitar_sumidero(self, sumidero):
+        self._sumideros.remove(sumidero)
+        self._actualizar_activo()
+
+    def emitir(self, tipo, **datos):
+        evento = Evento(tipo, self.tiempo, datos)
+        for sumidero in self._sumideros:
+            sumidero.recibir(evento)
+
+    def cerrar(self):
+        for sumidero in self._sumideros:
+            sumidero.cerrar()
+
+    def _actualizar_activo(self):
+        self.activo = any(not isinstance(s, SumideroNulo) for s in self._sumideros)
+
+
+class Sumidero:
+    """Interfaz de los sumideros de eventos"""
+
+    def recibir(self, evento):
+        raise NotImplementedError
+
+    def cerrar(self):
+        pass
+
+
+class SumideroNulo(Sumidero):
+    """Descarta todos los eventos; no activa el bus"""
+
+    def recibir(self, evento):
+        pass
+
+
+class SumideroAnillo(Sumidero):
+    """Conserva en memoria los últimos 'capacidad' eventos"""
+
+    def __init__(self, capacidad=10000):
+        self.eventos = collections.deque(maxlen=capacidad)
+
+    def recibir(self, evento):
+        self.eventos.append(evento)
+
+    def de_tipo(self, tipo):
+        return [evento for evento in self.eventos if evento.tipo == tipo]
+
+
+class SumideroJSONL(Sumidero):
+    """Escribe un objeto JSON por línea en un archivo"""
+
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "w", encoding="utf-8")
+
+    def recibir(self, evento):
+        self._archivo.write(json.dumps(evento.como_dict(), ensure_ascii=False))
+        self._archivo.write("\n")
+
+    def cerrar(self):
+        if not self._archivo.closed:
+            self._archivo.close()
+
+
+class SumideroConsola(Sumidero):
+    """Imprime cada evento con el formato legible del simulador"""
+
+    FORMATOS = {
+        TipoEvento.MEMORIA_INICIADA: "🖥️  Memoria inicializada: {descripcion} ({total:,} bytes), {detalle}",
+        TipoEvento.ALLOC: "🎉 Proceso {pid}: {tamano:,} bytes asignados en posición {inicio} (bloque libre de {bloque_libre:,} bytes)",
+        TipoEvento.ALLOC_FALLIDA: "❌ No hay memoria suficiente para el proceso {pid} ({tamano:,} bytes)",
+        TipoEvento.FREE: "📦 Proceso {pid}: liberado bloque de {tamano:,} bytes en posición {inicio}",
+        TipoEvento.MERGE: "🔗 {fusiones} fusiones realizadas, {bloques_libres} bloques libres resultantes",
+        TipoEvento.COMPACT: "🧱 Compactación de [{desde:,}, {hasta:,}): {bytes_movidos:,} bytes movidos (costo {costo})",
+        TipoEvento.NUEVO: "✅ Proceso {pid} agregado al sistema (Memoria: {memoria_mb}MB)",
+        TipoEvento.ALGORITMO: "🔧 Algoritmo de planificación establecido: {algoritmo}",
+        TipoEvento.ARRIVAL: "📋 Proceso {pid} movido a cola de listos (llegó en tiempo {llegada})",
+        TipoEvento.TICK: "⏰ Paso de simulación {tiempo}",
+        TipoEvento.DISPATCH: "🖥️  Proceso {pid} asignado al núcleo {nucleo} (Algoritmo: {algoritmo})",
+        TipoEvento.PREEMPT: "⏰ Proceso {pid} desalojado del núcleo {nucleo} por quantum (quantum={quantum})",
+        TipoEvento.EXPROPIACION: "⚡ Proceso {pid} expropiado del núcleo {nucleo} por el proceso {por}",
+        TipoEvento.FINISH: "🏁 Proceso {pid} terminado y liberado del núcleo {nucleo}",
+        TipoEvento.SWAP_OUT: "💽 Proceso {pid} enviado a swap ({tamano:,} bytes, latencia {latencia})",
+        TipoEvento.SWAP_IN: "💽 Proceso {pid} traído desde swap ({tamano:,} bytes, latencia {latencia})",
+        TipoEvento.FIN_SIMULACION: "🏁 Simulación terminada ({motivo})",
+    }
+
+    def recibir(self, evento):
+        if evento.tipo == TipoEvento.ESTADO_MEMORIA:
+            self._imprimir_estado_memoria(evento.datos)
+            return
+        formato = self.FORMATOS.get(evento.tipo)
+        if formato is None:
+            print(f"[{evento.tipo}] t={evento.tiempo} {evento.datos}")
+        else:
+            print(formato.format(tiempo=evento.tiempo, **evento.datos))
+
+    def _imprimir_estado_memoria(self, uso):
+        print(f"📊 Estado de Memoria:")
+        print(f"   💾 Total: {uso['total']:,} bytes")
+        print(f"   🔴 Ocupada: {uso['ocupada']:,} bytes ({uso['porcentaje_uso']:.1f}%)")
+        print(f"   🟢 Libre: {uso['libre']:,} bytes (mayor bloque: {uso['mayor_bloque_libre']:,} bytes)")
+        print(f"   📦 Bloques ocupados: {uso['num_bloques_ocupados']}")
+        print(f"   📦 Bloques libres: {uso['num_bloques_libres']}")
+        print("   " + "="*40)
@@ -0,0 +1,187 @@
+from bloque_memoria import BloqueMemoria
+from treap import Treap
+
+
+class IndiceLibresArbol:
+    """
+    Índice de bloques libres ordenado por dirección de inicio.
+
+    Usa un treap aumentado con el tamaño máximo de cada subárbol, de modo que
+    la búsqueda First-Fit y la fusión con los vecinos al liberar son O(log n).
+    Con por_tamano=True mantiene además un treap ordenado por (tamano, inicio)
+    para resolver Best-Fit en O(log n).
+    """
+
+    def __init__(self, tamano_total, por_tamano=False):
+        self._por_inicio = Treap(aumentado=True)
+        self._por_tamano = Treap() if por_tamano else None
+        if tamano_total > 0:
+            self._agregar(0, tamano_total)
+
+    def __len__(self):
+        return len(self._por_inicio)
+
+    def __iter__(self):
+        """Recorre los pares (inicio, tamano) en orden de dirección"""
+        return iter(self._por_inicio)
+
+    def mayor(self):
+        """Tamaño del mayor bloque libre"""
+        return self._por_inicio.valor_maximo or 0
+
+    def tamano_de(self, inicio):
+        return self._por_inicio.obtener(inicio)
+
+    def primer_ajuste(self, tamano, desde=0):
+        """Inicio del primer bloque libre (en dirección >= desde) donde cabe 'tamano'"""
+        encontrado = self._por_inicio.primero_con_valor(tamano, desde)
+        return encontrado[0] if encontrado is not None else None
+
+    def mejor_ajuste(self, tamano):
+        """Inicio del bloque libre más pequeño donde cabe 'tamano' (a igual tamaño, el de menor dirección)"""
+        if self._por_tamano is not None:
+            encontrado = self._por_tamano.techo((tamano, -1))
+            return encontrado[0][1] if encontrado is not None else None
+        mejor = None
+        for inicio, tamano_bloque in self._por_inicio:
+            if tamano_bloque >= tamano and (mejor is None or tamano_bloque < mejor[1]):
+                mejor = (inicio, tamano_bloque)
+        return mejor[0] if mejor is not None else None
+
+    def peor_ajuste(self, tamano):
+        """Inicio del bloque libre más grande si 'tamano' cabe en él (a igual tamaño, el de menor dirección)"""
+        mayor = self.mayor()
+        if mayor < tamano:
+            return None
+        return self.primer_ajuste(mayor)
+
+    def ocupar(self, inicio, cantidad):
+        """Toma 'cantidad' bytes del comienzo del bloque libre que empieza en 'inicio'"""
+        tamano = self._quitar(inicio)
+        if tamano > cantidad:
+            self._agregar(inicio + cantidad, tamano - cantidad)
+
+    def liberar(self, inicio, tamano, id_bloque=0):
+        """Devuelve un extent al índice fusionándolo con sus vecinos. Retorna las fusiones realizadas"""
+        fusiones = 0
+        anterior = self._por_inicio.predecesor(inicio)
+        if anterior is not None and anterior[0] + anterior[1] == inicio:
+            self._quitar(anterior[0])
+            inicio, tamano = anterior[0], anterior[1] + tamano
+            fusiones += 1
+        siguiente = self._por_inicio.sucesor(inicio)
+        if siguiente is not None and inicio + tamano == siguiente[0]:
+            self._quitar(siguiente[0])
+            tamano += siguiente[1]
+            fusiones += 1
+        self._agregar(inicio, tamano)
+        return fusiones
+
+    def fusionar(self):
+        """Los vecinos se fusionan al liberar, no queda nada pendiente"""
+        return 0
+
+    def como_bloques(self):
+        return [BloqueMemoria(0, inicio, tamano) for inicio, tamano in self._por_inicio]
+
+    def _agregar(self, inicio, tamano):
+        self._por_inicio.insertar(inicio, tamano)
+        if self._por_tamano is not None:
+            self._por_tamano.insertar((tamano, inicio))
+
+    def _quitar(self, inicio):
+        tamano = self._por_inicio.eliminar(inicio)
+        if self._por_tamano is not None:
+            self._por_tamano.eliminar((tamano, inicio))
+        return tamano
+
+
+class IndiceLibresLista:
+    """
+    Implementación de referencia basada en lista (comportamiento original).
+
+    Búsqueda lineal, y la fusión ordena y recorre toda la lista. Se conserva
+    para pruebas de equivalencia contra IndiceLibresArbol.
+    """
+
+    def __init__(self, tamano_total, por_tamano=False):
+        self.bloques = [BloqueMemoria(0, 0, tamano_total, ocupado=False)] if tamano_total > 0 else []
+
+    def __len__(self):
+        return len(self.bloques)
+
+    def __iter__(self):
+        return ((bloque.inicio, bloque.tamano) for bloque in self.bloques)
+
+    def mayor(self):
+        """Recorre la lista completa (la referencia no mantiene el máximo)"""
+        return max((bloque.tamano for bloque in self.bloques), default=0)
+
+    def tamano_de(self, inicio):
+        for bloque in self.bloques:
+            if bloque.inicio == inicio:
+                return bloque.tamano
+        return None
+
+    def primer_ajuste(self, tamano, desde=0):
+        for bloque in self.bloques:
+            if bloque.inicio >= desde and bloque.tamano >= tamano:
+                return bloque.inicio
+        return None
+
+    def mejor_ajuste(self, tamano):
+        mejor = None
+        for bloque in self.bloques:
+            if bloque.tamano >= tamano and (mejor is None or bloque.tamano < mejor.tamano):
+                mejor = bloque
+        return mejor.inicio if mejor is not None else None
+
+    def peor_ajuste(self, tamano):
+        peor = None
+        for bloque in self.bloques:
+            if peor is None or bloque.tamano > peor.tamano:
+                peor = bloque
+        return peor.inicio if peor is not None and peor.tamano >= tamano else None
+
+    def ocupar(self, inicio, cantidad):
+        for i, bloque in enumerate(self.bloques):
+            if bloque.inicio == inicio:
+                if bloque.tamano == cantidad:
+                    self.bloques.pop(i)
+                else:
+                    bloque.inicio += cantidad
+                    bloque.tamano -= cantidad
+                return
+        raise KeyError(inicio)
+
+    def liberar(self, inicio, tamano, id_bloque=0):
+        """Agrega el bloque al final; la fusión ocurre en fusionar()"""
+        self.bloques.append(BloqueMemoria(id_bloque, inicio, tamano, ocupado=False))
+        return 0
+
+    def fusionar(self):
+        """Ordena por inicio y fusiona bloques adyacentes. Retorna las fusiones realizadas"""
+        if len(self.bloques) <= 1:
+            return 0
+
+        self.bloques.sort(key=lambda x: x.inicio)
+
+        bloques_fusionados = []
+        bloque_actual = self.bloques[0]
+        fusiones_realizadas = 0
+
+        for i in range(1, len(self.bloques)):
+            siguiente_bloque = self.bloques[i]
+            if bloque_actual.inicio + bloque_actual.tamano == siguiente_bloque.inicio:
+                bloque_actual.tamano += siguiente_bloque.tamano
+                fusiones_realizadas += 1
+            else:
+                bloques_fusionados.append(bloque_actual)
+                bloque_actual = siguiente_bloque
+
+        bloques_fusionados.append(bloque_actual)
+        self.bloques = bloques_fusionados
+        return fusiones_realizadas
+
+    def como_bloques(self):
+        return self.bloques
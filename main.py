@@ -6,6 +6,9 @@ Este archivo principal demuestra el uso del simulador de SO
 
 from proceso import Proceso
 from simulador import Simulador
+from planificador import ALGORITMOS
+from barrido import ejecutar_barrido, escribir_tabla, generar_configuraciones, resumir
+from trazas import leer_traza
 import random
 
 def crear_procesos_ejemplo():
@@ -107,34 +110,42 @@ def simulacion_interactiva():
     # Configuración del simulador
     try:
         num_nucleos = int(input("Número de núcleos de CPU (default: 2): ") or "2")
-        algoritmo = input("Algoritmo de planificación (SJF/Round Robin) [default: SJF]: ") or "SJF"
+        nombres = "/".join(ALGORITMOS)
+        algoritmo = input(f"Algoritmo de planificación ({nombres}) [default: SJF]: ") or "SJF"
         
         simulador = Simulador(num_nucleos=num_nucleos)
         simulador.set_algoritmo_planificacion(algoritmo)
+        usa_quantum = simulador.politica_planificacion.usa_quantum
         
-        if algoritmo == "Round Robin":
-            quantum = int(input("Quantum para Round Robin (default: 3): ") or "3")
+        if usa_quantum:
+            quantum = int(input(f"Quantum para {algoritmo} (default: 3): ") or "3")
             simulador.set_quantum(quantum)
         
-        # Tipo de procesos
-        tipo_procesos = input("¿Usar procesos aleatorios? (s/n) [default: n]: ") or "n"
-        
-        if tipo_procesos.lower() == 's':
-            num_procesos = int(input("Número de procesos aleatorios (default: 5): ") or "5")
-            procesos = crear_procesos_aleatorios(num_procesos)
+        # Tipo de procesos: una traza se lee a medida que avanza la simulación
+        ruta_traza = input("Ruta de una traza CSV/JSONL, opcionalmente .gz (Enter para omitir): ").strip()
+        if ruta_traza:
+            # La traza se reproduce completa, sin el límite de tiempo de la demostración
+            simulador.tiempo_limite = None
+            simulador.agregar_traza(leer_traza(ruta_traza))
         else:
-            procesos = crear_procesos_ejemplo()
-        
-        # Agregar procesos al simulador
-        for proceso in procesos:
-            simulador.agregar_proceso(proceso)
+            tipo_procesos = input("¿Usar procesos aleatorios? (s/n) [default: n]: ") or "n"
+            
+            if tipo_procesos.lower() == 's':
+                num_procesos = int(input("Número de procesos aleatorios (default: 5): ") or "5")
+                procesos = crear_procesos_aleatorios(num_procesos)
+            else:
+                procesos = crear_procesos_ejemplo()
+            
+            # Agregar procesos al simulador
+            for proceso in procesos:
+                simulador.agregar_proceso(proceso)
         
         print(f"\nConfiguración:")
         print(f"- Núcleos: {num_nucleos}")
         print(f"- Algoritmo: {algoritmo}")
-        if algoritmo == "Round Robin":
+        if usa_quantum:
             print(f"- Quantum: {quantum}")
-        print(f"- Procesos: {len(procesos)}")
+        print(f"- Procesos: {'traza ' + ruta_traza if ruta_traza else len(procesos)}")
         
         input("\nPresiona Enter para iniciar la simulación...")
         
@@ -147,6 +158,9 @@ def simulacion_interactiva():
                 simulador.mostrar_estado()
                 input("Presiona Enter para continuar...")
             paso += 1
+        if ruta_traza:
+            # Lo que quede de la traza se simula por eventos, sin pausas
+            simulador.ejecutar()
         
         # Estadísticas finales
         print("\n=== ESTADÍSTICAS FINALES ===")
@@ -159,6 +173,29 @@ def simulacion_interactiva():
     except KeyboardInterrupt:
         print("\nSimulación interrumpida por el usuario.")
 
+def comparar_algoritmos(ruta="barrido.csv"):
+    """Barrido en paralelo de algoritmos × quantum × núcleos × memoria × cargas"""
+    print("\n=== COMPARACIÓN DE ALGORITMOS ===\n")
+    configuraciones = generar_configuraciones(
+        algoritmos=("FCFS", "SJF", "SRTF", "RR", "MLFQ", "Prioridad", "CFS"),
+        quantums=(2, 4), nucleos=(1, 2, 4), memorias_gb=(1, 2), semillas=range(5))
+    print(f"Simulando {len(configuraciones)} configuraciones...")
+    
+    filas = []
+    for fila in ejecutar_barrido(configuraciones):
+        filas.append(fila)
+        if len(filas) % 50 == 0 or len(filas) == len(configuraciones):
+            print(f"  {len(filas)}/{len(configuraciones)} terminadas")
+    
+    escribir_tabla(filas, ruta)
+    print(f"\nTabla completa guardada en {ruta}")
+    retorno = resumir(filas, metrica="tiempo_promedio_retorno")
+    respuesta = resumir(filas, metrica="tiempo_promedio_respuesta")
+    print(f"\n{'Algoritmo':<12}{'Retorno':>10}{'Respuesta':>12}")
+    for (algoritmo,), valor in retorno.items():
+        print(f"{algoritmo:<12}{valor:>10.2f}{respuesta[(algoritmo,)]:>12.2f}")
+    return filas
+
 def main():
     """Función principal del programa"""
     print("Simulador de Sistema Operativo")
@@ -179,15 +216,7 @@ def main():
         elif opcion == "2":
             ejecutar_simulacion_round_robin()
         elif opcion == "3":
-            print("Comparando algoritmos...")
-            stats_sjf = ejecutar_simulacion_sjf()
-            stats_rr = ejecutar_simulacion_round_robin()
-            
-            print("\n=== COMPARACIÓN DE ALGORITMOS ===")
-            print(f"SJF - Tiempo promedio de retorno: {stats_sjf.get('tiempo_promedio_retorno', 0):.2f}")
-            print(f"Round Robin - Tiempo promedio de retorno: {stats_rr.get('tiempo_promedio_retorno', 0):.2f}")
-            print(f"SJF - Tiempo promedio de respuesta: {stats_sjf.get('tiempo_promedio_respuesta', 0):.2f}")
-            print(f"Round Robin - Tiempo promedio de respuesta: {stats_rr.get('tiempo_promedio_respuesta', 0):.2f}")
+            comparar_algoritmos()
             
         elif opcion == "4":
             simulacion_interactiva()
@@ -1,154 +1,349 @@
-from bloque_memoria import BloqueMemoria
+from indice_libres import IndiceLibresArbol, IndiceLibresLista
+from tabla_bloques import TablaBloques
+from politicas_ubicacion import PoliticaUbicacion, crear_politica_ubicacion
+from eventos import BusEventos, TipoEvento
+
+MB = 1024 * 1024
 
 class Memoria:
-    def __init__(self, tamano_total_gb=2):
-        self.tamano_total = tamano_total_gb * 1024 * 1024 * 1024  # Convertir GB a Bytes
-        self.bloques_libres = [BloqueMemoria(0, 0, self.tamano_total, ocupado=False)]
-        self.bloques_ocupados = []
+    POLITICAS_COMPACTACION = (None, "al_fallar", "umbral", "parcial")
+
+    def __init__(self, tamano_total_gb=2, indice_libres="arbol", politica="first-fit", eventos=None,
+                 compactacion=None, umbral_fragmentacion=0.5, costo_compactacion_por_mb=0.01):
+        # Bus de eventos: por defecto imprime en consola; BusEventos() sin sumideros no cuesta nada
+        self.eventos = eventos if eventos is not None else BusEventos.consola()
+        self.tamano_total = int(tamano_total_gb * 1024 * 1024 * 1024)  # Convertir GB a Bytes
+        # Política de ubicación: "first-fit", "best-fit", "worst-fit", "next-fit" o una instancia propia
+        if isinstance(politica, PoliticaUbicacion):
+            self.politica = politica
+        else:
+            self.politica = crear_politica_ubicacion(politica)
+        # "arbol": índice ordenado por dirección O(log n); "lista": implementación original de referencia
+        if indice_libres not in ("arbol", "lista"):
+            raise ValueError("Tipo de índice de bloques libres no reconocido.")
+        self.indice_libres = indice_libres
+        self._libres = self._crear_indice()
+        # Compactación: None (desactivada), "al_fallar" (completa cuando una asignación falla
+        # pese a haber memoria libre suficiente), "umbral" (completa al liberar si la
+        # fragmentación externa supera el umbral) o "parcial" (mínima ventana que da cabida)
+        if compactacion not in self.POLITICAS_COMPACTACION:
+            raise ValueError(f"Política de compactación no reconocida: {compactacion}")
+        self.compactacion = compactacion
+        self.umbral_fragmentacion = umbral_fragmentacion
+        self.costo_compactacion_por_mb = costo_compactacion_por_mb
+        self.compactaciones = 0
+        self.bytes_movidos = 0
+        self._tiempo_pendiente = 0 # Costo de compactación aún no cobrado al reloj del simulador
+        # Bloques ocupados: filas de una tabla en columnas, indexadas por PID y por dirección de inicio
+        self._tabla = TablaBloques()
+        self._filas_por_pid = {}
+        self._filas_por_inicio = {}
+        self.swap = None # GestorSwap asociado (opcional)
         self.next_block_id = 1 # Para asignar IDs únicos a los bloques
-        print(f"🖥️  Memoria inicializada: {tamano_total_gb} GB ({self.tamano_total:,} bytes)")
+        self._memoria_ocupada = 0 # Contador incremental de bytes ocupados
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.MEMORIA_INICIADA, descripcion=f"{tamano_total_gb} GB",
+                                total=self.tamano_total, detalle=f"política {self.politica.nombre}")
+
+    @property
+    def bloques_ocupados(self):
+        """Vistas de los bloques ocupados"""
+        return [self._tabla.vista(fila) for fila in self._filas_por_inicio.values()]
+
+    def bloques_de_proceso(self, pid):
+        """Bloques asignados al proceso con el PID indicado"""
+        return [self._tabla.vista(fila) for fila in self._filas_por_pid.get(pid, ())]
+
+    def bloque_en(self, inicio):
+        """Bloque ocupado que empieza en 'inicio', o None"""
+        fila = self._filas_por_inicio.get(inicio)
+        return None if fila is None else self._tabla.vista(fila)
+
+    @property
+    def memoria_ocupada(self):
+        return self._memoria_ocupada
+
+    @property
+    def memoria_libre(self):
+        return self.tamano_total - self._memoria_ocupada
+
+    @property
+    def mayor_bloque_libre(self):
+        """Tamaño del mayor extent libre (O(1) con el índice en árbol)"""
+        return self._libres.mayor()
+
+    @property
+    def mayor_asignable(self):
+        """Mayor solicitud que asignar_memoria puede satisfacer ahora (compactando si está habilitado)"""
+        if self.compactacion is not None:
+            return self.tamano_total - self._memoria_ocupada
+        return self._libres.mayor()
+
+    @property
+    def fragmentacion_externa(self):
+        """1 - mayor bloque libre / memoria libre: 0 sin fragmentación, tiende a 1 muy fragmentada"""
+        libre = self.tamano_total - self._memoria_ocupada
+        if libre == 0:
+            return 0.0
+        return 1 - self._libres.mayor() / libre
+
+    @property
+    def bloques_libres(self):
+        """Bloques libres ordenados por dirección de inicio"""
+        return self._libres.como_bloques()
 
     def asignar_memoria(self, proceso):
-        """Asigna memoria a un proceso usando algoritmo First-Fit"""
+        """Asigna memoria a un proceso usando la política de ubicación configurada"""
         tamano_requerido = proceso.tamano_memoria
-        print(f"📋 Intentando asignar {tamano_requerido:,} bytes al proceso {proceso.pid}")
         
-        # Buscar un bloque libre que sea suficientemente grande
-        for i, bloque in enumerate(self.bloques_libres):
-            if bloque.tamano >= tamano_requerido:
-                print(f"✅ Bloque encontrado: {bloque.tamano:,} bytes en posición {bloque.inicio}")
-                
-                # Crear nuevo bloque ocupado
-                nuevo_bloque_ocupado = BloqueMemoria(
-                    self.next_block_id,
-                    bloque.inicio,
-                    tamano_requerido,
-                    ocupado=True,
-                    pid_proceso=proceso.pid
-                )
-                
-                self.bloques_ocupados.append(nuevo_bloque_ocupado)
-                proceso.bloques_memoria_asignados.append(nuevo_bloque_ocupado)
-                self.next_block_id += 1
-                
-                # Si el bloque libre era exactamente del tamaño requerido, lo eliminamos
-                if bloque.tamano == tamano_requerido:
-                    print(f"🔄 Bloque usado completamente, eliminando de libres")
-                    self.bloques_libres.pop(i)
-                else:
-                    # Reducir el tamaño del bloque libre
-                    print(f"🔄 Fragmentando bloque: quedan {bloque.tamano - tamano_requerido:,} bytes libres")
-                    bloque.inicio += tamano_requerido
-                    bloque.tamano -= tamano_requerido
-                
-                print(f"🎉 Memoria asignada exitosamente al proceso {proceso.pid}")
-                self._mostrar_estado_memoria()
-                return True
+        # Pedir a la política un bloque libre suficientemente grande
+        inicio = self.politica.seleccionar(self._libres, tamano_requerido)
+        if (inicio is None and self.compactacion is not None
+                and self.tamano_total - self._memoria_ocupada >= tamano_requerido):
+            # Hay bytes libres suficientes pero fragmentados: compactar y reintentar
+            if self.compactacion == "parcial":
+                self.compactar_para(tamano_requerido)
+            else:
+                self.compactar()
+            inicio = self.politica.seleccionar(self._libres, tamano_requerido)
+        if inicio is None:
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.ALLOC_FALLIDA, pid=proceso.pid, tamano=tamano_requerido)
+            return False
+
+        tamano_bloque = self._libres.tamano_de(inicio)
+        
+        # Crear nuevo bloque ocupado como fila de la tabla
+        fila = self._tabla.agregar(
+            self.next_block_id,
+            inicio,
+            tamano_requerido,
+            ocupado=True,
+            pid_proceso=proceso.pid
+        )
         
-        print(f"❌ No hay memoria suficiente para el proceso {proceso.pid}")
-        return False
+        self._filas_por_inicio[inicio] = fila
+        self._filas_por_pid.setdefault(proceso.pid, []).append(fila)
+        proceso.bloques_memoria_asignados.append(self._tabla.vista(fila))
+        self.next_block_id += 1
+        self._memoria_ocupada += tamano_requerido
+        
+        # Reducir (o eliminar si se usa completo) el bloque libre elegido
+        self._libres.ocupar(inicio, tamano_requerido)
+        self.politica.notificar_asignacion(inicio, tamano_requerido)
+        
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.ALLOC, pid=proceso.pid, inicio=inicio,
+                                tamano=tamano_requerido, bloque_libre=tamano_bloque)
+            self._mostrar_estado_memoria()
+        return True
     
 
     def liberar_memoria(self, proceso):
         """Libera la memoria ocupada por un proceso"""
-        print(f"🔓 Liberando memoria del proceso {proceso.pid}")
-        bloques_a_liberar = []
-        
-        # Encontrar todos los bloques del proceso
-        for bloque in self.bloques_ocupados:
-            if bloque.pid_proceso == proceso.pid:
-                bloques_a_liberar.append(bloque)
-                print(f"📦 Liberando bloque: {bloque.tamano:,} bytes en posición {bloque.inicio}")
-        
-        # Liberar cada bloque
-        for bloque in bloques_a_liberar:
-            # Crear nuevo bloque libre
-            nuevo_bloque_libre = BloqueMemoria(
-                bloque.id,
-                bloque.inicio,
-                bloque.tamano,
-                ocupado=False,
-                pid_proceso=None
-            )
-            
-            self.bloques_libres.append(nuevo_bloque_libre)
-            self.bloques_ocupados.remove(bloque)
+        # Tomar los bloques del proceso desde el índice por PID
+        filas_a_liberar = self._filas_por_pid.pop(proceso.pid, [])
         
-        # Limpiar la lista de bloques asignados del proceso
+        # tabla.quitar desvincula las vistas: quien las conserve no lee filas recicladas
         proceso.bloques_memoria_asignados.clear()
         
-        # Fusionar bloques libres adyacentes
-        print(f"🔄 Fusionando bloques libres adyacentes...")
-        self.fusionar_bloques_libres()
-        print(f"✅ Memoria del proceso {proceso.pid} liberada exitosamente")
-        self._mostrar_estado_memoria()
+        # Devolver cada bloque al índice de libres (el índice en árbol fusiona vecinos aquí)
+        tabla = self._tabla
+        fusiones = 0
+        for fila in filas_a_liberar:
+            inicio, tamano = tabla.inicio[fila], tabla.tamano[fila]
+            fusiones += self._libres.liberar(inicio, tamano, tabla.id[fila])
+            del self._filas_por_inicio[inicio]
+            tabla.quitar(fila)
+            self._memoria_ocupada -= tamano
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.FREE, pid=proceso.pid, inicio=inicio, tamano=tamano)
+        
+        # Fusionar bloques libres adyacentes pendientes (solo en modo lista)
+        fusiones += self.fusionar_bloques_libres()
+        if (self.compactacion == "umbral" and filas_a_liberar
+                and self.fragmentacion_externa > self.umbral_fragmentacion):
+            self.compactar()
+        if self.eventos.activo:
+            if fusiones:
+                self.eventos.emitir(TipoEvento.MERGE, fusiones=fusiones, bloques_libres=len(self._libres))
+            self._mostrar_estado_memoria()
         
 
     def fusionar_bloques_libres(self):
-        """Fusiona bloques libres adyacentes para evitar fragmentación"""
-        if len(self.bloques_libres) <= 1:
-            print(f"ℹ️  No hay bloques para fusionar (total: {len(self.bloques_libres)})")
-            return
-        
-        print(f"🔄 Iniciando fusión de {len(self.bloques_libres)} bloques libres")
-        
-        # Ordenar bloques por posición de inicio
-        self.bloques_libres.sort(key=lambda x: x.inicio)
+        """Fusiona bloques libres adyacentes para evitar fragmentación. Retorna las fusiones realizadas"""
+        if len(self._libres) <= 1:
+            return 0
+        return self._libres.fusionar()
         
-        bloques_fusionados = []
-        bloque_actual = self.bloques_libres[0]
-        fusiones_realizadas = 0
-        
-        for i in range(1, len(self.bloques_libres)):
-            siguiente_bloque = self.bloques_libres[i]
-            
-            # Si los bloques son adyacentes, fusionar
-            if bloque_actual.inicio + bloque_actual.tamano == siguiente_bloque.inicio:
-                print(f"🔗 Fusionando bloques: {bloque_actual.tamano:,} + {siguiente_bloque.tamano:,} bytes")
-                bloque_actual.tamano += siguiente_bloque.tamano
-                fusiones_realizadas += 1
+    def compactar(self):
+        """
+        Compactación completa: desplaza todos los bloques ocupados hacia la dirección 0
+        dejando un único bloque libre al final. Retorna los bytes movidos.
+        """
+        tabla = self._tabla
+        destino = 0
+        movidos = 0
+        filas = [self._filas_por_inicio[inicio] for inicio in sorted(self._filas_por_inicio)]
+        self._filas_por_inicio = {}
+        for fila in filas:
+            tamano = tabla.tamano[fila]
+            if tabla.inicio[fila] != destino:
+                movidos += tamano
+                tabla.inicio[fila] = destino  # Las vistas de proceso.bloques_memoria_asignados lo reflejan
+            self._filas_por_inicio[destino] = fila
+            destino += tamano
+
+        self._libres = self._crear_indice()
+        if destino:
+            self._libres.ocupar(0, destino)
+        self._registrar_compactacion(movidos, 0, self.tamano_total)
+        return movidos
+
+    def compactar_para(self, tamano):
+        """
+        Compactación parcial: busca la ventana de extents contiguos que contiene al menos
+        'tamano' bytes libres moviendo la menor cantidad de bytes ocupados, y compacta
+        solo esa ventana. Retorna los bytes movidos, o None si no existe ventana.
+        """
+        tabla = self._tabla
+        extents = sorted(
+            [(inicio, tamano_libre, None) for inicio, tamano_libre in self._libres] +
+            [(inicio, tabla.tamano[fila], fila) for inicio, fila in self._filas_por_inicio.items()],
+            key=lambda extent: extent[0]
+        )
+        # Ventana deslizante: para cada extremo derecho, el izquierdo más ajustado
+        mejor = None
+        izquierda = 0
+        libres_en_ventana = ocupados_en_ventana = 0
+        for derecha, (_, tamano_extent, fila) in enumerate(extents):
+            if fila is None:
+                libres_en_ventana += tamano_extent
             else:
-                bloques_fusionados.append(bloque_actual)
-                bloque_actual = siguiente_bloque
-        
-        bloques_fusionados.append(bloque_actual)
-        self.bloques_libres = bloques_fusionados
-        
-        print(f"✅ Fusión completada: {fusiones_realizadas} fusiones realizadas, {len(self.bloques_libres)} bloques resultantes")
-        
+                ocupados_en_ventana += tamano_extent
+            while izquierda < derecha:
+                _, tamano_izq, fila_izq = extents[izquierda]
+                if fila_izq is None:
+                    if libres_en_ventana - tamano_izq < tamano:
+                        break
+                    libres_en_ventana -= tamano_izq
+                else:
+                    ocupados_en_ventana -= tamano_izq
+                izquierda += 1
+            if libres_en_ventana >= tamano and (mejor is None or ocupados_en_ventana < mejor[0]):
+                mejor = (ocupados_en_ventana, izquierda, derecha)
+        if mejor is None:
+            return None
+
+        _, izquierda, derecha = mejor
+        ventana = extents[izquierda:derecha + 1]
+        destino = ventana[0][0]
+        fin_ventana = ventana[-1][0] + ventana[-1][1]
+        for inicio, tamano_extent, fila in ventana:
+            if fila is None:
+                self._libres.ocupar(inicio, tamano_extent)
+            else:
+                del self._filas_por_inicio[inicio]
+        movidos = 0
+        for inicio, tamano_extent, fila in ventana:
+            if fila is None:
+                continue
+            if inicio != destino:
+                movidos += tamano_extent
+                tabla.inicio[fila] = destino
+            self._filas_por_inicio[destino] = fila
+            destino += tamano_extent
+        self._libres.liberar(destino, fin_ventana - destino)
+        self._libres.fusionar()
+        self._registrar_compactacion(movidos, ventana[0][0], fin_ventana)
+        return movidos
+
+    def costo_compactacion(self, bytes_movidos):
+        """Tiempo simulado que cuesta mover 'bytes_movidos' bytes"""
+        return int(round(bytes_movidos / MB * self.costo_compactacion_por_mb))
+
+    def tomar_tiempo_pendiente(self):
+        """Entrega (y reinicia) el tiempo de compactación que el simulador debe cobrar al reloj"""
+        pendiente, self._tiempo_pendiente = self._tiempo_pendiente, 0
+        return pendiente
+
     def obtener_uso_memoria(self):
-        """Retorna estadísticas de uso de memoria"""
-        memoria_ocupada = sum(bloque.tamano for bloque in self.bloques_ocupados)
-        memoria_libre = sum(bloque.tamano for bloque in self.bloques_libres)
+        """Retorna estadísticas de uso de memoria (contadores incrementales, sin recorrer bloques)"""
+        memoria_ocupada = self._memoria_ocupada
         porcentaje_uso = (memoria_ocupada / self.tamano_total) * 100
         
         return {
             'total': self.tamano_total,
             'ocupada': memoria_ocupada,
-            'libre': memoria_libre,
+            'libre': self.tamano_total - memoria_ocupada,
             'porcentaje_uso': porcentaje_uso,
-            'num_bloques_ocupados': len(self.bloques_ocupados),
-            'num_bloques_libres': len(self.bloques_libres)
+            'num_bloques_ocupados': len(self._filas_por_inicio),
+            'num_bloques_libres': len(self._libres),
+            'mayor_bloque_libre': self._libres.mayor(),
+            'fragmentacion_externa': self.fragmentacion_externa,
+            'compactaciones': self.compactaciones,
+            'bytes_movidos': self.bytes_movidos
         }
         
     def hay_swapping_necesario(self, tamano_requerido):
         """Verifica si es necesario hacer swapping para asignar memoria"""
-        memoria_libre_total = sum(bloque.tamano for bloque in self.bloques_libres)
-        return memoria_libre_total < tamano_requerido
+        return self.tamano_total - self._memoria_ocupada < tamano_requerido
+
+    def planear_liberacion(self, tamano_requerido):
+        """
+        Retorna una función que recibe, de a uno, procesos cuya memoria se liberaría (sin
+        liberarla) e indica si con los recibidos hasta ahora ya se podría asignar
+        'tamano_requerido'. Sin compactación hace falta un extent contiguo: los libres se
+        indexan por sus extremos la primera vez que hace falta fusionar, y cada bloque se
+        une a sus vecinos en O(1)
+        """
+        tabla = self._tabla
+        libre = self.tamano_total - self._memoria_ocupada
+        contiguo = self.compactacion is None and self._libres.mayor() < tamano_requerido
+        por_inicio, por_fin = {}, {}  # Extents libres simulados: inicio -> fin y fin -> inicio
+        mayor = 0
+
+        def liberaria(proceso):
+            nonlocal libre, mayor
+            filas = self._filas_por_pid.get(proceso.pid, ())
+            libre += sum(tabla.tamano[fila] for fila in filas)
+            if not contiguo:
+                return libre >= tamano_requerido
+            if not por_inicio:
+                for inicio, tamano in self._libres:
+                    por_inicio[inicio] = inicio + tamano
+                    por_fin[inicio + tamano] = inicio
+            for fila in filas:
+                inicio = tabla.inicio[fila]
+                fin = inicio + tabla.tamano[fila]
+                if fin in por_inicio:
+                    fin_vecino = por_inicio.pop(fin)
+                    del por_fin[fin_vecino]
+                    fin = fin_vecino
+                if inicio in por_fin:
+                    inicio_vecino = por_fin.pop(inicio)
+                    del por_inicio[inicio_vecino]
+                    inicio = inicio_vecino
+                por_inicio[inicio] = fin
+                por_fin[fin] = inicio
+                mayor = max(mayor, fin - inicio)
+            return mayor >= tamano_requerido
+
+        return liberaria
     
     def _mostrar_estado_memoria(self):
-        """Método auxiliar para mostrar el estado actual de la memoria"""
-        uso = self.obtener_uso_memoria()
-        print(f"📊 Estado de Memoria:")
-        print(f"   💾 Total: {uso['total']:,} bytes")
-        print(f"   🔴 Ocupada: {uso['ocupada']:,} bytes ({uso['porcentaje_uso']:.1f}%)")
-        print(f"   🟢 Libre: {uso['libre']:,} bytes")
-        print(f"   📦 Bloques ocupados: {uso['num_bloques_ocupados']}")
-        print(f"   📦 Bloques libres: {uso['num_bloques_libres']}")
-        print(f"   --- Detalle de bloques libres ---")
-        for i, bloque in enumerate(self.bloques_libres):
-            print(f"     Bloque libre {i+1}: {bloque.tamano:,} bytes en posición {bloque.inicio}")
-        print("   " + "="*40)
-       
+        """Emite una instantánea del uso de memoria (solo se llama con el bus activo)"""
+        self.eventos.emitir(TipoEvento.ESTADO_MEMORIA, **self.obtener_uso_memoria())
 
+    def _crear_indice(self):
+        if self.indice_libres == "arbol":
+            return IndiceLibresArbol(self.tamano_total, self.politica.requiere_indice_por_tamano)
+        return IndiceLibresLista(self.tamano_total)
 
+    def _registrar_compactacion(self, movidos, desde, hasta):
+        costo = self.costo_compactacion(movidos)
+        self.compactaciones += 1
+        self.bytes_movidos += movidos
+        self._tiempo_pendiente += costo
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.COMPACT, bytes_movidos=movidos, desde=desde, hasta=hasta, costo=costo)
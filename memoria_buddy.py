@@ -0,0 +1,265 @@
+from bloque_memoria import BloqueMemoria
+from eventos import BusEventos, TipoEvento
+
+# Estados de cada nodo del árbol implícito de buddies
+LIBRE = 0     # Bloque libre (si su padre está dividido) o parte de un bloque mayor
+DIVIDIDO = 1  # Bloque partido en dos buddies
+OCUPADO = 2   # Bloque asignado a un proceso
+
+
+class MemoriaBuddy:
+    """
+    Administrador de memoria con sistema buddy (potencias de dos).
+
+    Mantiene una lista de bloques libres por orden y un mapa de bits con el
+    estado (libre/dividido/ocupado) de cada nodo del árbol implícito, por lo
+    que dividir y fusionar cuesta O(log N) y los buddies no usados no existen
+    como objetos. Expone la misma API que Memoria.
+    """
+
+    def __init__(self, tamano_total_gb=2, bloque_minimo=4096, eventos=None):
+        self.eventos = eventos if eventos is not None else BusEventos.consola()
+        self.tamano_total = int(tamano_total_gb * 1024 * 1024 * 1024)  # Convertir GB a Bytes
+        if bloque_minimo <= 0 or bloque_minimo & (bloque_minimo - 1):
+            raise ValueError("El bloque mínimo debe ser una potencia de dos.")
+        if self.tamano_total < bloque_minimo or self.tamano_total & (self.tamano_total - 1):
+            raise ValueError("El tamaño total del sistema buddy debe ser una potencia de dos.")
+        self.bloque_minimo = bloque_minimo
+        self.orden_maximo = (self.tamano_total // bloque_minimo).bit_length() - 1
+
+        # Listas de bloques libres por orden: desplazamientos (en bytes) de cada bloque
+        self._libres_por_orden = [set() for _ in range(self.orden_maximo + 1)]
+        self._libres_por_orden[self.orden_maximo].add(0)
+        # Un byte por nodo del árbol implícito (raíz = 0, hijos de n = 2n+1 y 2n+2)
+        self._estado = bytearray((1 << (self.orden_maximo + 1)) - 1)
+
+        # Bloques ocupados indexados por PID y por dirección de inicio
+        self._bloques_por_pid = {}
+        self._bloques_por_inicio = {}
+        self.swap = None # GestorSwap asociado (opcional)
+        self.next_block_id = 1
+        self._memoria_ocupada = 0     # Bytes en bloques buddy asignados
+        self._memoria_solicitada = 0  # Bytes pedidos por los procesos
+        self._num_bloques_libres = 1
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.MEMORIA_INICIADA, descripcion=f"{tamano_total_gb} GB buddy",
+                                total=self.tamano_total, detalle=f"bloque mínimo {bloque_minimo:,} bytes")
+
+    @property
+    def bloques_ocupados(self):
+        """Vista de solo lectura de los bloques ocupados"""
+        return self._bloques_por_inicio.values()
+
+    def bloques_de_proceso(self, pid):
+        """Bloques asignados al proceso con el PID indicado"""
+        return list(self._bloques_por_pid.get(pid, ()))
+
+    def bloque_en(self, inicio):
+        """Bloque ocupado que empieza en 'inicio', o None"""
+        return self._bloques_por_inicio.get(inicio)
+
+    @property
+    def memoria_ocupada(self):
+        return self._memoria_ocupada
+
+    @property
+    def memoria_libre(self):
+        return self.tamano_total - self._memoria_ocupada
+
+    @property
+    def mayor_bloque_libre(self):
+        """Tamaño del mayor bloque libre (recorre a lo sumo orden_maximo listas)"""
+        for orden in range(self.orden_maximo, -1, -1):
+            if self._libres_por_orden[orden]:
+                return self.bloque_minimo << orden
+        return 0
+
+    @property
+    def mayor_asignable(self):
+        """Mayor solicitud que asignar_memoria puede satisfacer ahora"""
+        return self.mayor_bloque_libre
+
+    @property
+    def fragmentacion_externa(self):
+        """1 - mayor bloque libre / memoria libre"""
+        libre = self.tamano_total - self._memoria_ocupada
+        if libre == 0:
+            return 0.0
+        return 1 - self.mayor_bloque_libre / libre
+
+    @property
+    def bloques_libres(self):
+        """Bloques libres ordenados por dirección de inicio"""
+        return [
+            BloqueMemoria(0, inicio, self.bloque_minimo << orden)
+            for inicio, orden in sorted(
+                (inicio, orden)
+                for orden, libres in enumerate(self._libres_por_orden)
+                for inicio in libres
+            )
+        ]
+
+    def orden_para(self, tamano):
+        """Orden del bloque buddy más pequeño que contiene 'tamano' bytes"""
+        bloques = max(1, -(-tamano // self.bloque_minimo))
+        return (bloques - 1).bit_length()
+
+    def asignar_memoria(self, proceso):
+        """Asigna a un proceso el bloque buddy más pequeño donde quepa"""
+        tamano_requerido = proceso.tamano_memoria
+
+        orden = self.orden_para(tamano_requerido)
+        if orden > self.orden_maximo:
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.ALLOC_FALLIDA, pid=proceso.pid, tamano=tamano_requerido)
+            return False
+
+        # Buscar el menor orden con un bloque libre disponible
+        orden_libre = orden
+        while orden_libre <= self.orden_maximo and not self._libres_por_orden[orden_libre]:
+            orden_libre += 1
+        if orden_libre > self.orden_maximo:
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.ALLOC_FALLIDA, pid=proceso.pid, tamano=tamano_requerido)
+            return False
+
+        inicio = self._libres_por_orden[orden_libre].pop()
+        orden_inicial = orden_libre
+        nodo = self._nodo(inicio, orden_libre)
+
+        # Dividir hasta llegar al orden pedido, dejando libre el buddy derecho en cada nivel
+        while orden_libre > orden:
+            self._estado[nodo] = DIVIDIDO
+            orden_libre -= 1
+            self._libres_por_orden[orden_libre].add(inicio + (self.bloque_minimo << orden_libre))
+            self._num_bloques_libres += 1
+            nodo = 2 * nodo + 1
+        self._estado[nodo] = OCUPADO
+        self._num_bloques_libres -= 1
+
+        tamano_bloque = self.bloque_minimo << orden
+        nuevo_bloque_ocupado = BloqueMemoria(
+            self.next_block_id,
+            inicio,
+            tamano_bloque,
+            ocupado=True,
+            pid_proceso=proceso.pid
+        )
+        self._bloques_por_inicio[inicio] = nuevo_bloque_ocupado
+        self._bloques_por_pid.setdefault(proceso.pid, []).append(nuevo_bloque_ocupado)
+        proceso.bloques_memoria_asignados.append(nuevo_bloque_ocupado)
+        self.next_block_id += 1
+        self._memoria_ocupada += tamano_bloque
+        self._memoria_solicitada += tamano_requerido
+
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.ALLOC, pid=proceso.pid, inicio=inicio,
+                                tamano=tamano_bloque, bloque_libre=self.bloque_minimo << orden_inicial)
+        return True
+
+    def liberar_memoria(self, proceso):
+        """Libera los bloques del proceso fusionando cada uno con su buddy mientras sea posible"""
+        bloques_a_liberar = self._bloques_por_pid.pop(proceso.pid, [])
+        fusiones = 0
+        for bloque in bloques_a_liberar:
+            fusiones += self._liberar_bloque(bloque.inicio)
+            del self._bloques_por_inicio[bloque.inicio]
+            self._memoria_ocupada -= bloque.tamano
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.FREE, pid=proceso.pid, inicio=bloque.inicio, tamano=bloque.tamano)
+        if bloques_a_liberar:
+            self._memoria_solicitada -= proceso.tamano_memoria
+        proceso.bloques_memoria_asignados.clear()
+        if self.eventos.activo and fusiones:
+            self.eventos.emitir(TipoEvento.MERGE, fusiones=fusiones, bloques_libres=self._num_bloques_libres)
+
+    def fusionar_bloques_libres(self):
+        """En el sistema buddy la fusión ocurre al liberar cada bloque"""
+        return 0
+
+    def tomar_tiempo_pendiente(self):
+        """El sistema buddy no compacta: no hay tiempo que cobrar"""
+        return 0
+
+    def obtener_uso_memoria(self):
+        """Retorna estadísticas de uso de memoria, con la fragmentación interna por separado"""
+        return {
+            'total': self.tamano_total,
+            'ocupada': self._memoria_ocupada,
+            'libre': self.tamano_total - self._memoria_ocupada,
+            'porcentaje_uso': (self._memoria_ocupada / self.tamano_total) * 100,
+            'num_bloques_ocupados': len(self._bloques_por_inicio),
+            'num_bloques_libres': self._num_bloques_libres,
+            'solicitada': self._memoria_solicitada,
+            'fragmentacion_interna': self._memoria_ocupada - self._memoria_solicitada,
+            'mayor_bloque_libre': self.mayor_bloque_libre,
+            'fragmentacion_externa': self.fragmentacion_externa,
+        }
+
+    def hay_swapping_necesario(self, tamano_requerido):
+        """Verifica si hay un bloque buddy libre suficiente para 'tamano_requerido'"""
+        orden = self.orden_para(tamano_requerido)
+        return not any(self._libres_por_orden[orden:])
+
+    def planear_liberacion(self, tamano_requerido):
+        """
+        Como Memoria.planear_liberacion: la función retornada recibe de a uno los procesos
+        que se liberarían e indica si ya habría un bloque buddy para 'tamano_requerido'.
+        Las fusiones se simulan sobre una copia de las listas libres, hecha una sola vez
+        """
+        orden_requerido = self.orden_para(tamano_requerido)
+        cabe_ya = orden_requerido <= self.orden_maximo and any(self._libres_por_orden[orden_requerido:])
+        libres = []
+
+        def liberaria(proceso):
+            nonlocal cabe_ya
+            if cabe_ya or orden_requerido > self.orden_maximo:
+                return cabe_ya
+            if not libres:
+                libres.extend(set(conjunto) for conjunto in self._libres_por_orden)
+            for bloque in self._bloques_por_pid.get(proceso.pid, ()):
+                inicio, orden = bloque.inicio, (bloque.tamano // self.bloque_minimo).bit_length() - 1
+                while orden < self.orden_maximo:
+                    buddy = inicio ^ (self.bloque_minimo << orden)
+                    if buddy not in libres[orden]:
+                        break
+                    libres[orden].remove(buddy)
+                    inicio = min(inicio, buddy)
+                    orden += 1
+                libres[orden].add(inicio)
+                cabe_ya = cabe_ya or orden >= orden_requerido
+            return cabe_ya
+
+        return liberaria
+
+    def _nodo(self, inicio, orden):
+        """Índice en el mapa de bits del bloque de 'orden' que empieza en 'inicio'"""
+        profundidad = self.orden_maximo - orden
+        return (1 << profundidad) - 1 + inicio // (self.bloque_minimo << orden)
+
+    def _liberar_bloque(self, inicio):
+        # Bajar desde la raíz por los nodos divididos hasta el bloque ocupado
+        nodo, orden = 0, self.orden_maximo
+        while self._estado[nodo] == DIVIDIDO:
+            orden -= 1
+            mitad = 1 if (inicio // (self.bloque_minimo << orden)) & 1 else 0
+            nodo = 2 * nodo + 1 + mitad
+        if self._estado[nodo] != OCUPADO:
+            raise ValueError(f"El bloque en posición {inicio} no está asignado.")
+        self._estado[nodo] = LIBRE
+
+        fusiones = 0
+        while orden < self.orden_maximo:
+            buddy = inicio ^ (self.bloque_minimo << orden)
+            if buddy not in self._libres_por_orden[orden]:
+                break
+            self._libres_por_orden[orden].remove(buddy)
+            self._num_bloques_libres -= 1
+            nodo = (nodo - 1) // 2
+            self._estado[nodo] = LIBRE
+            inicio = min(inicio, buddy)
+            orden += 1
+            fusiones += 1
+        self._libres_por_orden[orden].add(inicio)
+        self._num_bloques_libres += 1
+        return fusiones
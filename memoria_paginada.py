@@ -0,0 +1,285 @@
+import collections
+from array import array
+
+from eventos import BusEventos, TipoEvento
+
+
+class TLB:
+    """
+    TLB simulada asociativa por conjuntos con reemplazo LRU.
+
+    Cada conjunto es un OrderedDict (pid, página) -> marco; la entrada más
+    recientemente usada queda al final. Con asociatividad == entradas la TLB
+    es totalmente asociativa; con asociatividad 1 es de mapeo directo.
+    """
+
+    def __init__(self, entradas=64, asociatividad=4):
+        if entradas <= 0 or asociatividad <= 0 or entradas % asociatividad:
+            raise ValueError("Las entradas de la TLB deben ser múltiplo de la asociatividad.")
+        self.entradas = entradas
+        self.asociatividad = asociatividad
+        self.num_conjuntos = entradas // asociatividad
+        self._conjuntos = [collections.OrderedDict() for _ in range(self.num_conjuntos)]
+        self.aciertos = 0
+        self.fallos = 0
+
+    def buscar(self, pid, pagina):
+        """Retorna el marco cacheado para (pid, página), o None en caso de fallo"""
+        conjunto = self._conjuntos[pagina % self.num_conjuntos]
+        marco = conjunto.get((pid, pagina))
+        if marco is None:
+            self.fallos += 1
+            return None
+        conjunto.move_to_end((pid, pagina))
+        self.aciertos += 1
+        return marco
+
+    def insertar(self, pid, pagina, marco):
+        conjunto = self._conjuntos[pagina % self.num_conjuntos]
+        conjunto[(pid, pagina)] = marco
+        conjunto.move_to_end((pid, pagina))
+        if len(conjunto) > self.asociatividad:
+            conjunto.popitem(last=False)  # Desalojar la entrada menos recientemente usada
+
+    def invalidar_proceso(self, pid):
+        """Elimina todas las traducciones de un proceso (al liberar su memoria)"""
+        for conjunto in self._conjuntos:
+            for clave in [clave for clave in conjunto if clave[0] == pid]:
+                del conjunto[clave]
+
+    @property
+    def tasa_aciertos(self):
+        total = self.aciertos + self.fallos
+        return self.aciertos / total if total else 0.0
+
+
+class MemoriaPaginada:
+    """
+    Administrador de memoria paginada con marcos de tamaño fijo.
+
+    El estado de los marcos es un mapa de bits (un bit por marco) y los marcos
+    libres se obtienen de una pila: primero los liberados y, cuando se agota,
+    los que están por encima de la marca de agua (nunca usados). Así asignar y
+    liberar un marco cuesta O(1) y 2 GB con páginas de 4 KB no crean ningún
+    objeto Python por marco. El mapa evita que un marco vuelva dos veces a la pila. Cada proceso guarda su tabla de páginas como un
+    array de números de marco. Expone la misma API que Memoria.
+    """
+
+    def __init__(self, tamano_total_gb=2, tamano_pagina=4096, entradas_tlb=64, asociatividad_tlb=4,
+                 latencia_fallo_tlb=0.0, eventos=None):
+        self.eventos = eventos if eventos is not None else BusEventos.consola()
+        self.tamano_total = int(tamano_total_gb * 1024 * 1024 * 1024)  # Convertir GB a Bytes
+        if tamano_pagina <= 0 or tamano_pagina & (tamano_pagina - 1):
+            raise ValueError("El tamaño de página debe ser una potencia de dos.")
+        self.tamano_pagina = tamano_pagina
+        self.num_marcos = self.tamano_total // tamano_pagina
+        self.tlb = TLB(entradas_tlb, asociatividad_tlb)
+        self.latencia_fallo_tlb = latencia_fallo_tlb  # Tiempo simulado por cada fallo de TLB
+
+        self._mapa_marcos = bytearray((self.num_marcos + 7) // 8)  # Bit en 1 = marco asignado
+        self._pila_libres = array("I")  # Marcos liberados, listos para reutilizar
+        self._marca_agua = 0            # Marcos >= marca de agua nunca se han asignado
+        self._num_marcos_libres = self.num_marcos
+
+        self._procesos = {}  # pid -> proceso residente
+        self.swap = None # GestorSwap asociado (opcional)
+        self._memoria_solicitada = 0
+        self._fallos_con_latencia = 0  # Fallos de TLB acumulados (su latencia se cobra en tomar_tiempo_pendiente)
+        self._tiempo_cobrado = 0
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.MEMORIA_INICIADA, descripcion=f"{tamano_total_gb} GB paginada",
+                                total=self.tamano_total,
+                                detalle=f"{self.num_marcos:,} marcos de {tamano_pagina:,} bytes")
+
+    @property
+    def bloques_ocupados(self):
+        """La memoria paginada no tiene bloques contiguos"""
+        return ()
+
+    @property
+    def bloques_libres(self):
+        return []
+
+    @property
+    def memoria_ocupada(self):
+        return (self.num_marcos - self._num_marcos_libres) * self.tamano_pagina
+
+    @property
+    def memoria_libre(self):
+        return self._num_marcos_libres * self.tamano_pagina
+
+    @property
+    def mayor_bloque_libre(self):
+        """Cualquier conjunto de marcos libres sirve: toda la memoria libre es utilizable"""
+        return self.memoria_libre
+
+    @property
+    def mayor_asignable(self):
+        return self.memoria_libre
+
+    @property
+    def fragmentacion_externa(self):
+        return 0.0
+
+    def paginas_para(self, tamano):
+        return max(1, -(-tamano // self.tamano_pagina))
+
+    def asignar_memoria(self, proceso):
+        """Asigna al proceso los marcos necesarios y construye su tabla de páginas"""
+        tamano_requerido = proceso.tamano_memoria
+        paginas = self.paginas_para(tamano_requerido)
+        if paginas > self._num_marcos_libres:
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.ALLOC_FALLIDA, pid=proceso.pid, tamano=tamano_requerido)
+            return False
+
+        tabla = array("I", [0]) * paginas
+        for pagina in range(paginas):
+            tabla[pagina] = self._tomar_marco()
+        proceso.tabla_paginas = tabla
+        self._procesos[proceso.pid] = proceso
+        self._memoria_solicitada += tamano_requerido
+
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.ALLOC, pid=proceso.pid, inicio=tabla[0] * self.tamano_pagina,
+                                tamano=paginas * self.tamano_pagina, bloque_libre=self.memoria_libre)
+        return True
+
+    def liberar_memoria(self, proceso):
+        """Devuelve los marcos del proceso a la pila de libres e invalida su TLB"""
+        if proceso.pid not in self._procesos:
+            return
+        tabla = proceso.tabla_paginas
+        mapa = self._mapa_marcos
+        for marco in tabla:
+            if not mapa[marco >> 3] & (1 << (marco & 7)):
+                raise ValueError(f"El marco {marco} del proceso {proceso.pid} no está asignado.")
+        del self._procesos[proceso.pid]
+        for marco in tabla:
+            mapa[marco >> 3] &= ~(1 << (marco & 7))
+        self._pila_libres.extend(tabla)
+        self._num_marcos_libres += len(tabla)
+        self._memoria_solicitada -= proceso.tamano_memoria
+        self.tlb.invalidar_proceso(proceso.pid)
+        proceso.tabla_paginas = None
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.FREE, pid=proceso.pid, inicio=tabla[0] * self.tamano_pagina,
+                                tamano=len(tabla) * self.tamano_pagina)
+
+    def traducir(self, proceso, direccion_virtual):
+        """Traduce una dirección virtual del proceso a física pasando por la TLB"""
+        pagina, desplazamiento = divmod(direccion_virtual, self.tamano_pagina)
+        marco = self.tlb.buscar(proceso.pid, pagina)
+        if marco is None:
+            tabla = proceso.tabla_paginas
+            if tabla is None or pagina >= len(tabla):
+                raise ValueError(f"Dirección {direccion_virtual} fuera del espacio del proceso {proceso.pid}.")
+            marco = tabla[pagina]
+            self.tlb.insertar(proceso.pid, pagina, marco)
+            self._fallos_con_latencia += 1
+        return marco * self.tamano_pagina + desplazamiento
+
+    def acceder(self, proceso, pasos=1):
+        """
+        Accesos a memoria de 'pasos' unidades de ejecución: recorre secuencialmente
+        las páginas del proceso. Solo se traducen una por una las primeras
+        (a lo sumo una vuelta o una ventana que llena todos los conjuntos de la
+        TLB); el resto se cuenta en forma cerrada, así que el costo no depende
+        del tiempo simulado.
+        """
+        tabla = proceso.tabla_paginas
+        paginas = len(tabla)
+        tlb = self.tlb
+        inicio = proceso.tiempo_en_cpu
+        ventana = tlb.entradas + 2 * tlb.num_conjuntos
+        directos = min(pasos, paginas, ventana)
+        for paso in range(directos):
+            direccion = self.traducir(proceso, ((inicio + paso) % paginas) * self.tamano_pagina)
+        resto = pasos - directos
+        if not resto:
+            return direccion
+
+        # Pasada la primera vuelta (o la ventana, si hay más páginas que ventana) la
+        # LRU con recorrido cíclico es estable: un conjunto con a lo sumo
+        # 'asociatividad' páginas del proceso acierta siempre, y uno con más falla siempre
+        falla = [-(-(paginas - k) // tlb.num_conjuntos) > tlb.asociatividad for k in range(tlb.num_conjuntos)]
+        primero = inicio + directos
+        if all(falla):
+            fallos = resto
+        else:
+            # Solo ocurre con paginas <= ventana: el recorrido parcial es corto
+            por_vuelta = sum(falla[pagina % tlb.num_conjuntos] for pagina in range(paginas))
+            vueltas, parcial = divmod(resto, paginas)
+            fallos = vueltas * por_vuelta + sum(falla[(primero + paso) % paginas % tlb.num_conjuntos]
+                                                for paso in range(parcial))
+        tlb.aciertos += resto - fallos
+        tlb.fallos += fallos
+        self._fallos_con_latencia += fallos
+
+        # Dejar la TLB como la habría dejado el recorrido completo: basta repetir
+        # los últimos accesos, que fijan el contenido y el orden LRU de cada conjunto
+        for paso in range(pasos - min(resto, paginas, ventana), pasos):
+            pagina = (inicio + paso) % paginas
+            tlb.insertar(proceso.pid, pagina, tabla[pagina])
+        return tabla[pagina] * self.tamano_pagina
+
+    def fusionar_bloques_libres(self):
+        """Con paginación no hay bloques libres que fusionar"""
+        return 0
+
+    def tomar_tiempo_pendiente(self):
+        """
+        Entrega la parte entera del tiempo acumulado por fallos de TLB. Se calcula
+        desde la cuenta total de fallos para no depender de cuántas veces se sumó la latencia
+        """
+        pendiente = int(self._fallos_con_latencia * self.latencia_fallo_tlb) - self._tiempo_cobrado
+        self._tiempo_cobrado += pendiente
+        return pendiente
+
+    def obtener_uso_memoria(self):
+        """Retorna estadísticas de uso de memoria y de la TLB"""
+        ocupada = self.memoria_ocupada
+        return {
+            'total': self.tamano_total,
+            'ocupada': ocupada,
+            'libre': self.tamano_total - ocupada,
+            'porcentaje_uso': (ocupada / self.tamano_total) * 100,
+            'num_bloques_ocupados': self.num_marcos - self._num_marcos_libres,
+            'num_bloques_libres': self._num_marcos_libres,
+            'solicitada': self._memoria_solicitada,
+            'fragmentacion_interna': ocupada - self._memoria_solicitada,
+            'mayor_bloque_libre': self.mayor_bloque_libre,
+            'fragmentacion_externa': 0.0,
+            'tlb_aciertos': self.tlb.aciertos,
+            'tlb_fallos': self.tlb.fallos,
+            'tlb_tasa_aciertos': self.tlb.tasa_aciertos,
+        }
+
+    def marco_ocupado(self, marco):
+        return bool(self._mapa_marcos[marco >> 3] & (1 << (marco & 7)))
+
+    def hay_swapping_necesario(self, tamano_requerido):
+        """Verifica si faltan marcos libres para 'tamano_requerido'"""
+        return self.paginas_para(tamano_requerido) > self._num_marcos_libres
+
+    def planear_liberacion(self, tamano_requerido):
+        """Como Memoria.planear_liberacion: basta contar los marcos que se liberarían"""
+        faltan = self.paginas_para(tamano_requerido) - self._num_marcos_libres
+
+        def liberaria(proceso):
+            nonlocal faltan
+            if proceso.pid in self._procesos:
+                faltan -= len(proceso.tabla_paginas)
+            return faltan <= 0
+
+        return liberaria
+
+    def _tomar_marco(self):
+        if self._pila_libres:
+            marco = self._pila_libres.pop()
+        else:
+            marco = self._marca_agua
+            self._marca_agua += 1
+        self._mapa_marcos[marco >> 3] |= 1 << (marco & 7)
+        self._num_marcos_libres -= 1
+        return marco
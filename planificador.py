@@ -1,41 +1,209 @@
-import collections
+from cola_listos import (ColaCFS, ColaFIFO, ColaLoteria, ColaMLFQ, ColaPrioridad, ColaSJF, ColaStride,
+                         PESO_NICE_0, peso_nice)
+
+# Registro de algoritmos de planificación: nombre -> clase
+ALGORITMOS = {}
+
+
+def registrar_algoritmo(*nombres):
+    """Decorador que registra una clase de algoritmo bajo uno o más nombres"""
+    def registrar(clase):
+        for nombre in nombres:
+            ALGORITMOS[nombre] = clase
+        return clase
+    return registrar
+
+
+class AlgoritmoPlanificacion:
+    """
+    Base de los algoritmos de planificación.
+
+    Cada algoritmo define su cola de listos (que fija el orden de servicio) y
+    su regla de desalojo: por quantum agotado y/o por expropiación cuando llega
+    a la cola un proceso mejor que alguno en ejecución.
+    """
+
+    nombre = None
+    usa_quantum = False   # El simulador desaloja al agotarse quantum()
+    expropiativo = False  # El simulador compara clave_expropiacion() en cada paso
+
+    def __init__(self, **opciones):
+        self.opciones = opciones
+
+    def crear_cola(self, procesos=()):
+        raise NotImplementedError
+
+    def quantum(self, proceso, cola, quantum_base):
+        """Quantum del proceso en ejecución, o None si no se desaloja por tiempo"""
+        return quantum_base if self.usa_quantum else None
+
+    def al_agotar_quantum(self, proceso, cola):
+        """Se llama antes de devolver a la cola un proceso desalojado por quantum"""
+
+    def al_ejecutar(self, proceso, cola, tiempo):
+        """Se llama por cada paso que el proceso pasa en un núcleo"""
+
+    def clave_expropiacion(self, proceso, cola):
+        """Menor es mejor: un proceso en cola con clave menor expropia al peor en ejecución"""
+        raise NotImplementedError
+
+    def proximo_evento(self, cola, en_ejecucion, tiempo):
+        """Próximo instante en que la cola cambia una decisión sin que ocurra otro evento, o None"""
+        return cola.proximo_evento(tiempo)
+
+
+@registrar_algoritmo("FCFS")
+class FCFS(AlgoritmoPlanificacion):
+    """First Come First Served: FIFO sin desalojo"""
+    nombre = "FCFS"
+
+    def crear_cola(self, procesos=()):
+        return ColaFIFO(procesos)
+
+
+@registrar_algoritmo("SJF")
+class SJF(AlgoritmoPlanificacion):
+    """Shortest Job First no expropiativo"""
+    nombre = "SJF"
+
+    def crear_cola(self, procesos=()):
+        return ColaSJF(procesos)
+
+
+@registrar_algoritmo("SRTF")
+class SRTF(AlgoritmoPlanificacion):
+    """Shortest Remaining Time First: SJF que expropia cuando llega un trabajo más corto"""
+    nombre = "SRTF"
+    expropiativo = True
+
+    def crear_cola(self, procesos=()):
+        return ColaSJF(procesos)
+
+    def clave_expropiacion(self, proceso, cola):
+        return proceso.tiempo_restante
+
+
+@registrar_algoritmo("RR", "Round Robin")
+class RoundRobin(AlgoritmoPlanificacion):
+    """Round Robin: FIFO con desalojo al agotar el quantum"""
+    nombre = "RR"
+    usa_quantum = True
+
+    def crear_cola(self, procesos=()):
+        return ColaFIFO(procesos)
+
+
+@registrar_algoritmo("MLFQ")
+class MLFQ(AlgoritmoPlanificacion):
+    """Colas multinivel con retroalimentación; opciones: quantums, periodo_boost"""
+    nombre = "MLFQ"
+    usa_quantum = True
+
+    def crear_cola(self, procesos=()):
+        return ColaMLFQ(procesos, **self.opciones)
+
+    def quantum(self, proceso, cola, quantum_base):
+        return cola.quantum_de(proceso)
+
+    def al_agotar_quantum(self, proceso, cola):
+        cola.degradar(proceso)
+
+
+@registrar_algoritmo("Prioridad")
+class Prioridad(AlgoritmoPlanificacion):
+    """Prioridad estática expropiativa con envejecimiento; opción: intervalo_envejecimiento"""
+    nombre = "Prioridad"
+    expropiativo = True
+
+    def crear_cola(self, procesos=()):
+        return ColaPrioridad(procesos, **self.opciones)
+
+    def clave_expropiacion(self, proceso, cola):
+        return cola.clave_efectiva(proceso)
+
+    def proximo_evento(self, cola, en_ejecucion, tiempo):
+        # Con el envejecimiento, el primero de la cola acaba superando al peor en ejecución
+        if not cola:
+            return None
+        peor = max(cola.clave_efectiva(proceso) for proceso in en_ejecucion)
+        return cola.instante_de_superar(cola.ver_primero(), peor)
+
+
+@registrar_algoritmo("Loteria")
+class Loteria(AlgoritmoPlanificacion):
+    """Lotería proporcional a Proceso.boletos, con desalojo por quantum; opción: semilla"""
+    nombre = "Loteria"
+    usa_quantum = True
+
+    def crear_cola(self, procesos=()):
+        return ColaLoteria(procesos, **self.opciones)
+
+
+@registrar_algoritmo("Stride")
+class Stride(AlgoritmoPlanificacion):
+    """Versión determinista de la lotería: reparte quantums en proporción a los boletos"""
+    nombre = "Stride"
+    usa_quantum = True
+
+    def crear_cola(self, procesos=()):
+        return ColaStride(procesos)
+
+
+@registrar_algoritmo("CFS")
+class CFS(AlgoritmoPlanificacion):
+    """Planificador completamente justo; opciones: latencia_objetivo, granularidad_minima"""
+    nombre = "CFS"
+    usa_quantum = True
+
+    def crear_cola(self, procesos=()):
+        return ColaCFS(procesos, **self.opciones)
+
+    def quantum(self, proceso, cola, quantum_base):
+        return cola.timeslice(proceso)
+
+    def al_ejecutar(self, proceso, cola, tiempo):
+        cola.cargar_ejecucion(proceso, tiempo)
+
+
+def indice_jain(valores):
+    """Índice de equidad de Jain: 1 si todos los valores son iguales, 1/n en el peor caso"""
+    valores = list(valores)
+    suma_cuadrados = sum(v * v for v in valores)
+    if not suma_cuadrados:
+        return 1.0
+    return sum(valores) ** 2 / (len(valores) * suma_cuadrados)
+
+
+def participacion_ponderada(proceso, tiempo_actual):
+    """Fracción de CPU recibida desde su llegada, normalizada por el peso de su nice"""
+    fin = proceso.tiempo_finalizacion if proceso.tiempo_finalizacion >= 0 else tiempo_actual
+    tiempo_en_sistema = fin - proceso.tiempo_llegada
+    if tiempo_en_sistema <= 0:
+        return None
+    return proceso.tiempo_en_cpu * PESO_NICE_0 / peso_nice(proceso.prioridad) / tiempo_en_sistema
+
 
 class Planificador:
     def __init__(self):
         # El planificador no guarda las colas, las tiene que recibir el Simulador para operar sobre ellas.
         pass
 
-    def planificar(self, cola_listos, algoritmo="SJF"):
-        """
-        Planifica procesos según el algoritmo especificado
-        """
-        if algoritmo == "SJF":
-            return self._planificar_sjf(cola_listos)
-        elif algoritmo in ["Round Robin", "RR"]:  # Aceptar ambas formas
-            return self._planificar_round_robin(cola_listos)
-        else:
+    def crear_algoritmo(self, algoritmo, **opciones):
+        """Instancia el algoritmo registrado con ese nombre"""
+        if algoritmo not in ALGORITMOS:
             raise ValueError("Algoritmo de planificación no reconocido.")
+        return ALGORITMOS[algoritmo](**opciones)
 
-    def _planificar_sjf(self, cola_listos):
-        """
-        Planificación Shortest Job First (SJF)
-        Ordena por tiempo de ráfaga restante (más corto primero)
-        """
-        if not cola_listos:
-            return []
-        
-        # Ordenar por tiempo restante (SJF)
-        procesos_ordenados = sorted(cola_listos, key=lambda p: p.tiempo_restante)
-        
-        # Devolver el proceso más corto como lista para consistencia
-        return [procesos_ordenados[0]]
-
-    def _planificar_round_robin(self, cola_listos, quantum=3):
+    def crear_cola(self, algoritmo, procesos=(), **opciones):
+        """Crea la cola de listos adecuada para el algoritmo, con los procesos dados"""
+        return self.crear_algoritmo(algoritmo, **opciones).crear_cola(procesos)
+
+    def planificar(self, cola_listos, algoritmo="SJF", k=1):
         """
-        Planificación Round Robin con quantum
-        Devuelve el primer proceso de la cola (FIFO)
+        Planifica hasta k procesos (uno por núcleo libre) según el algoritmo especificado.
+        Cada cola de listos ya mantiene el orden de su algoritmo, así que basta con
+        extraer sus k primeros; los procesos devueltos ya no están en la cola.
         """
-        if cola_listos:
-            # En lugar de popleft(), usar índice 0 para listas normales
-            return [cola_listos[0]]  # Devolver como lista para consistencia
-        return []
+        if algoritmo not in ALGORITMOS:
+            raise ValueError("Algoritmo de planificación no reconocido.")
+        return cola_listos.extraer_varios(k)
@@ -0,0 +1,81 @@
+class PoliticaUbicacion:
+    """
+    Interfaz de las políticas de ubicación de memoria contigua.
+
+    Una política elige, dentro del índice de bloques libres de Memoria, el
+    inicio del bloque donde se colocará una solicitud de 'tamano' bytes.
+    """
+
+    nombre = None
+    requiere_indice_por_tamano = False  # Si necesita el treap ordenado por tamaño
+
+    def seleccionar(self, libres, tamano):
+        """Retorna el inicio del bloque libre elegido o None si no cabe"""
+        raise NotImplementedError
+
+    def notificar_asignacion(self, inicio, tamano):
+        """Se llama después de ocupar 'tamano' bytes en 'inicio'"""
+        pass
+
+
+class PrimerAjuste(PoliticaUbicacion):
+    """First-Fit: el bloque libre de menor dirección donde quepa"""
+
+    nombre = "first-fit"
+
+    def seleccionar(self, libres, tamano):
+        return libres.primer_ajuste(tamano)
+
+
+class MejorAjuste(PoliticaUbicacion):
+    """Best-Fit: el bloque libre más pequeño donde quepa"""
+
+    nombre = "best-fit"
+    requiere_indice_por_tamano = True
+
+    def seleccionar(self, libres, tamano):
+        return libres.mejor_ajuste(tamano)
+
+
+class PeorAjuste(PoliticaUbicacion):
+    """Worst-Fit: el bloque libre más grande"""
+
+    nombre = "worst-fit"
+
+    def seleccionar(self, libres, tamano):
+        return libres.peor_ajuste(tamano)
+
+
+class SiguienteAjuste(PoliticaUbicacion):
+    """Next-Fit: First-Fit que continúa desde la última asignación (puntero itinerante)"""
+
+    nombre = "next-fit"
+
+    def __init__(self):
+        self.puntero = 0
+
+    def seleccionar(self, libres, tamano):
+        inicio = libres.primer_ajuste(tamano, desde=self.puntero)
+        if inicio is None and self.puntero > 0:
+            # Dar la vuelta y buscar desde el principio de la memoria
+            inicio = libres.primer_ajuste(tamano)
+        return inicio
+
+    def notificar_asignacion(self, inicio, tamano):
+        self.puntero = inicio + tamano
+
+
+POLITICAS_UBICACION = {
+    PrimerAjuste.nombre: PrimerAjuste,
+    MejorAjuste.nombre: MejorAjuste,
+    PeorAjuste.nombre: PeorAjuste,
+    SiguienteAjuste.nombre: SiguienteAjuste,
+}
+
+
+def crear_politica_ubicacion(nombre):
+    """Crea una política a partir de su nombre ("first-fit", "best-fit", "worst-fit", "next-fit")"""
+    try:
+        return POLITICAS_UBICACION[nombre.lower()]()
+    except KeyError:
+        raise ValueError(f"Política de ubicación no reconocida: {nombre}")
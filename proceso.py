@@ -2,7 +2,7 @@ import time
 import random
 
 class Proceso:
-    def __init__(self, pid, tiempo_llegada, duracion, tamano_memoria):
+    def __init__(self, pid, tiempo_llegada, duracion, tamano_memoria, prioridad=0, boletos=100):
         self.pid = pid  # ID del proceso
         self.tiempo_llegada = tiempo_llegada  # Momento en que el proceso llega al sistema 
         self.duracion = duracion  # Tiempo total de CPU que necesita el proceso (CPU burst) 
@@ -15,6 +15,16 @@ class Proceso:
         self.tiempo_en_cpu = 0 # Tiempo que el proceso ha estado en CPU
         self.tiempo_quantum_actual = 0 # Tiempo ejecutado en el quantum actual (para Round Robin)
         self.bloques_memoria_asignados = [] # Lista de bloques de memoria asignados
+        self.tabla_paginas = None # Tabla de páginas (array de marcos) en memoria paginada
+        self.prioridad = prioridad # Mayor valor = menor prioridad (como nice en Unix)
+        self.ultimo_tiempo_ejecucion = -1 # Último instante en CPU (para elegir víctimas LRU de swap)
+        self.nivel_mlfq = 0 # Nivel actual en la cola multinivel (0 = máxima prioridad)
+        self.epoca_mlfq = 0 # Boost de MLFQ al que corresponde 'nivel_mlfq'
+        self.boletos = boletos # Boletos para planificación por lotería / stride
+        self.pase_stride = 0 # Pase acumulado en planificación stride
+        self.vruntime = 0 # Tiempo de ejecución virtual ponderado, exacto (planificador CFS)
+        self.espera_envejecida = 0 # Espera acumulada que mejora su prioridad (envejecimiento)
+        self.ultimo_nucleo = None # Núcleo donde corrió por última vez (afinidad en colas por núcleo)
 
     def __repr__(self):
         return f"P{self.pid} (Estado: {self.estado}, Dur: {self.duracion}, Rest: {self.tiempo_restante}, Mem: {self.tamano_memoria})"
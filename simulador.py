@@ -1,35 +1,104 @@
 import collections
+import heapq
+import itertools
 from cpu import CPU
 from memoria import Memoria
-from planificador import Planificador
+from memoria_buddy import MemoriaBuddy
+from memoria_paginada import MemoriaPaginada
+from planificador import Planificador, participacion_ponderada
+from cola_listos import ColasPorNucleo
+from cola_admision import ColaAdmision
+from cola_llegadas import ColaLlegadas
+from eventos import BusEventos, TipoEvento
+from estadisticas import MetricasSimulacion, SumasJain, utilizacion_nucleos
+from swap import GestorSwap
 
 class Simulador:
-    def __init__(self, num_nucleos=2):
+    def __init__(self, num_nucleos=2, politica_memoria="first-fit", tipo_memoria="contigua", eventos=None,
+                 swap_gb=0, politica_swap="lru", memoria_gb=2, compactacion=None,
+                 colas_por_nucleo=False, balanceo="menos_cargada", costo_migracion=1, tiempo_limite=10,
+                 orden_admision="fifo", conservar_terminados=True, entradas_tlb=64, asociatividad_tlb=4,
+                 latencia_fallo_tlb=0.0):
+        # Bus de eventos compartido con la memoria (por defecto imprime en consola)
+        self.eventos = eventos if eventos is not None else BusEventos.consola()
         self.cpu = CPU(num_nucleos)
-        self.memoria = Memoria()
+        # "contigua": particiones variables con política de ubicación; "buddy": sistema buddy;
+        # "paginada": marcos de 4 KB con tabla de páginas y TLB (tamaño, asociatividad y latencia
+        # por fallo configurables; las opciones de TLB no se usan con los otros tipos)
+        if tipo_memoria == "buddy":
+            self.memoria = MemoriaBuddy(memoria_gb, eventos=self.eventos)
+        elif tipo_memoria == "paginada":
+            self.memoria = MemoriaPaginada(memoria_gb, entradas_tlb=entradas_tlb, asociatividad_tlb=asociatividad_tlb,
+                                           latencia_fallo_tlb=latencia_fallo_tlb, eventos=self.eventos)
+        elif tipo_memoria == "contigua":
+            self.memoria = Memoria(memoria_gb, politica=politica_memoria, eventos=self.eventos,
+                                   compactacion=compactacion)
+        else:
+            raise ValueError("Tipo de memoria no reconocido.")
+        # Swap opcional: con swap_gb > 0 los procesos listos pueden desalojarse de RAM
+        self.swap = GestorSwap(self.memoria, swap_gb, politica_swap) if swap_gb else None
+        self._traducir_direcciones = tipo_memoria == "paginada"
         self.planificador = Planificador()
         self.quantum = 2  # Quantum más corto para ver desalojos
         self.reloj_global = 0
+        self.tiempo_limite = tiempo_limite # None: simular hasta que no queden eventos pendientes
+        self.tiempo_compactacion = 0 # Tiempo total detenido moviendo bloques de memoria
         self.simulacion_activa = True
         
         # Listas para gestionar procesos
-        self.procesos_nuevos = []
-        self.cola_listos = []
+        self.procesos_nuevos = ColaLlegadas() # Aún no llegan, en orden de tiempo de llegada
+        # Ya llegaron pero no caben en memoria; orden_admision: "fifo", "menor_primero" o "mayor_que_cabe"
+        self.cola_admision = ColaAdmision(orden_admision)
+        # Con colas_por_nucleo cada núcleo tiene su propia cola y los núcleos ociosos roban trabajo
+        self.colas_por_nucleo = colas_por_nucleo
+        self.balanceo = balanceo
+        self.costo_migracion = costo_migracion
+        self.migraciones = 0
+        self.politica_planificacion = self.planificador.crear_algoritmo("SJF")
+        self.cola_listos = self._crear_cola_listos()
         self.procesos_terminados = []
+        # Con False los terminados solo quedan en las métricas en línea (memoria acotada con trazas largas)
+        self.conservar_terminados = conservar_terminados
+        self.metricas = MetricasSimulacion() # Retorno, respuesta y espera en línea de los terminados
+        self.procesos_suspendidos = collections.deque() # Procesos en swap esperando volver a RAM
+        self.procesos_en_transito = [] # Heap (tiempo_listo, orden, proceso) con E/S de swap en curso
+        self._orden_transito = itertools.count()
         
         # Algoritmo de planificación actual
         self.algoritmo_planificacion = "SJF"
 
     def agregar_proceso(self, proceso):
         """Agrega un proceso al sistema"""
+        self.procesos_nuevos.agregar(self._dar_de_alta(proceso))
+
+    def agregar_procesos(self, procesos):
+        """Agrega una carga completa de una vez (p. ej. una traza): se ordena una sola vez por llegada"""
+        self.procesos_nuevos.cargar([self._dar_de_alta(proceso) for proceso in procesos])
+
+    def agregar_traza(self, procesos):
+        """
+        Conecta una fuente perezosa de procesos ordenada por llegada (p. ej. trazas.leer_traza):
+        cada proceso se lee recién cuando el reloj se acerca a su llegada
+        """
+        self.procesos_nuevos.conectar(self._dar_de_alta(proceso) for proceso in procesos)
+
+    def _dar_de_alta(self, proceso):
         proceso.set_estado("nuevo")
-        self.procesos_nuevos.append(proceso)  # Cambiar cola_nuevos por procesos_nuevos
-        print(f"✅ Proceso {proceso.pid} agregado al sistema (Memoria: {proceso.tamano_memoria // (1024**2)}MB)")
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.NUEVO, pid=proceso.pid, memoria_mb=proceso.tamano_memoria // (1024**2))
+        return proceso
         
-    def configurar_algoritmo(self, algoritmo):
-        """Configura el algoritmo de planificación"""
+    def configurar_algoritmo(self, algoritmo, **opciones):
+        """
+        Configura el algoritmo de planificación. Las opciones se pasan a la cola de listos,
+        p. ej. configurar_algoritmo("MLFQ", quantums=(1, 2, 4), periodo_boost=20)
+        """
+        # Reconstruir la cola de listos con el orden del nuevo algoritmo
+        self.politica_planificacion = self.planificador.crear_algoritmo(algoritmo, **opciones)
+        self.cola_listos = self._crear_cola_listos(list(self.cola_listos))
         self.algoritmo_planificacion = algoritmo
-        print(f"🔧 Algoritmo de planificación establecido: {algoritmo}")
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.ALGORITMO, algoritmo=algoritmo)
         
     def set_quantum(self, quantum):
         self.quantum = quantum
@@ -45,56 +114,202 @@ class Simulador:
         self.simulacion_activa = False
         print("Simulación detenida.")
 
-    def paso_simulacion(self):        
-        # Por ahora solo incrementamos el reloj y terminamos rápido
+    def paso_simulacion(self):
+        """Avanza una unidad de tiempo (modo por ticks, el que usa la interfaz)"""
+        return self._paso(por_eventos=False)
+
+    def paso_evento(self):
+        """Avanza el reloj directamente hasta el siguiente evento"""
+        return self._paso(por_eventos=True)
+
+    def ejecutar(self, por_eventos=True):
+        """Simula hasta agotar los eventos (o llegar a tiempo_limite) y retorna las estadísticas"""
+        paso = self.paso_evento if por_eventos else self.paso_simulacion
+        while paso():
+            pass
+        return self.calcular_estadisticas()
+
+    def _paso(self, por_eventos):
         if not self.simulacion_activa:
             return False
         
-        print(f"⏰ Paso de simulación {self.reloj_global}")
+        self.eventos.tiempo = self.reloj_global
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.TICK)
+        self.cola_listos.al_avanzar_tiempo(self.reloj_global)
         
         # 1. Mover procesos de "nuevos" a "listos" si han llegado
         self._procesar_llegadas()
         
-        # 2. Planificar procesos en núcleos libres
+        # La compactación detiene todo el sistema mientras se mueven los bloques
+        costo_compactacion = self.memoria.tomar_tiempo_pendiente()
+        if costo_compactacion:
+            self.tiempo_compactacion += costo_compactacion
+            self.reloj_global += costo_compactacion
+            self.cpu.detener(costo_compactacion)
+            self.eventos.tiempo = self.reloj_global
+        
+        # 2. Planificar procesos en núcleos libres y expropiar si llegó un proceso mejor
         self.planificar_cpu()
+        self._expropiar()
         
-        # 3. NUEVO: Avanzar tiempo en CPU y verificar procesos terminados
-        self._avanzar_ejecucion()
+        # 3. Ejecutar hasta el siguiente evento (o una sola unidad en modo por ticks)
+        delta = self._tiempo_hasta_evento()
+        if delta is None:
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.FIN_SIMULACION, motivo="sin eventos pendientes")
+            return False
+        self._avanzar_ejecucion(delta if por_eventos else 1)
         
-        # Incrementar el reloj global
-        self.reloj_global += 1
+        # 4. Retirar de los núcleos los procesos que terminaron o agotaron su quantum
+        self._verificar_procesos_terminados()
         
-        # Ahora terminar después de 10 pasos para ver procesos terminando
-        if self.reloj_global >= 10:
-            print("🏁 Simulación terminada (10 pasos completados)")
+        if self.tiempo_limite is not None and self.reloj_global >= self.tiempo_limite:
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.FIN_SIMULACION, motivo=f"tiempo límite {self.tiempo_limite} alcanzado")
             return False
         
         return True
+
+    def _tiempo_hasta_evento(self):
+        """
+        Unidades de tiempo hasta el próximo instante en que puede cambiar alguna decisión
+        (llegada, fin de ráfaga, fin de quantum, fin de E/S de swap, boost o envejecimiento
+        de la cola, tiempo límite), o None si no queda ninguno
+        """
+        ahora = self.reloj_global
+        instantes = []
+        proxima_llegada = self.procesos_nuevos.proxima_llegada()
+        if proxima_llegada is not None:
+            instantes.append(proxima_llegada)
+        if self.procesos_en_transito:
+            instantes.append(self.procesos_en_transito[0][0])
+        if self.tiempo_limite is not None:
+            instantes.append(self.tiempo_limite)
+        if self._admision_pendiente():
+            instantes.append(ahora + 1)
+        
+        politica = self.politica_planificacion
+        quantums_restantes = [None] * self.cpu.num_nucleos
+        for i, proceso in enumerate(self.cpu.nucleos):
+            if proceso:
+                quantum = politica.quantum(proceso, self._cola_de_nucleo(i), self.quantum)
+                if quantum is not None:
+                    quantums_restantes[i] = quantum - proceso.tiempo_quantum_actual
+        desalojo = self.cpu.tiempo_hasta_desalojo(quantums_restantes)
+        if desalojo is not None:
+            instantes.append(ahora + desalojo)
+        
+        # Cambios que la cola produce por sí sola; solo importan si hay procesos compitiendo
+        if self.colas_por_nucleo:
+            grupos = [(self.cpu.colas[i], [p] if p else []) for i, p in enumerate(self.cpu.nucleos)]
+        else:
+            grupos = [(self.cola_listos, [p for p in self.cpu.nucleos if p])]
+        for cola, en_ejecucion in grupos:
+            if en_ejecucion:
+                instante = politica.proximo_evento(cola, en_ejecucion, ahora)
+                if instante is not None:
+                    instantes.append(instante)
+        
+        if not instantes:
+            return None
+        return max(1, min(instantes) - ahora)
        
-       
+
     def planificar_cpu(self):
         """Planifica procesos en núcleos libres usando el algoritmo seleccionado"""
         if not self.cola_listos:
             return
+        nucleos_libres = [i for i, nucleo in enumerate(self.cpu.nucleos) if nucleo is None]
+        if not nucleos_libres:
+            return
             
-        # Obtener procesos ordenados según el algoritmo
-        procesos_ordenados = self.planificador.planificar(self.cola_listos, self.algoritmo_planificacion)
+        if self.colas_por_nucleo:
+            # Cada núcleo libre toma de su cola o roba de la más cargada
+            for i in nucleos_libres:
+                proceso, migrado = self.cola_listos.extraer_para(i)
+                if proceso is None:
+                    break
+                if migrado and proceso.ultimo_nucleo is not None and proceso.ultimo_nucleo != i:
+                    # El proceso pierde la localidad de su núcleo anterior
+                    self.migraciones += 1
+                    self.cpu.penalizar(i, self.costo_migracion)
+                self._despachar(i, proceso)
+            return
+            
+        # Obtener (y extraer de la cola) un proceso por núcleo libre en una sola pasada
+        procesos_ordenados = self.planificador.planificar(self.cola_listos, self.algoritmo_planificacion,
+                                                          len(nucleos_libres))
         
         # Asignar procesos a núcleos libres
-        for i, nucleo in enumerate(self.cpu.nucleos):
-            if nucleo is None and procesos_ordenados:
-                proceso = procesos_ordenados.pop(0)
-                self.cpu.asignar_proceso(i, proceso)
-                proceso.set_estado("ejecutando")
-                proceso.reiniciar_quantum()  # Reiniciar quantum al asignar
-                self.cola_listos.remove(proceso)
-                print(f"🖥️  Proceso {proceso.pid} asignado al núcleo {i} (Algoritmo: {self.algoritmo_planificacion})")
+        for i, proceso in zip(nucleos_libres, procesos_ordenados):
+            self._despachar(i, proceso)
+
+    def _crear_cola_listos(self, procesos=()):
+        politica = self.politica_planificacion
+        if not self.colas_por_nucleo:
+            return politica.crear_cola(procesos)
+        self.cpu.colas = [politica.crear_cola() for _ in range(self.cpu.num_nucleos)]
+        cola = ColasPorNucleo(self.cpu.colas, self.cpu.nucleos, self.balanceo)
+        for proceso in procesos:
+            cola.agregar(proceso)
+        return cola
+
+    def _cola_de_nucleo(self, nucleo):
+        """Cola de listos a la que pertenece el núcleo"""
+        return self.cpu.colas[nucleo] if self.colas_por_nucleo else self.cola_listos
+
+    def _despachar(self, nucleo, proceso):
+        if proceso.tiempo_inicio_ejecucion < 0:
+            proceso.tiempo_inicio_ejecucion = self.reloj_global
+        proceso.ultimo_nucleo = nucleo
+        self.cpu.asignar_proceso(nucleo, proceso)
+        proceso.set_estado("ejecutando")
+        proceso.reiniciar_quantum()  # Reiniciar quantum al asignar
+        if self.swap:
+            self.swap.retirar_candidato(proceso)
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.DISPATCH, pid=proceso.pid, nucleo=nucleo,
+                                algoritmo=self.algoritmo_planificacion)
+
+    def _expropiar(self):
+        """En algoritmos expropiativos, cambia el peor proceso en ejecución por el mejor de la cola"""
+        if not self.politica_planificacion.expropiativo or not self.cola_listos:
+            return
+        if self.colas_por_nucleo:
+            # Cada núcleo solo compite con su propia cola
+            for i in range(self.cpu.num_nucleos):
+                self._expropiar_en(self.cpu.colas[i], (i,))
+        else:
+            self._expropiar_en(self.cola_listos, range(self.cpu.num_nucleos))
+
+    def _expropiar_en(self, cola, nucleos):
+        politica = self.politica_planificacion
+        while cola:
+            candidato = cola.ver_primero()
+            clave_candidato = politica.clave_expropiacion(candidato, cola)
+            peor = None
+            for i in nucleos:
+                proceso = self.cpu.nucleos[i]
+                if proceso:
+                    clave = politica.clave_expropiacion(proceso, cola)
+                    if peor is None or clave > peor[0]:
+                        peor = (clave, i)
+            if peor is None or clave_candidato >= peor[0]:
+                return
+            nucleo = peor[1]
+            expropiado = self.cpu.desalojar_proceso(nucleo)
+            self.cola_listos.quitar(candidato)
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.EXPROPIACION, pid=expropiado.pid, nucleo=nucleo, por=candidato.pid)
+            self._encolar_listo(expropiado)
+            self._despachar(nucleo, candidato)
 
     def mostrar_estado(self):
         """Muestra el estado actual del sistema"""
         if self.reloj_global % 5 == 0 or self.reloj_global < 3:
             print(f"\n--- Estado en tiempo {self.reloj_global + 1} ---")
-            print(f"Cola nuevos: {len(self.procesos_nuevos)} procesos")  # Cambiar cola_nuevos por procesos_nuevos
+            print(f"Cola nuevos: {len(self.procesos_nuevos) + len(self.cola_admision)} procesos")
             print(f"Cola listos: {len(self.cola_listos)} procesos")
             print(f"Ejecutando: {sum(1 for nucleo in self.cpu.nucleos if nucleo)} procesos")
             print(f"Terminados: {len(self.procesos_terminados)} procesos")
@@ -108,91 +323,211 @@ class Simulador:
 
     def calcular_estadisticas(self):
         """Calcula estadísticas del sistema"""
-        # Calcular todos los procesos del sistema
-        todos_los_procesos = (self.procesos_nuevos + self.cola_listos + 
-                             [p for p in self.cpu.nucleos if p] + self.procesos_terminados)
+        # Procesos del sistema que aún no terminaron (los terminados ya están en self.metricas)
+        sin_terminar = (list(self.procesos_nuevos) + list(self.cola_admision) + list(self.cola_listos) +
+                        [p for p in self.cpu.nucleos if p] +
+                        list(self.procesos_suspendidos) + [p for _, _, p in self.procesos_en_transito])
         
-        return {
-            "total_procesos": len(todos_los_procesos),
-            "procesos_nuevos": len(self.procesos_nuevos),
+        estadisticas = {
+            "total_procesos": len(sin_terminar) + self.metricas.terminados,
+            "procesos_nuevos": len(self.procesos_nuevos) + len(self.cola_admision),
             "procesos_listos": len(self.cola_listos),
             "procesos_ejecutando": sum(1 for nucleo in self.cpu.nucleos if nucleo),
-            "procesos_terminados": len(self.procesos_terminados),
+            "procesos_terminados": self.metricas.terminados,
             "tiempo_promedio_retorno": 0,
             "tiempo_promedio_respuesta": 0,
             "tiempo_promedio_espera": 0,
             "tiempo_total_simulacion": self.reloj_global
         }
+        metricas = self.metricas
+        if metricas.terminados:
+            estadisticas["tiempo_promedio_retorno"] = metricas.retorno.media
+            estadisticas["tiempo_promedio_respuesta"] = metricas.respuesta.media
+            estadisticas["tiempo_promedio_espera"] = metricas.espera.media
+            estadisticas["distribucion_retorno"] = metricas.retorno.como_dict()
+            estadisticas["distribucion_respuesta"] = metricas.respuesta.como_dict()
+            estadisticas["distribucion_espera"] = metricas.espera.como_dict()
+        if self.reloj_global:
+            estadisticas["throughput"] = metricas.terminados / self.reloj_global
+            estadisticas["utilizacion_nucleos"] = utilizacion_nucleos(self.cpu, self.reloj_global)
+        # Equidad de Jain sobre la CPU recibida por unidad de peso (nice) desde la llegada; las
+        # sumas de los terminados se acumulan al finalizar, conservar_terminados no las cambia
+        equidad = SumasJain().combinar(metricas.equidad)
+        for proceso in sin_terminar:
+            participacion = participacion_ponderada(proceso, self.reloj_global)
+            if participacion is not None:
+                equidad.agregar(participacion)
+        if equidad.n > 1:
+            estadisticas["indice_equidad_jain"] = equidad.indice
+        if self.swap:
+            estadisticas["procesos_suspendidos"] = len(self.procesos_suspendidos)
+            estadisticas["swap"] = self.swap.obtener_uso_swap()
+        if self.colas_por_nucleo:
+            estadisticas["robos"] = self.cola_listos.robos
+            estadisticas["migraciones"] = self.migraciones
+            estadisticas["tiempo_migracion"] = sum(self.cpu.tiempo_migracion)
+        if getattr(self.memoria, "compactacion", None):
+            uso = self.memoria.obtener_uso_memoria()
+            estadisticas["compactaciones"] = uso["compactaciones"]
+            estadisticas["bytes_movidos"] = uso["bytes_movidos"]
+            estadisticas["tiempo_compactacion"] = self.tiempo_compactacion
+        return estadisticas
     
     def _procesar_llegadas(self):
-        """Procesa los procesos que llegan en el tiempo actual"""
-        for proceso in list(self.procesos_nuevos):  # Cambiar cola_nuevos por procesos_nuevos
-            if proceso.tiempo_llegada <= self.reloj_global:
-                # Intentar asignar memoria
-                if self.memoria.asignar_memoria(proceso):
-                    # Mover a cola de listos
-                    proceso.set_estado("listo")
-                    self.cola_listos.append(proceso)
-                    self.procesos_nuevos.remove(proceso)  # Cambiar cola_nuevos por procesos_nuevos
-                    print(f"📋 Proceso {proceso.pid} movido a cola de listos (llegó en tiempo {proceso.tiempo_llegada})")
-                else:
-                    print(f"❌ No hay memoria suficiente para el proceso {proceso.pid}")
-    
-    def _avanzar_ejecucion(self):
-        """Avanza la ejecución de procesos en los núcleos y maneja desalojos"""
-        procesos_a_desalojar = []
+        """Procesa los procesos que llegan en el tiempo actual y admite los que esperan memoria"""
+        if self.swap:
+            self._procesar_swap()
+        llegados = self.procesos_nuevos.extraer_llegados(self.reloj_global)
+        for proceso in llegados:
+            self.cola_admision.agregar(proceso)
+        
+        # La cola solo se recorre si algo pudo cambiar: hay espacio para la solicitud más chica,
+        # o (con swap) llegaron procesos o cambiaron las víctimas posibles
+        reintentar_swap = self.swap is not None and (llegados or self.swap.hay_cambios())
+        if reintentar_swap:
+            candidatos = self.cola_admision.en_orden()
+        elif self._hay_espacio_para_admitir():
+            candidatos = self.cola_admision.en_orden(self.memoria.mayor_asignable)
+        else:
+            candidatos = ()
+        for proceso in candidatos:
+            latencia = 0
+            if proceso.tamano_memoria <= self.memoria.mayor_asignable:
+                asignado = self.memoria.asignar_memoria(proceso)
+            elif reintentar_swap:
+                # Desalojar procesos a swap hasta que quepa
+                asignado, latencia = self._hacer_espacio_con_swap(proceso)
+            else:
+                continue
+            if not asignado:
+                continue
+            self.cola_admision.quitar(proceso)
+            if latencia:
+                # El proceso espera a que termine el swap-out de sus víctimas
+                self._poner_en_transito(proceso, latencia)
+            else:
+                self._encolar_listo(proceso)
+            if self.eventos.activo:
+                self.eventos.emitir(TipoEvento.ARRIVAL, pid=proceso.pid, llegada=proceso.tiempo_llegada)
+        if reintentar_swap:
+            self.swap.marcar_revisado()
         
-        # Verificar procesos en ejecución ANTES de avanzar tiempo de CPU
+        if self.eventos.activo:
+            for proceso in llegados:
+                if proceso in self.cola_admision:
+                    self.eventos.emitir(TipoEvento.ALLOC_FALLIDA, pid=proceso.pid, tamano=proceso.tamano_memoria)
+    
+    def _hay_espacio_para_admitir(self):
+        minimo = self.cola_admision.tamano_minimo
+        return minimo is not None and minimo <= self.memoria.mayor_asignable
+    
+    def _admision_pendiente(self):
+        """Indica si en el paso siguiente puede admitirse o traerse de swap un proceso sin otro evento"""
+        if self._hay_espacio_para_admitir():
+            return True
+        if self.swap:
+            if self.procesos_suspendidos and \
+                    self.procesos_suspendidos[0].tamano_memoria <= self.memoria.mayor_asignable:
+                return True
+            if self.cola_admision and self.swap.hay_cambios():
+                if any(self._podria_hacer_espacio(proceso) for proceso in self.cola_admision.en_orden()):
+                    return True
+                # El reintento del paso siguiente fallaría igual: se da por hecho sin forzar ese paso
+                self.swap.marcar_revisado()
+        return False
+    
+    def _podria_hacer_espacio(self, proceso):
+        return proceso.tamano_memoria <= self.memoria.tamano_total and \
+            self.swap.planear_victimas(proceso) is not None
+    
+    def _encolar_listo(self, proceso):
+        """Pone un proceso residente en la cola de listos"""
+        proceso.set_estado("listo")
+        self.cola_listos.agregar(proceso)
+        if self.swap:
+            self.swap.registrar_candidato(proceso)
+    
+    def _poner_en_transito(self, proceso, latencia):
+        proceso.set_estado("esperando")
+        heapq.heappush(self.procesos_en_transito,
+                       (self.reloj_global + latencia, next(self._orden_transito), proceso))
+    
+    def _procesar_swap(self):
+        """Completa las E/S de swap vencidas y trae procesos suspendidos si caben en RAM"""
+        while self.procesos_en_transito and self.procesos_en_transito[0][0] <= self.reloj_global:
+            _, _, proceso = heapq.heappop(self.procesos_en_transito)
+            self._encolar_listo(proceso)
+        # Swap-in en orden FIFO; no se desaloja a nadie para traer un proceso de vuelta
+        while self.procesos_suspendidos and \
+                self.procesos_suspendidos[0].tamano_memoria <= self.memoria.mayor_asignable:
+            proceso = self.procesos_suspendidos[0]
+            latencia = self.swap.traer(proceso)
+            if latencia is None:
+                break
+            self.procesos_suspendidos.popleft()
+            self._poner_en_transito(proceso, latencia)
+    
+    def _hacer_espacio_con_swap(self, proceso):
+        """
+        Envía víctimas a swap para que el proceso quepa. Solo desaloja si el plan de
+        víctimas alcanza; si no, no mueve a nadie. Retorna (asignado, latencia_total)
+        """
+        if proceso.tamano_memoria > self.memoria.tamano_total:
+            return False, 0
+        victimas = self.swap.planear_victimas(proceso)
+        if victimas is None:
+            return False, 0
+        latencia_total = 0
+        for victima in victimas:
+            self.cola_listos.quitar(victima)
+            latencia_total += self.swap.desalojar(victima)
+            victima.set_estado("suspendido")
+            self.procesos_suspendidos.append(victima)
+        return self.memoria.asignar_memoria(proceso), latencia_total
+    
+    def _avanzar_ejecucion(self, delta=1):
+        """Ejecuta 'delta' unidades de tiempo en todos los núcleos y adelanta el reloj"""
+        politica = self.politica_planificacion
         for i, proceso in enumerate(self.cpu.nucleos):
             if proceso:
-                # Incrementar quantum ANTES de verificar terminación
-                proceso.tiempo_quantum_actual += 1
-                
-                if proceso.tiempo_restante <= 0:
-                    # Proceso terminó completamente
-                    print(f"🔓 Liberando memoria del proceso {proceso.pid}")
-                    self.memoria.liberar_memoria(proceso)
-                    print(f"🏁 Proceso {proceso.pid} terminado y liberado del núcleo {i}")
-                    proceso.set_estado("terminado")
-                    self.procesos_terminados.append(proceso)
-                    procesos_a_desalojar.append((i, None))
-                    
-                elif (self.algoritmo_planificacion == "RR" and 
-                      proceso.tiempo_quantum_actual >= self.quantum):
-                    # Desalojo por quantum en Round Robin
-                    print(f"⏰ Proceso {proceso.pid} desalojado por quantum (quantum={self.quantum})")
-                    proceso.reiniciar_quantum()
-                    proceso.set_estado("listo")
-                    self.cola_listos.append(proceso)
-                    procesos_a_desalojar.append((i, None))
-        
-        # Avanzar tiempo de CPU DESPUÉS de verificar quantum
-        self.cpu.avanzar_tiempo(1)
-        
-        # Ejecutar desalojos
-        for nucleo, _ in procesos_a_desalojar:
-            self.cpu.desalojar_proceso(nucleo)
+                proceso.tiempo_quantum_actual += delta
+                proceso.ultimo_tiempo_ejecucion = self.reloj_global + delta - 1
+                politica.al_ejecutar(proceso, self._cola_de_nucleo(i), delta)
+                if self._traducir_direcciones:
+                    self.memoria.acceder(proceso, delta)
+        self.cpu.avanzar_tiempo(delta)
+        self.reloj_global += delta
+        self.eventos.tiempo = self.reloj_global
                 
     def _verificar_procesos_terminados(self):
-        """Verifica y procesa procesos que han terminado"""
-        for i in range(self.cpu.num_nucleos):
-            proceso = self.cpu.get_proceso_en_nucleo(i)
-            if proceso and proceso.tiempo_restante <= 0:
-                # Usar el método de CPU para desalojar
-                proceso_terminado = self.cpu.desalojar_proceso(i)
-                
-                # Actualizar estado usando el método del proceso
-                proceso_terminado.set_estado("Terminado")
-                proceso_terminado.tiempo_finalizacion = self.reloj_global
-                
-                # Actualizar listas del simulador
-                self.procesos_terminados.append(proceso_terminado)
-                self.procesos_ejecutando.remove(proceso_terminado)
-                
-                # Usar el método de memoria para liberar
-                self.memoria.liberar_memoria(proceso_terminado)
-                
-                print(f"🏁 Proceso {proceso_terminado.pid} terminado y liberado del núcleo {i}")
+        """Libera los núcleos cuyo proceso terminó o agotó su quantum"""
+        politica = self.politica_planificacion
+        for i, proceso in enumerate(self.cpu.nucleos):
+            if not proceso:
+                continue
+            if proceso.tiempo_restante <= 0:
+                # Proceso terminó completamente
+                self.cpu.desalojar_proceso(i)
+                proceso.tiempo_finalizacion = self.reloj_global
+                self.memoria.liberar_memoria(proceso)
+                if self.eventos.activo:
+                    self.eventos.emitir(TipoEvento.FINISH, pid=proceso.pid, nucleo=i)
+                proceso.set_estado("terminado")
+                if self.conservar_terminados:
+                    self.procesos_terminados.append(proceso)
+                self.metricas.al_terminar(proceso, participacion_ponderada(proceso, self.reloj_global))
+                continue
+            
+            # Desalojo por quantum (Round Robin, MLFQ, lotería, stride, CFS...)
+            cola = self._cola_de_nucleo(i)
+            quantum = politica.quantum(proceso, cola, self.quantum)
+            if quantum is not None and proceso.tiempo_quantum_actual >= quantum:
+                self.cpu.desalojar_proceso(i)
+                if self.eventos.activo:
+                    self.eventos.emitir(TipoEvento.PREEMPT, pid=proceso.pid, nucleo=i, quantum=quantum)
+                politica.al_agotar_quantum(proceso, cola)
+                proceso.reiniciar_quantum()
+                self._encolar_listo(proceso)
     
     def set_algoritmo_planificacion(self, algoritmo):
         """Configura el algoritmo de planificación (método alternativo)"""
@@ -0,0 +1,247 @@
+import numpy as np
+
+from proceso import Proceso
+
+# Estados de cada proceso en los arreglos del lote
+NUEVO, ESPERANDO_MEMORIA, LISTO, EJECUTANDO, TERMINADO = range(5)
+
+ALGORITMOS_LOTE = {"FCFS": "FCFS", "SJF": "SJF", "RR": "RR", "Round Robin": "RR"}
+
+_INFINITO = np.iinfo(np.int64).max
+
+
+class SimuladorLotes:
+    """
+    Simula miles de cargas independientes a la vez sobre arreglos de NumPy.
+
+    Cada carga es una fila y cada proceso una columna de arreglos (llegada,
+    ráfaga, tiempo restante, páginas, estado...); todas las cargas avanzan
+    juntas con operaciones vectorizadas, saltando el reloj hasta el próximo
+    evento de cualquiera de ellas. Reproduce las métricas por proceso de
+    Simulador con FCFS, SJF o RR y memoria paginada (tipo_memoria="paginada"),
+    sin swap ni colas por núcleo. Las cargas con menos procesos se rellenan
+    con columnas marcadas como no válidas.
+    """
+
+    def __init__(self, llegadas, duraciones, tamanos, algoritmo="FCFS", num_nucleos=2, quantum=2,
+                 memoria_gb=2, tamano_pagina=4096, tiempo_limite=None, validos=None):
+        if algoritmo not in ALGORITMOS_LOTE:
+            raise ValueError(f"Algoritmo no soportado en lotes: {algoritmo}")
+        self.algoritmo = ALGORITMOS_LOTE[algoritmo]
+        self.llegada = np.array(llegadas, dtype=np.int64, ndmin=2)
+        self.duracion = np.array(duraciones, dtype=np.int64, ndmin=2)
+        tamanos = np.array(tamanos, dtype=np.int64, ndmin=2)
+        if not self.llegada.shape == self.duracion.shape == tamanos.shape:
+            raise ValueError("Llegadas, duraciones y tamaños deben tener la misma forma (cargas, procesos).")
+        self.valido = (np.ones(self.llegada.shape, dtype=bool) if validos is None
+                       else np.array(validos, dtype=bool, ndmin=2))
+        self.num_cargas, self.num_procesos = self.llegada.shape
+        self.num_nucleos = num_nucleos
+        self.quantum = quantum
+        self.tiempo_limite = tiempo_limite
+        self.paginas = np.maximum(1, -(-tamanos // tamano_pagina))
+        self.marcos_libres = np.full(self.num_cargas, int(memoria_gb * 1024 ** 3) // tamano_pagina, dtype=np.int64)
+
+        forma = self.llegada.shape
+        self.estado = np.where(self.valido, NUEVO, TERMINADO).astype(np.int8)
+        self.tiempo_restante = self.duracion.copy()
+        self.tiempo_en_cpu = np.zeros(forma, dtype=np.int64)
+        self.tiempo_inicio_ejecucion = np.full(forma, -1, dtype=np.int64)
+        self.tiempo_finalizacion = np.full(forma, -1, dtype=np.int64)
+        self.tiempo_quantum_actual = np.zeros(forma, dtype=np.int64)
+        self._clave = np.zeros(forma, dtype=np.int64)     # Tiempo restante al encolar (SJF)
+        self._orden = np.zeros(forma, dtype=np.int64)     # Orden de encolado; desempata como las colas
+        self._contador = np.zeros(self.num_cargas, dtype=np.int64)
+        # Orden de admisión (llegada, orden de alta), igual que ColaLlegadas + ColaAdmision "fifo"
+        self._por_llegada = np.argsort(np.where(self.valido, self.llegada, _INFINITO), axis=1, kind="stable")
+
+        self.nucleos = np.full((self.num_cargas, num_nucleos), -1, dtype=np.int64)  # Columna del proceso o -1
+        self.tiempo_ocioso = np.zeros((self.num_cargas, num_nucleos), dtype=np.int64)
+        self.reloj_global = 0
+        self.reloj_final = np.zeros(self.num_cargas, dtype=np.int64)  # Reloj de cada carga al terminar
+        self.activa = np.ones(self.num_cargas, dtype=bool)
+        self._filas = np.arange(self.num_cargas)
+
+    @classmethod
+    def desde_procesos(cls, cargas, **opciones):
+        """Construye el lote a partir de listas de Proceso (una lista por carga)"""
+        cargas = [list(carga) for carga in cargas]
+        ancho = max((len(carga) for carga in cargas), default=0)
+        forma = (len(cargas), ancho)
+        llegadas, duraciones, tamanos = np.zeros(forma, np.int64), np.ones(forma, np.int64), np.ones(forma, np.int64)
+        validos = np.zeros(forma, dtype=bool)
+        for i, carga in enumerate(cargas):
+            n = len(carga)
+            llegadas[i, :n] = [p.tiempo_llegada for p in carga]
+            duraciones[i, :n] = [p.duracion for p in carga]
+            tamanos[i, :n] = [p.tamano_memoria for p in carga]
+            validos[i, :n] = True
+        return cls(llegadas, duraciones, tamanos, validos=validos, **opciones)
+
+    def ejecutar(self):
+        """Simula todas las cargas hasta agotar sus eventos (o tiempo_limite) y retorna las estadísticas"""
+        while self.paso():
+            pass
+        return self.calcular_estadisticas()
+
+    def paso(self):
+        """Avanza todas las cargas activas hasta el próximo evento de alguna. Retorna False al terminar"""
+        if not self.activa.any():
+            return False
+        self._procesar_llegadas()
+        self._planificar_cpu()
+
+        delta = self._tiempo_hasta_evento()
+        if delta is None:
+            return False
+        self._avanzar_ejecucion(delta)
+        self._verificar_procesos_terminados()
+
+        if self.tiempo_limite is not None and self.reloj_global >= self.tiempo_limite:
+            self.reloj_final[self.activa] = self.reloj_global
+            self.activa[:] = False
+            return False
+        return True
+
+    def _procesar_llegadas(self):
+        """Pasa a espera de memoria los procesos que llegaron y admite, en orden de llegada, los que caben"""
+        llegados = (self.estado == NUEVO) & (self.llegada <= self.reloj_global)
+        self.estado[llegados] = ESPERANDO_MEMORIA
+        if not self._hay_espacio_para_admitir().any():
+            return
+        esperando = np.take_along_axis(self.estado, self._por_llegada, axis=1) == ESPERANDO_MEMORIA
+        # Un solo recorrido por posición de llegada, para todas las cargas a la vez
+        for posicion in np.flatnonzero(esperando.any(axis=0)):
+            columna = self._por_llegada[:, posicion]
+            paginas = self.paginas[self._filas, columna]
+            admitir = esperando[:, posicion] & (paginas <= self.marcos_libres)
+            if not admitir.any():
+                continue
+            filas, columna = self._filas[admitir], columna[admitir]
+            self.marcos_libres[filas] -= paginas[admitir]
+            self._encolar_listo(filas, columna)
+
+    def _hay_espacio_para_admitir(self):
+        """Por carga: algún proceso en espera de memoria cabe en los marcos libres"""
+        return ((self.estado == ESPERANDO_MEMORIA) & (self.paginas <= self.marcos_libres[:, None])).any(axis=1)
+
+    def _encolar_listo(self, filas, columnas):
+        self.estado[filas, columnas] = LISTO
+        self._clave[filas, columnas] = self.tiempo_restante[filas, columnas] if self.algoritmo == "SJF" else 0
+        self._orden[filas, columnas] = self._contador[filas]
+        self._contador[filas] += 1
+
+    def _planificar_cpu(self):
+        """Cada núcleo libre, en orden, toma el primero de la cola (menor clave y luego menor orden)"""
+        for nucleo in range(self.num_nucleos):
+            listos = self.estado == LISTO
+            tomar = (self.nucleos[:, nucleo] < 0) & listos.any(axis=1)
+            if not tomar.any():
+                continue
+            clave = np.where(listos, self._clave, _INFINITO)
+            primeros = listos & (clave == clave.min(axis=1, keepdims=True))
+            columna = np.argmin(np.where(primeros, self._orden, _INFINITO), axis=1)
+            filas, columna = self._filas[tomar], columna[tomar]
+            self.nucleos[filas, nucleo] = columna
+            self.estado[filas, columna] = EJECUTANDO
+            sin_iniciar = self.tiempo_inicio_ejecucion[filas, columna] < 0
+            self.tiempo_inicio_ejecucion[filas[sin_iniciar], columna[sin_iniciar]] = self.reloj_global
+            self.tiempo_quantum_actual[filas, columna] = 0
+
+    def _tiempo_hasta_evento(self):
+        """
+        Unidades hasta el próximo evento de cualquier carga activa (llegada, fin de ráfaga,
+        fin de quantum, admisión pendiente, tiempo límite). Las cargas sin eventos terminan
+        aquí; retorna None si ya no queda ninguna
+        """
+        ahora = self.reloj_global
+        horizonte = np.where(self.estado == NUEVO, self.llegada, _INFINITO).min(axis=1)
+        ocupados = self.nucleos >= 0
+        columnas = np.where(ocupados, self.nucleos, 0)
+        restante = np.take_along_axis(self.tiempo_restante, columnas, axis=1)
+        if self.algoritmo == "RR":
+            restante = np.minimum(restante, self.quantum - np.take_along_axis(self.tiempo_quantum_actual, columnas, axis=1))
+        horizonte = np.minimum(horizonte, np.where(ocupados, ahora + restante, _INFINITO).min(axis=1))
+        horizonte[self._hay_espacio_para_admitir()] = ahora + 1
+        if self.tiempo_limite is not None:
+            horizonte = np.minimum(horizonte, self.tiempo_limite)
+
+        sin_eventos = self.activa & (horizonte == _INFINITO)
+        self.reloj_final[sin_eventos] = ahora
+        self.activa &= ~sin_eventos
+        if not self.activa.any():
+            return None
+        return max(1, int(horizonte[self.activa].min()) - ahora)
+
+    def _avanzar_ejecucion(self, delta):
+        """Ejecuta 'delta' unidades en todos los núcleos de las cargas activas y adelanta el reloj"""
+        ocupados = self.nucleos >= 0
+        filas, nucleos = np.nonzero(ocupados)
+        columnas = self.nucleos[filas, nucleos]
+        self.tiempo_restante[filas, columnas] -= delta
+        self.tiempo_en_cpu[filas, columnas] += delta
+        self.tiempo_quantum_actual[filas, columnas] += delta
+        self.tiempo_ocioso[~ocupados & self.activa[:, None]] += delta
+        self.reloj_global += delta
+
+    def _verificar_procesos_terminados(self):
+        """Libera, núcleo por núcleo, los procesos que terminaron o agotaron su quantum"""
+        for nucleo in range(self.num_nucleos):
+            columna = self.nucleos[:, nucleo]
+            ocupado = columna >= 0
+            if not ocupado.any():
+                continue
+            filas, columna = self._filas[ocupado], columna[ocupado]
+            termino = self.tiempo_restante[filas, columna] <= 0
+            f, c = filas[termino], columna[termino]
+            self.estado[f, c] = TERMINADO
+            self.tiempo_finalizacion[f, c] = self.reloj_global
+            self.marcos_libres[f] += self.paginas[f, c]
+            self.nucleos[f, nucleo] = -1
+            if self.algoritmo == "RR":
+                agotado = ~termino & (self.tiempo_quantum_actual[filas, columna] >= self.quantum)
+                f, c = filas[agotado], columna[agotado]
+                self.nucleos[f, nucleo] = -1
+                self.tiempo_quantum_actual[f, c] = 0
+                self._encolar_listo(f, c)
+
+    def calcular_estadisticas(self):
+        """Estadísticas por carga (arreglos de longitud num_cargas), con las claves de Simulador"""
+        terminados = (self.estado == TERMINADO) & self.valido
+        cantidad = terminados.sum(axis=1)
+        divisor = np.maximum(cantidad, 1)
+        retorno = np.where(terminados, self.tiempo_finalizacion - self.llegada, 0).sum(axis=1)
+        respuesta = np.where(terminados, self.tiempo_inicio_ejecucion - self.llegada, 0).sum(axis=1)
+        duracion = np.where(terminados, self.duracion, 0).sum(axis=1)
+        return {
+            "total_procesos": self.valido.sum(axis=1),
+            "procesos_nuevos": ((self.estado == NUEVO) | (self.estado == ESPERANDO_MEMORIA)).sum(axis=1),
+            "procesos_listos": (self.estado == LISTO).sum(axis=1),
+            "procesos_ejecutando": (self.nucleos >= 0).sum(axis=1),
+            "procesos_terminados": cantidad,
+            "tiempo_promedio_retorno": retorno / divisor,
+            "tiempo_promedio_respuesta": respuesta / divisor,
+            "tiempo_promedio_espera": (retorno - duracion) / divisor,
+            "tiempo_total_simulacion": np.where(self.activa, self.reloj_global, self.reloj_final),
+        }
+
+    def estadisticas_de(self, carga):
+        """Estadísticas de una sola carga como diccionario de números de Python"""
+        return {clave: valores[carga].item() for clave, valores in self.calcular_estadisticas().items()}
+
+
+def generar_cargas(num_cargas, num_procesos, semilla=None, llegada_maxima=60, duracion_maxima=12,
+                   tamano_maximo_mb=300):
+    """Cargas aleatorias como arreglos (llegadas, duraciones, tamaños) de forma (num_cargas, num_procesos)"""
+    rng = np.random.default_rng(semilla)
+    forma = (num_cargas, num_procesos)
+    llegadas = rng.integers(0, llegada_maxima, forma)
+    duraciones = rng.integers(1, duracion_maxima + 1, forma)
+    tamanos = rng.integers(1, tamano_maximo_mb + 1, forma) * 1024 * 1024
+    return llegadas, duraciones, tamanos
+
+
+def procesos_de_carga(llegadas, duraciones, tamanos):
+    """Convierte una fila de arreglos en objetos Proceso (pid = columna + 1) para Simulador"""
+    return [Proceso(pid, int(llegada), int(duracion), int(tamano))
+            for pid, (llegada, duracion, tamano) in enumerate(zip(llegadas, duraciones, tamanos), start=1)]
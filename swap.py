@@ -0,0 +1,223 @@
+import heapq
+import itertools
+
+from eventos import TipoEvento
+
+MB = 1024 * 1024
+
+
+class GestorSwap:
+    """
+    Espacio de intercambio (swap) acotado asociado a una Memoria.
+
+    Los procesos candidatos a ser desalojados (residentes y listos, no en CPU)
+    se mantienen en un heap ordenado según la política de víctima, con borrado
+    perezoso, de modo que elegir una víctima cuesta O(log n). Cada operación
+    devuelve su latencia en unidades de tiempo simulado.
+
+    Políticas de víctima:
+      - "lru": el proceso que lleva más tiempo sin ejecutarse
+      - "mayor": el proceso que ocupa más memoria
+      - "prioridad": el proceso de menor prioridad (mayor valor de 'prioridad')
+
+    Histéresis: un proceso traído desde swap no vuelve a ser candidato hasta
+    que pasa por la CPU, así no rebota entre RAM y swap sin avanzar.
+
+    hay_cambios() indica si desde el último marcar_revisado() cambió algo que
+    pueda alterar un plan de víctimas (el conjunto de candidatos, la ocupación del
+    swap o la memoria libre); si no, reintentar hacer espacio fallaría igual.
+    """
+
+    POLITICAS_VICTIMA = ("lru", "mayor", "prioridad")
+
+    def __init__(self, memoria, capacidad_gb=4, politica_victima="lru",
+                 latencia_fija=1, latencia_por_mb=0.01):
+        if politica_victima not in self.POLITICAS_VICTIMA:
+            raise ValueError(f"Política de víctima no reconocida: {politica_victima}")
+        self.memoria = memoria
+        self.capacidad = int(capacidad_gb * 1024 * 1024 * 1024)
+        self.politica_victima = politica_victima
+        self.latencia_fija = latencia_fija
+        self.latencia_por_mb = latencia_por_mb
+        self.eventos = memoria.eventos
+        memoria.swap = self
+
+        self.procesos_en_swap = {}  # pid -> proceso
+        self._ocupado = 0
+        self._candidatos = []       # heap de (clave, orden, pid, version, proceso)
+        self._version = {}          # pid -> versión vigente en el heap
+        self._orden = itertools.count()
+        self._recien_traidos = set()  # PIDs traídos de swap que aún no pasaron por la CPU
+        # Estado del último reintento: candidatos de entonces, cuántos PIDs difieren de
+        # ellos ahora (diferencia simétrica), y ocupación del swap y memoria libre
+        self._revisados = None
+        self._diferencia = 0
+        self._ocupado_revisado = None
+        self._libre_revisado = None
+
+        # Estadísticas
+        self.swap_outs = 0
+        self.swap_ins = 0
+        self.bytes_out = 0
+        self.bytes_in = 0
+        self.tiempo_total = 0
+        self.pico_ocupado = 0
+
+    # --- Candidatos a víctima ---
+
+    def registrar_candidato(self, proceso):
+        """Marca un proceso residente como desalojable (o actualiza su clave)"""
+        if proceso.pid in self._recien_traidos:
+            return
+        if proceso.pid not in self._version:
+            self._al_cambiar_candidato(proceso.pid, entra=True)
+        # La versión es única en todo el heap: una entrada vieja nunca revive tras retirar y registrar
+        version = next(self._orden)
+        self._version[proceso.pid] = version
+        heapq.heappush(self._candidatos, (self._clave(proceso), version, proceso.pid, version, proceso))
+        # Compactar el heap cuando las entradas obsoletas dominan
+        if len(self._candidatos) > 2 * len(self._version) + 64:
+            self._candidatos = [e for e in self._candidatos if self._version.get(e[2]) == e[3]]
+            heapq.heapify(self._candidatos)
+
+    def retirar_candidato(self, proceso):
+        """El proceso deja de ser desalojable (pasa a CPU, termina o sale a swap)"""
+        self._recien_traidos.discard(proceso.pid)
+        if proceso.pid in self._version:
+            del self._version[proceso.pid]
+            self._al_cambiar_candidato(proceso.pid, entra=False)
+
+    def _al_cambiar_candidato(self, pid, entra):
+        if self._revisados is not None:
+            # Volver al conjunto revisado acerca ambos conjuntos; cualquier otro cambio los aleja
+            self._diferencia += -1 if (pid in self._revisados) == entra else 1
+
+    def marcar_revisado(self):
+        """Registra el estado con el que se acaba de reintentar hacer espacio"""
+        self._revisados = set(self._version)
+        self._diferencia = 0
+        self._ocupado_revisado = self._ocupado
+        self._libre_revisado = self.memoria.memoria_libre
+
+    def hay_cambios(self):
+        """Indica si un plan de víctimas podría dar otro resultado que en el último reintento"""
+        return (self._revisados is None or self._diferencia != 0 or self._ocupado != self._ocupado_revisado
+                or self.memoria.memoria_libre != self._libre_revisado)
+
+    def ver_victima(self):
+        """Víctima que elegiría elegir_victima, sin quitarla (None si no hay candidatos)"""
+        while self._candidatos:
+            _, _, pid, version, proceso = self._candidatos[0]
+            if self._version.get(pid) == version:
+                return proceso
+            heapq.heappop(self._candidatos)
+        return None
+
+    def elegir_victima(self):
+        """Extrae la víctima según la política, o None si no hay candidatos"""
+        proceso = self.ver_victima()
+        if proceso is not None:
+            heapq.heappop(self._candidatos)
+            self.retirar_candidato(proceso)
+        return proceso
+
+    def hay_candidatos(self):
+        return bool(self._version)
+
+    def planear_victimas(self, proceso):
+        """
+        Víctimas, en el orden de la política, cuyo desalojo alcanza para que 'proceso'
+        quepa en RAM, sin desalojarlas todavía. Se sacan del heap de a una, con un
+        chequeo incremental (memoria.planear_liberacion), y después se devuelven al heap.
+        Retorna None si ni desalojando todas las que caben en swap se haría lugar: en
+        ese caso no conviene mover a nadie
+        """
+        liberaria = self.memoria.planear_liberacion(proceso.tamano_memoria)
+        sacadas = []
+        victimas = []
+        ocupado = self._ocupado
+        plan = None
+        while self._candidatos:
+            entrada = heapq.heappop(self._candidatos)
+            if self._version.get(entrada[2]) != entrada[3]:
+                continue  # Entrada obsoleta: se descarta
+            sacadas.append(entrada)
+            victima = entrada[4]
+            if ocupado + victima.tamano_memoria > self.capacidad:
+                # Sin espacio en el dispositivo de swap para la siguiente víctima
+                break
+            victimas.append(victima)
+            ocupado += victima.tamano_memoria
+            if liberaria(victima):
+                plan = victimas
+                break
+        for entrada in sacadas:
+            heapq.heappush(self._candidatos, entrada)
+        return plan
+
+    # --- Operaciones de intercambio ---
+
+    def cabe(self, proceso):
+        return self._ocupado + proceso.tamano_memoria <= self.capacidad
+
+    def desalojar(self, proceso):
+        """Mueve un proceso de RAM a swap. Retorna la latencia del swap-out"""
+        self.retirar_candidato(proceso)
+        self.memoria.liberar_memoria(proceso)
+        self.procesos_en_swap[proceso.pid] = proceso
+        self._ocupado += proceso.tamano_memoria
+        self.pico_ocupado = max(self.pico_ocupado, self._ocupado)
+        self.swap_outs += 1
+        self.bytes_out += proceso.tamano_memoria
+        latencia = self.latencia(proceso)
+        self.tiempo_total += latencia
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.SWAP_OUT, pid=proceso.pid, tamano=proceso.tamano_memoria, latencia=latencia)
+        return latencia
+
+    def traer(self, proceso):
+        """Intenta mover un proceso de swap a RAM. Retorna la latencia, o None si no cabe en memoria"""
+        if not self.memoria.asignar_memoria(proceso):
+            return None
+        del self.procesos_en_swap[proceso.pid]
+        self._ocupado -= proceso.tamano_memoria
+        self._recien_traidos.add(proceso.pid)
+        self.swap_ins += 1
+        self.bytes_in += proceso.tamano_memoria
+        latencia = self.latencia(proceso)
+        self.tiempo_total += latencia
+        if self.eventos.activo:
+            self.eventos.emitir(TipoEvento.SWAP_IN, pid=proceso.pid, tamano=proceso.tamano_memoria, latencia=latencia)
+        return latencia
+
+    def descartar(self, proceso):
+        """Elimina un proceso del swap sin traerlo a memoria"""
+        if self.procesos_en_swap.pop(proceso.pid, None) is not None:
+            self._ocupado -= proceso.tamano_memoria
+    
+    def latencia(self, proceso):
+        """Costo en tiempo simulado de mover el proceso entre RAM y swap"""
+        return self.latencia_fija + int(round(proceso.tamano_memoria / MB * self.latencia_por_mb))
+
+    def obtener_uso_swap(self):
+        """Retorna estadísticas de uso del swap"""
+        return {
+            'total': self.capacidad,
+            'ocupada': self._ocupado,
+            'libre': self.capacidad - self._ocupado,
+            'porcentaje_uso': (self._ocupado / self.capacidad) * 100 if self.capacidad else 0,
+            'procesos_en_swap': len(self.procesos_en_swap),
+            'pico_ocupado': self.pico_ocupado,
+            'swap_outs': self.swap_outs,
+            'swap_ins': self.swap_ins,
+            'bytes_out': self.bytes_out,
+            'bytes_in': self.bytes_in,
+            'tiempo_total': self.tiempo_total,
+        }
+
+    def _clave(self, proceso):
+        if self.politica_victima == "lru":
+            return proceso.ultimo_tiempo_ejecucion
+        if self.politica_victima == "mayor":
+            return -proceso.tamano_memoria
+        return -proceso.prioridad
@@ -0,0 +1,102 @@
+from array import array
+
+from bloque_memoria import BloqueMemoria
+
+# Bits de la columna 'flags'
+EN_USO = 1   # La fila contiene un bloque (si no, está en la lista de filas libres)
+OCUPADO = 2  # El bloque está asignado a un proceso
+
+
+class TablaBloques:
+    """
+    Tabla de bloques en columnas paralelas (struct-of-arrays).
+
+    Cada bloque es una fila identificada por un entero; sus campos numéricos
+    viven en arrays de tipos fijos (id, inicio, tamaño, flags), de modo que un
+    bloque no crea ningún objeto Python ni __dict__. El PID va en una lista
+    común porque puede ser de cualquier tipo (la interfaz usa "P1", "P2"...).
+    Las filas liberadas se apilan en una lista de filas libres y se reutilizan
+    antes de crecer.
+
+    Cada fila tiene a lo sumo una vista BloqueMemoria, que se crea al pedirla
+    y se desvincula al quitar la fila: una vista guardada por quien llama
+    nunca lee los datos del bloque que reutilice su fila.
+    """
+
+    def __init__(self):
+        self.id = array("q")
+        self.inicio = array("q")
+        self.tamano = array("q")
+        self.pid = []  # Cualquier valor hashable, o None si el bloque está libre
+        self.flags = array("B")
+        self._vistas = []  # Vista BloqueMemoria de cada fila, o None si nadie la pidió
+        self._filas_libres = array("I")
+
+    def __len__(self):
+        """Número de filas en uso"""
+        return len(self.flags) - len(self._filas_libres)
+
+    @property
+    def capacidad(self):
+        return len(self.flags)
+
+    def agregar(self, id_bloque, inicio, tamano, ocupado=False, pid_proceso=None):
+        """Guarda un bloque y retorna su número de fila"""
+        flags = EN_USO | (OCUPADO if ocupado else 0)
+        pid = pid_proceso
+        if self._filas_libres:
+            fila = self._filas_libres.pop()
+            self.id[fila] = id_bloque
+            self.inicio[fila] = inicio
+            self.tamano[fila] = tamano
+            self.pid[fila] = pid
+            self.flags[fila] = flags
+        else:
+            fila = len(self.flags)
+            self.id.append(id_bloque)
+            self.inicio.append(inicio)
+            self.tamano.append(tamano)
+            self.pid.append(pid)
+            self.flags.append(flags)
+            self._vistas.append(None)
+        return fila
+
+    def quitar(self, fila):
+        """Marca la fila como libre para reutilizarla"""
+        if not self.flags[fila] & EN_USO:
+            raise KeyError(fila)
+        vista = self._vistas[fila]
+        if vista is not None:
+            vista.desvincular()
+            self._vistas[fila] = None
+        self.flags[fila] = 0
+        self.pid[fila] = None
+        self._filas_libres.append(fila)
+
+    def vista(self, fila):
+        """Vista de la fila; siempre el mismo objeto mientras la fila siga en uso"""
+        if not self.flags[fila] & EN_USO:
+            raise KeyError(fila)
+        vista = self._vistas[fila]
+        if vista is None:
+            vista = self._vistas[fila] = BloqueMemoria.vista(self, fila)
+        return vista
+
+    def filas(self):
+        """Filas en uso, en orden de fila"""
+        return (fila for fila, flags in enumerate(self.flags) if flags & EN_USO)
+
+    def esta_ocupado(self, fila):
+        return bool(self.flags[fila] & OCUPADO)
+
+    def marcar_ocupado(self, fila, ocupado):
+        if ocupado:
+            self.flags[fila] |= OCUPADO
+        else:
+            self.flags[fila] &= ~OCUPADO & 0xFF
+
+    def pid_de(self, fila):
+        return self.pid[fila]
+
+    def asignar_pid(self, fila, pid_proceso):
+        self.pid[fila] = pid_proceso
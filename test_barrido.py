@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Prueba del barrido de parámetros en paralelo
+"""
+
+import contextlib
+import csv
+import io
+import os
+import tempfile
+
+from barrido import (ejecutar_barrido, escribir_tabla, generar_configuraciones, resumir,
+                     simular_configuracion)
+
+def probar_grilla():
+    print("🔵 === PRUEBA 1: Producto de la grilla ===")
+    configuraciones = generar_configuraciones(("FCFS", "RR"), quantums=(2, 4), nucleos=(1, 2),
+                                              memorias_gb=(1, 2), semillas=range(3))
+    # FCFS no usa quantum: 2*2*3 configuraciones; RR: 2*2*2*3
+    assert len(configuraciones) == 12 + 24
+    assert {c["quantum"] for c in configuraciones if c["algoritmo"] == "FCFS"} == {None}
+    try:
+        generar_configuraciones(("Inexistente",))
+        assert False, "Debe rechazar algoritmos desconocidos"
+    except ValueError:
+        pass
+    print(f"   ✓ {len(configuraciones)} configuraciones")
+    print()
+
+def probar_paralelo_igual_a_secuencial():
+    print("🔵 === PRUEBA 2: En paralelo y en bloques da lo mismo que en secuencia ===")
+    configuraciones = generar_configuraciones(("SJF", "RR", "MLFQ"), quantums=(2, 3), nucleos=(1, 3),
+                                              semillas=range(4), num_procesos=15)
+    secuencial = [simular_configuracion(c) for c in configuraciones]
+    paralelo = list(ejecutar_barrido(configuraciones, max_procesos=3, tamano_bloque=5))
+    clave = lambda fila: tuple(str(fila[c]) for c in ("algoritmo", "quantum", "num_nucleos", "semilla"))
+    assert sorted(paralelo, key=clave) == sorted(secuencial, key=clave)
+    assert all(fila["procesos_terminados"] == 15 for fila in paralelo)
+    assert list(ejecutar_barrido([])) == []
+    salida = io.StringIO()
+    with contextlib.redirect_stdout(salida):
+        simular_configuracion(configuraciones[0])
+    assert salida.getvalue() == "", "Con el bus silencioso la simulación no escribe en la consola"
+    print(f"   ✓ {len(paralelo)} filas idénticas")
+    print()
+
+def probar_tabla():
+    print("🔵 === PRUEBA 3: Tabla consolidada y resumen ===")
+    configuraciones = generar_configuraciones(("FCFS", "SJF"), semillas=range(2), num_procesos=5)
+    filas = list(ejecutar_barrido(configuraciones, max_procesos=2))
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "barrido.csv")
+        assert escribir_tabla(filas, ruta) == 4
+        with open(ruta, newline="", encoding="utf-8") as archivo:
+            leidas = list(csv.DictReader(archivo))
+    assert [(f["algoritmo"], f["semilla"]) for f in leidas] == [("FCFS", "0"), ("FCFS", "1"), ("SJF", "0"), ("SJF", "1")]
+    promedios = resumir(filas)
+    assert set(promedios) == {("FCFS",), ("SJF",)}
+    print(f"   ✓ {len(leidas)} filas escritas; retorno promedio {promedios}")
+    print()
+
+if __name__ == "__main__":
+    probar_grilla()
+    probar_paralelo_igual_a_secuencial()
+    probar_tabla()
+    print("✅ === PRUEBAS COMPLETADAS ===")
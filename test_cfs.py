@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Prueba del planificador CFS: orden por vruntime, pesos nice, timeslice y equidad
+"""
+
+from cola_listos import ColaCFS, peso_nice
+from eventos import BusEventos
+from planificador import indice_jain
+from proceso import Proceso
+from simulador import Simulador
+
+def probar_orden_por_vruntime():
+    print("🔵 === PRUEBA 1: Despacho por menor vruntime ===")
+    cola = ColaCFS()
+    procesos = [Proceso(pid, 0, 10, 1024) for pid in range(1, 4)]
+    for proceso, vruntime in zip(procesos, (5.0, 1.0, 3.0)):
+        proceso.vruntime = vruntime
+        cola.agregar(proceso)
+    assert [p.pid for p in cola] == [2, 3, 1]
+    assert cola.extraer().pid == 2 and cola.min_vruntime == 1.0
+    assert cola.quitar(procesos[2]) and not cola.quitar(procesos[2])
+    assert cola.extraer().pid == 1 and cola.min_vruntime == 5.0
+
+    nuevo = Proceso(9, 0, 10, 1024)
+    cola.agregar(nuevo)
+    assert nuevo.vruntime == 5.0, "Un proceso nuevo entra en min_vruntime"
+    print("   ✓ Orden, borrado y min_vruntime correctos")
+    print()
+
+def probar_pesos_nice():
+    print("🔵 === PRUEBA 2: La CPU se reparte según el peso del nice ===")
+    cola = ColaCFS(latencia_objetivo=6, granularidad_minima=1)
+    normal, amable = Proceso(1, 0, 10**6, 1024, prioridad=0), Proceso(2, 0, 10**6, 1024, prioridad=5)
+    cola.agregar(normal)
+    cola.agregar(amable)
+    assert cola.timeslice(normal) == round(6 * 1024 / (1024 + 335))
+    for _ in range(3000):
+        proceso = cola.extraer()
+        tiempo = cola.timeslice(proceso)
+        proceso.actualizar_tiempo_restante(tiempo)
+        cola.cargar_ejecucion(proceso, tiempo)
+        cola.agregar(proceso)
+    proporcion = normal.tiempo_en_cpu / amable.tiempo_en_cpu
+    esperado = peso_nice(0) / peso_nice(5)
+    assert abs(proporcion - esperado) / esperado < 0.05, proporcion
+    ponderadas = [p.tiempo_en_cpu / peso_nice(p.prioridad) for p in (normal, amable)]
+    assert indice_jain(ponderadas) > 0.99
+    print(f"   ✓ Proporción de CPU {proporcion:.2f} (pesos {esperado:.2f}), Jain ponderado "
+          f"{indice_jain(ponderadas):.3f}")
+    print()
+
+def probar_simulador():
+    print("🔵 === PRUEBA 3: CFS dentro del simulador ===")
+    simulador = Simulador(num_nucleos=1, eventos=BusEventos())
+    simulador.configurar_algoritmo("CFS", latencia_objetivo=4)
+    for pid in range(1, 5):
+        simulador.agregar_proceso(Proceso(pid, 0, 100, 1024))
+    while simulador.paso_simulacion():
+        pass
+    estadisticas = simulador.calcular_estadisticas()
+    assert all(p.tiempo_en_cpu > 0 for p in simulador.cola_listos)
+    assert estadisticas["indice_equidad_jain"] > 0.9
+    assert indice_jain([1, 1, 1]) == 1.0 and abs(indice_jain([1, 0, 0]) - 1 / 3) < 1e-9
+    print(f"   ✓ Índice de Jain: {estadisticas['indice_equidad_jain']:.3f}")
+    print()
+
+if __name__ == "__main__":
+    probar_orden_por_vruntime()
+    probar_pesos_nice()
+    probar_simulador()
+    print("🎉 Todas las pruebas de CFS pasaron")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Prueba de la cola de admisión: procesos que esperan memoria, indexados por tamaño
+"""
+
+from cola_admision import ColaAdmision
+from eventos import BusEventos, SumideroAnillo, TipoEvento
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+def probar_ordenes():
+    print("🔵 === PRUEBA 1: Órdenes de admisión ===")
+    tamanos = {1: 500, 2: 100, 3: 300, 4: 100, 5: 800}
+    esperado = {
+        "fifo": ([1, 2, 3, 4, 5], [1, 2, 3, 4]),
+        "menor_primero": ([2, 4, 3, 1, 5], [2, 4, 3, 1]),
+        "mayor_que_cabe": ([5, 1, 3, 4, 2], [1, 3, 4, 2]),
+    }
+    for orden, (todos, hasta_500) in esperado.items():
+        cola = ColaAdmision(orden)
+        for pid, tamano in tamanos.items():
+            cola.agregar(Proceso(pid, 0, 1, tamano * MB))
+        assert [p.pid for p in cola.en_orden()] == todos, orden
+        assert [p.pid for p in cola.en_orden(500 * MB)] == hasta_500, orden
+        assert cola.tamano_minimo == 100 * MB and len(cola) == 5
+        print(f"   ✓ {orden}: {todos}")
+
+    cola = ColaAdmision()
+    procesos = [Proceso(pid, 0, 1, tamano * MB) for pid, tamano in tamanos.items()]
+    for proceso in procesos:
+        cola.agregar(proceso)
+    assert cola.quitar(procesos[1]) and not cola.quitar(procesos[1])
+    assert cola.quitar(procesos[3]) and cola.tamano_minimo == 300 * MB
+    assert [p.pid for p in cola] == [1, 3, 5] and procesos[0] in cola
+    try:
+        ColaAdmision("aleatorio")
+        assert False, "Debe rechazar órdenes desconocidos"
+    except ValueError:
+        pass
+    print("   ✓ Quitar, tamaño mínimo y validación del orden")
+    print()
+
+def probar_sin_reintentos_inutiles():
+    print("🔵 === PRUEBA 2: Solo se reintenta cuando se libera suficiente memoria ===")
+    anillo = SumideroAnillo(100000)
+    simulador = Simulador(num_nucleos=1, memoria_gb=1, eventos=BusEventos([anillo]), tiempo_limite=None)
+    simulador.configurar_algoritmo("FCFS")
+    simulador.agregar_proceso(Proceso(1, 0, 1000, 900 * MB))
+    for pid in range(2, 52):
+        simulador.agregar_proceso(Proceso(pid, 1, 1, 200 * MB))
+    simulador.ejecutar(por_eventos=False)
+    fallidas = anillo.de_tipo(TipoEvento.ALLOC_FALLIDA)
+    assert len(fallidas) == 50, "Una sola asignación fallida por proceso, no una por tick"
+    assert len(simulador.procesos_terminados) == 51
+    print(f"   ✓ {len(fallidas)} fallos de asignación en {simulador.reloj_global} ticks")
+    print()
+
+def probar_bloqueo_en_cabeza():
+    print("🔵 === PRUEBA 3: El orden de admisión decide quién entra al liberarse memoria ===")
+    respuestas = {}
+    for orden in ("fifo", "menor_primero", "mayor_que_cabe"):
+        simulador = Simulador(num_nucleos=16, memoria_gb=1, eventos=BusEventos(), tiempo_limite=None,
+                              orden_admision=orden)
+        simulador.configurar_algoritmo("FCFS")
+        simulador.agregar_proceso(Proceso(1, 0, 10, 600 * MB))
+        for pid in range(2, 6):
+            simulador.agregar_proceso(Proceso(pid, 0, 20, 100 * MB))
+        # Al terminar el proceso 1 quedan 600 MB: alcanzan para el grande o para los cinco chicos
+        simulador.agregar_proceso(Proceso(6, 1, 5, 500 * MB))
+        for pid in range(7, 12):
+            simulador.agregar_proceso(Proceso(pid, 1, 1, 100 * MB))
+        estadisticas = simulador.ejecutar()
+        assert estadisticas["procesos_terminados"] == 11
+        respuestas[orden] = estadisticas["tiempo_promedio_respuesta"]
+        print(f"   ✓ {orden}: respuesta promedio {respuestas[orden]:.2f}")
+    assert respuestas["menor_primero"] < respuestas["fifo"] == respuestas["mayor_que_cabe"]
+    print()
+
+if __name__ == "__main__":
+    probar_ordenes()
+    probar_sin_reintentos_inutiles()
+    probar_bloqueo_en_cabeza()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Prueba de las colas de listos: orden de servicio, borrado y escala
+"""
+
+import random
+import time
+
+from cola_listos import ColaFIFO, ColaMLFQ, ColaSJF
+from planificador import Planificador
+from eventos import BusEventos
+from proceso import Proceso
+from simulador import Simulador
+
+def probar_sjf_equivale_a_ordenar():
+    print("🔵 === PRUEBA 1: ColaSJF equivale a sorted() por tiempo restante ===")
+    rng = random.Random(7)
+    procesos = [Proceso(pid, 0, rng.randint(1, 20), 1024) for pid in range(200)]
+    cola = ColaSJF(procesos)
+    referencia = list(procesos)
+    quitados = rng.sample(procesos, 50)
+    for proceso in quitados:
+        assert cola.quitar(proceso)
+        referencia.remove(proceso)
+    assert not cola.quitar(quitados[0])
+    assert len(cola) == len(referencia) and quitados[0] not in cola
+    assert list(cola) == sorted(referencia, key=lambda p: p.tiempo_restante)
+    while referencia:
+        esperado = sorted(referencia, key=lambda p: p.tiempo_restante)[0]
+        assert cola.extraer() is esperado
+        referencia.remove(esperado)
+    assert cola.extraer() is None and not cola
+    print("   ✓ Mismo orden (con desempate por llegada) que la versión con sorted()")
+    print()
+
+def probar_planificador():
+    print("🔵 === PRUEBA 2: El planificador extrae de la cola ===")
+    planificador = Planificador()
+    procesos = [Proceso(1, 0, 5, 1024), Proceso(2, 0, 2, 1024), Proceso(3, 0, 9, 1024)]
+    for algoritmo, esperado in (("SJF", [2, 1, 3]), ("RR", [1, 2, 3])):
+        cola = planificador.crear_cola(algoritmo, procesos)
+        obtenidos = []
+        while cola:
+            obtenidos += [p.pid for p in planificador.planificar(cola, algoritmo)]
+        assert obtenidos == esperado, (algoritmo, obtenidos)
+        assert planificador.planificar(cola, algoritmo) == []
+        print(f"   ✓ {algoritmo}: {obtenidos}")
+    assert isinstance(planificador.crear_cola("Round Robin"), ColaFIFO)
+    print()
+
+def probar_escala_sjf():
+    print("🔵 === PRUEBA 3: SJF con 50.000 procesos listos ===")
+    rng = random.Random(1)
+    cola = ColaSJF(Proceso(pid, 0, rng.randint(1, 1000), 1024) for pid in range(50000))
+    inicio = time.perf_counter()
+    anterior = 0
+    for _ in range(50000):
+        proceso = cola.extraer()
+        assert proceso.tiempo_restante >= anterior
+        anterior = proceso.tiempo_restante
+    print(f"   ✓ 50.000 extracciones en {time.perf_counter() - inicio:.2f}s")
+    print()
+
+def probar_fifo():
+    print("🔵 === PRUEBA 4: ColaFIFO con desalojo y reencolado ===")
+    procesos = [Proceso(pid, 0, 5, 1024) for pid in range(1, 6)]
+    cola = ColaFIFO(procesos)
+    assert cola.quitar(procesos[2]) and procesos[2] not in cola
+    assert cola.extraer() is procesos[0]
+    cola.agregar(procesos[0])   # Desalojado por quantum: vuelve al final
+    cola.agregar(procesos[2])   # Regresa desde swap
+    assert [p.pid for p in cola] == [2, 4, 5, 1, 3]
+    assert [cola.extraer().pid for _ in range(5)] == [2, 4, 5, 1, 3]
+    assert cola.extraer() is None
+
+    cola = ColaFIFO(Proceso(pid, 0, 5, 1024) for pid in range(100000))
+    inicio = time.perf_counter()
+    for _ in range(200000):
+        cola.agregar(cola.extraer())
+    assert len(cola) == 100000
+    print(f"   ✓ 200.000 rotaciones RR con 100.000 listos en {time.perf_counter() - inicio:.2f}s")
+    print()
+
+def probar_despacho_multiple():
+    print("🔵 === PRUEBA 5: Todos los núcleos libres se llenan en un paso ===")
+    for algoritmo in ("SJF", "RR"):
+        simulador = Simulador(num_nucleos=64, eventos=BusEventos())
+        simulador.configurar_algoritmo(algoritmo)
+        for pid in range(100):
+            simulador.agregar_proceso(Proceso(pid, 0, 200 - pid, 1024))
+        simulador.paso_simulacion()
+        ejecutando = [p for p in simulador.cpu.nucleos if p]
+        assert len(ejecutando) == 64 and len(simulador.cola_listos) == 36
+        if algoritmo == "SJF":
+            assert sorted(p.pid for p in ejecutando) == list(range(36, 100))
+        print(f"   ✓ {algoritmo}: 64 núcleos ocupados tras el primer paso")
+    print()
+
+def probar_mlfq():
+    print("🔵 === PRUEBA 6: MLFQ con degradación y boost ===")
+    a, b, c = (Proceso(pid, 0, 10, 1024) for pid in (1, 2, 3))
+    cola = ColaMLFQ([a, b], quantums=(1, 2, 4), periodo_boost=10)
+    assert cola.extraer() is a
+    cola.degradar(a)
+    cola.agregar(a)             # a baja al nivel 1
+    cola.agregar(c)             # c entra en el nivel 0
+    assert cola.quantum_de(a) == 2 and cola.quantum_de(c) == 1
+    assert [p.pid for p in cola] == [2, 3, 1]
+    assert cola.extraer() is b
+    cola.degradar(b)
+    cola.degradar(b)            # b (en CPU) queda en el nivel 2
+    cola.al_avanzar_tiempo(5)
+    assert cola.quantum_de(b) == 4
+    cola.al_avanzar_tiempo(10)  # Boost: todos al nivel 0, incluido b que estaba fuera de la cola
+    assert cola.quantum_de(b) == 1 and cola.quantum_de(a) == 1
+    cola.agregar(b)
+    assert [cola.extraer().pid for _ in range(3)] == [3, 1, 2]
+    assert cola.extraer() is None
+
+    simulador = Simulador(num_nucleos=1, eventos=BusEventos())
+    simulador.configurar_algoritmo("MLFQ", quantums=(1, 2, 4), periodo_boost=0)
+    largo, corto = Proceso(1, 0, 20, 1024), Proceso(2, 1, 1, 1024)
+    simulador.agregar_proceso(largo)
+    simulador.agregar_proceso(corto)
+    while simulador.paso_simulacion():
+        pass
+    assert corto in simulador.procesos_terminados, "El proceso corto no debe esperar al largo"
+    assert largo.nivel_mlfq == 2
+    print("   ✓ Degradación por quantum, boost periódico y despacho por nivel correctos")
+    print()
+
+if __name__ == "__main__":
+    probar_sjf_equivale_a_ordenar()
+    probar_planificador()
+    probar_escala_sjf()
+    probar_fifo()
+    probar_despacho_multiple()
+    probar_mlfq()
+    print("🎉 Todas las pruebas de colas de listos pasaron")
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Prueba de la cola de llegadas: orden por tiempo de llegada con cursor y montículo
+"""
+
+import random
+import time
+
+from cola_llegadas import ColaLlegadas
+from eventos import BusEventos
+from proceso import Proceso
+from simulador import Simulador
+
+def probar_orden_de_llegada():
+    print("🔵 === PRUEBA 1: Carga masiva y altas individuales se intercalan por llegada ===")
+    cola = ColaLlegadas([Proceso(pid, llegada, 1, 1024) for pid, llegada in ((1, 5), (2, 0), (3, 5), (4, 9))])
+    cola.agregar(Proceso(5, 5, 1, 1024))
+    cola.agregar(Proceso(6, 1, 1, 1024))
+    assert len(cola) == 6 and cola.proxima_llegada() == 0
+    assert [p.pid for p in cola] == [2, 6, 1, 3, 5, 4]
+    assert [p.pid for p in cola.extraer_llegados(0)] == [2]
+    assert cola.extraer_llegados(0) == []
+    assert [p.pid for p in cola.extraer_llegados(5)] == [6, 1, 3, 5], "Empates en orden de alta"
+    cola.cargar([Proceso(7, 7, 1, 1024)])
+    assert cola.proxima_llegada() == 7 and len(cola) == 2
+    assert [p.pid for p in cola.extraer_llegados(100)] == [7, 4]
+    assert not cola and cola.proxima_llegada() is None
+    print("   ✓ Orden por llegada, empates estables y cola vacía al final")
+    print()
+
+def probar_traza_grande():
+    print("🔵 === PRUEBA 2: 200.000 procesos no se recorren en cada paso ===")
+    rng = random.Random(7)
+    procesos = [Proceso(pid, rng.randrange(1000000), rng.randint(1, 3), 1024) for pid in range(200000)]
+    simulador = Simulador(num_nucleos=8, eventos=BusEventos(), tiempo_limite=None)
+    simulador.configurar_algoritmo("FCFS")
+    inicio = time.perf_counter()
+    simulador.agregar_procesos(procesos)
+    estadisticas = simulador.ejecutar()
+    duracion = time.perf_counter() - inicio
+    assert estadisticas["procesos_terminados"] == 200000 and estadisticas["procesos_nuevos"] == 0
+    print(f"   ✓ 200.000 procesos simulados en {duracion:.2f}s")
+    print()
+
+if __name__ == "__main__":
+    probar_orden_de_llegada()
+    probar_traza_grande()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Prueba de las colas de listos por núcleo: balanceo, robo de trabajo y costo de migración
+"""
+
+from eventos import BusEventos
+from proceso import Proceso
+from simulador import Simulador
+
+def crear_simulador(num_nucleos, algoritmo="RR", **opciones):
+    simulador = Simulador(num_nucleos=num_nucleos, eventos=BusEventos(), colas_por_nucleo=True, **opciones)
+    simulador.configurar_algoritmo(algoritmo)
+    return simulador
+
+def probar_balanceo():
+    print("🔵 === PRUEBA 1: Reparto de llegadas entre núcleos ===")
+    for balanceo in ("menos_cargada", "rotativa", "dos_opciones"):
+        simulador = crear_simulador(8, balanceo=balanceo)
+        for pid in range(64):
+            simulador.agregar_proceso(Proceso(pid, 0, 5, 1024))
+        simulador.paso_simulacion()
+        largos = [len(cola) for cola in simulador.cpu.colas]
+        assert sum(largos) == 56 and all(simulador.cpu.nucleos)
+        if balanceo != "dos_opciones":
+            assert largos == [7] * 8, largos
+        print(f"   ✓ {balanceo}: {largos}")
+    print()
+
+def probar_robo_de_trabajo():
+    print("🔵 === PRUEBA 2: Los núcleos ociosos roban trabajo ===")
+    simulador = crear_simulador(4, costo_migracion=2)
+    procesos = [Proceso(pid, 0, 3, 1024) for pid in range(12)]
+    for proceso in procesos:
+        proceso.ultimo_nucleo = 0  # Todos con afinidad al núcleo 0
+        simulador.agregar_proceso(proceso)
+    simulador.paso_simulacion()
+    assert all(simulador.cpu.nucleos), "Los núcleos 1-3 deben robar de la cola del núcleo 0"
+    estadisticas = simulador.calcular_estadisticas()
+    assert estadisticas["robos"] == 3 and estadisticas["migraciones"] == 3
+    while simulador.paso_simulacion():
+        pass
+    estadisticas = simulador.calcular_estadisticas()
+    assert estadisticas["tiempo_migracion"] == 2 * estadisticas["migraciones"]
+    print(f"   ✓ {estadisticas['robos']} robos, {estadisticas['migraciones']} migraciones, "
+          f"{estadisticas['tiempo_migracion']} unidades perdidas")
+    print()
+
+def probar_escala():
+    print("🔵 === PRUEBA 3: De 2 a 128 núcleos ===")
+    for num_nucleos in (2, 16, 128):
+        simulador = crear_simulador(num_nucleos, algoritmo="SRTF")
+        for pid in range(num_nucleos * 2):
+            simulador.agregar_proceso(Proceso(pid, pid % 3, 1 + pid % 2, 1024))
+        while simulador.paso_simulacion():
+            pass
+        assert len(simulador.procesos_terminados) == num_nucleos * 2
+        print(f"   ✓ {num_nucleos} núcleos: {len(simulador.procesos_terminados)} procesos terminados")
+    print()
+
+if __name__ == "__main__":
+    probar_balanceo()
+    probar_robo_de_trabajo()
+    probar_escala()
+    print("🎉 Todas las pruebas de colas por núcleo pasaron")
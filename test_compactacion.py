@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Prueba de la compactación de memoria: completa, parcial, disparada por umbral y su costo
+"""
+
+from eventos import BusEventos, SumideroAnillo, TipoEvento
+from memoria import Memoria
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+def fragmentar(memoria):
+    """Ocupa la memoria con 8 procesos de 128 MB y libera los pares: 4 huecos de 128 MB"""
+    procesos = [Proceso(pid, 0, 5, 128 * MB) for pid in range(1, 9)]
+    for proceso in procesos:
+        assert memoria.asignar_memoria(proceso)
+    for proceso in procesos[1::2]:
+        memoria.liberar_memoria(proceso)
+    return procesos[0::2]
+
+def verificar_consistencia(memoria, residentes):
+    extents = sorted([(b.inicio, b.tamano) for b in memoria.bloques_ocupados] +
+                     [(b.inicio, b.tamano) for b in memoria.bloques_libres])
+    posicion = 0
+    for inicio, tamano in extents:
+        assert inicio == posicion, f"Hueco o solapamiento en {posicion}"
+        posicion += tamano
+    assert posicion == memoria.tamano_total
+    for proceso in residentes:
+        for bloque in proceso.bloques_memoria_asignados:
+            assert memoria.bloque_en(bloque.inicio) == bloque
+
+def probar_compactacion_completa():
+    print("🔵 === PRUEBA 1: Compactación completa al fallar ===")
+    for indice in ("arbol", "lista"):
+        memoria = Memoria(1, indice_libres=indice, eventos=BusEventos(), compactacion="al_fallar")
+        residentes = fragmentar(memoria)
+        grande = Proceso(99, 0, 5, 400 * MB)
+        assert memoria.asignar_memoria(grande), "Debe caber tras compactar"
+        assert memoria.compactaciones == 1
+        assert memoria.bytes_movidos == 3 * 128 * MB
+        assert memoria.tomar_tiempo_pendiente() == memoria.costo_compactacion(3 * 128 * MB)
+        assert memoria.tomar_tiempo_pendiente() == 0
+        verificar_consistencia(memoria, residentes + [grande])
+        print(f"   ✓ {indice}: {memoria.bytes_movidos // MB} MB movidos")
+
+    sin_compactar = Memoria(1, eventos=BusEventos())
+    fragmentar(sin_compactar)
+    assert not sin_compactar.asignar_memoria(Proceso(99, 0, 5, 400 * MB))
+    print("   ✓ Sin compactación la asignación falla")
+    print()
+
+def probar_compactacion_parcial():
+    print("🔵 === PRUEBA 2: Compactación parcial de la ventana mínima ===")
+    for indice in ("arbol", "lista"):
+        memoria = Memoria(1, indice_libres=indice, eventos=BusEventos(), compactacion="parcial")
+        residentes = fragmentar(memoria)
+        grande = Proceso(99, 0, 5, 200 * MB)
+        assert memoria.asignar_memoria(grande)
+        # Basta mover un solo bloque de 128 MB para unir dos huecos
+        assert memoria.bytes_movidos == 128 * MB, memoria.bytes_movidos
+        verificar_consistencia(memoria, residentes + [grande])
+        print(f"   ✓ {indice}: {memoria.bytes_movidos // MB} MB movidos")
+    print()
+
+def probar_umbral():
+    print("🔵 === PRUEBA 3: Compactación por umbral de fragmentación ===")
+    anillo = SumideroAnillo()
+    memoria = Memoria(1, eventos=BusEventos([anillo]), compactacion="umbral", umbral_fragmentacion=0.6)
+    residentes = fragmentar(memoria)
+    assert memoria.fragmentacion_externa == 0
+    verificar_consistencia(memoria, residentes)
+    assert len(anillo.de_tipo(TipoEvento.COMPACT)) == memoria.compactaciones > 0
+    print(f"   ✓ {memoria.compactaciones} compactaciones, fragmentación final 0")
+    print()
+
+def probar_costo_en_simulador():
+    print("🔵 === PRUEBA 4: El costo se cobra al reloj del simulador ===")
+    simulador = Simulador(num_nucleos=1, memoria_gb=1, eventos=BusEventos(), compactacion="al_fallar")
+    fragmentar(simulador.memoria)
+    simulador.memoria.costo_compactacion_por_mb = 1
+    simulador.agregar_proceso(Proceso(99, 0, 5, 400 * MB))
+    simulador.paso_simulacion()
+    estadisticas = simulador.calcular_estadisticas()
+    assert estadisticas["compactaciones"] == 1
+    assert estadisticas["tiempo_compactacion"] == 384
+    assert simulador.reloj_global == 1 + 384
+    # Mientras compacta el núcleo no avanza: solo cuenta como ocupada la unidad ejecutada
+    assert simulador.cpu.tiempo_ocioso == [384]
+    assert round(estadisticas["utilizacion_nucleos"][0] * simulador.reloj_global) == 1
+    print(f"   ✓ Reloj tras un paso: {simulador.reloj_global}")
+    print()
+
+if __name__ == "__main__":
+    probar_compactacion_completa()
+    probar_compactacion_parcial()
+    probar_umbral()
+    probar_costo_en_simulador()
+    print("🎉 Todas las pruebas de compactación pasaron")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Prueba de las estadísticas en línea: Welford, bosquejo de cuantiles y
+métricas del simulador combinables entre corridas
+"""
+
+import random
+import statistics
+
+from estadisticas import BosquejoCuantiles, EstadisticaEnLinea, MetricasSimulacion
+from eventos import BusEventos
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+def probar_welford():
+    print("🔵 === PRUEBA 1: Media y varianza incrementales ===")
+    rng = random.Random(1)
+    valores = [rng.randint(0, 10000) for _ in range(5000)]
+    completa, izquierda, derecha = EstadisticaEnLinea(), EstadisticaEnLinea(), EstadisticaEnLinea()
+    for i, valor in enumerate(valores):
+        completa.agregar(valor)
+        (izquierda if i < 1234 else derecha).agregar(valor)
+    assert completa.media == sum(valores) / len(valores)
+    assert abs(completa.varianza - statistics.variance(valores)) < 1e-6 * statistics.variance(valores)
+    izquierda.combinar(derecha)
+    assert izquierda.n == completa.n and izquierda.media == completa.media
+    assert abs(izquierda.varianza - completa.varianza) < 1e-6 * completa.varianza
+    assert (izquierda.minimo, izquierda.maximo) == (min(valores), max(valores))
+    assert EstadisticaEnLinea().combinar(completa).varianza == completa.varianza
+    print(f"   ✓ Media {completa.media:.2f}, desviación {completa.desviacion:.2f}, igual al combinar")
+    print()
+
+def probar_bosquejo():
+    print("🔵 === PRUEBA 2: Cuantiles con error relativo acotado ===")
+    rng = random.Random(2)
+    valores = sorted(int(rng.expovariate(1 / 500)) for _ in range(20000))
+    bosquejo = BosquejoCuantiles(0.01)
+    partes = [BosquejoCuantiles(0.01) for _ in range(4)]
+    for i, valor in enumerate(valores):
+        bosquejo.agregar(valor)
+        partes[i % 4].agregar(valor)
+    combinado = partes[0].combinar(partes[1]).combinar(partes[2]).combinar(partes[3])
+    for q in (0.5, 0.95, 0.99):
+        real = valores[int(q * (len(valores) - 1))]
+        estimado = bosquejo.cuantil(q)
+        assert abs(estimado - real) <= 0.01 * real, f"q={q}: {estimado} vs {real}"
+        assert combinado.cuantil(q) == estimado
+        print(f"   ✓ p{int(q * 100)}: real {real}, estimado {estimado:.1f}")
+    assert bosquejo.cuantil(0) == 0.0 and BosquejoCuantiles().cuantil(0.5) is None
+    try:
+        bosquejo.combinar(BosquejoCuantiles(0.05))
+        assert False, "Debe rechazar precisiones distintas"
+    except ValueError:
+        pass
+    print()
+
+def probar_metricas_simulador():
+    print("🔵 === PRUEBA 3: Métricas del simulador y combinación entre corridas ===")
+    metricas_totales = MetricasSimulacion()
+    procesos_totales = []
+    for semilla in range(3):
+        rng = random.Random(semilla)
+        simulador = Simulador(num_nucleos=2, eventos=BusEventos(), tiempo_limite=None)
+        simulador.configurar_algoritmo("RR")
+        procesos = [Proceso(pid, rng.randrange(30), rng.randint(1, 10), 50 * MB) for pid in range(1, 21)]
+        simulador.agregar_procesos(procesos)
+        estadisticas = simulador.ejecutar()
+        retornos = [p.tiempo_finalizacion - p.tiempo_llegada for p in procesos]
+        assert estadisticas["tiempo_promedio_retorno"] == sum(retornos) / len(retornos)
+        assert estadisticas["distribucion_retorno"]["p50"] > 0
+        assert abs(estadisticas["throughput"] - 20 / simulador.reloj_global) < 1e-12
+        ocupado = sum(estadisticas["utilizacion_nucleos"]) * simulador.reloj_global
+        assert round(ocupado) == sum(p.duracion for p in procesos)
+        metricas_totales.combinar(simulador.metricas)
+        procesos_totales.extend(procesos)
+    esperas = [p.tiempo_finalizacion - p.tiempo_llegada - p.duracion for p in procesos_totales]
+    assert metricas_totales.terminados == 60
+    assert metricas_totales.espera.media == sum(esperas) / len(esperas)
+    print(f"   ✓ 60 procesos combinados: espera {metricas_totales.espera.como_dict()}")
+    print()
+
+if __name__ == "__main__":
+    probar_welford()
+    probar_bosquejo()
+    probar_metricas_simulador()
+    print("✅ === PRUEBAS COMPLETADAS ===")
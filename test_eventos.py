@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Prueba del bus de eventos estructurados y sus sumideros
+"""
+
+import json
+import os
+import tempfile
+import time
+
+from eventos import BusEventos, SumideroAnillo, SumideroJSONL, SumideroNulo, TipoEvento
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+def _procesos():
+    return [Proceso(i + 1, i, 3, 100 * MB) for i in range(4)]
+
+def probar_sumidero_anillo():
+    print("🔵 === PRUEBA 1: Sumidero en anillo ===")
+    anillo = SumideroAnillo(capacidad=1000)
+    simulador = Simulador(num_nucleos=2, eventos=BusEventos([anillo]))
+    for proceso in _procesos():
+        simulador.agregar_proceso(proceso)
+    while simulador.paso_simulacion():
+        pass
+
+    tipos = {evento.tipo for evento in anillo.eventos}
+    for tipo in (TipoEvento.ALLOC, TipoEvento.FREE, TipoEvento.DISPATCH, TipoEvento.FINISH, TipoEvento.TICK):
+        assert tipo in tipos, f"Falta el evento {tipo}"
+    asignaciones = anillo.de_tipo(TipoEvento.ALLOC)
+    assert [e.datos["pid"] for e in asignaciones] == [1, 2, 3, 4]
+    assert all(e.tiempo == e.datos["pid"] - 1 for e in asignaciones), "Cada evento lleva el reloj de simulación"
+    print(f"✓ {len(anillo.eventos)} eventos capturados: {sorted(tipos)}")
+    print()
+
+def probar_bus_inactivo():
+    print("🔵 === PRUEBA 2: Bus sin sumideros ===")
+    assert not BusEventos().activo
+    assert not BusEventos([SumideroNulo()]).activo
+
+    tiempos = {}
+    for nombre, bus in (("nulo", BusEventos()), ("anillo", BusEventos([SumideroAnillo()]))):
+        simulador = Simulador(num_nucleos=4, eventos=bus)
+        for i in range(2000):
+            simulador.agregar_proceso(Proceso(i, 0, 1, 1 * MB))
+        comienzo = time.perf_counter()
+        simulador._procesar_llegadas()
+        tiempos[nombre] = time.perf_counter() - comienzo
+    print(f"✓ Admisión de 2000 procesos: {tiempos['nulo']*1000:.1f} ms sin sumideros, "
+          f"{tiempos['anillo']*1000:.1f} ms con anillo")
+    print()
+
+def probar_sumidero_jsonl():
+    print("🔵 === PRUEBA 3: Sumidero JSONL ===")
+    ruta = os.path.join(tempfile.mkdtemp(), "eventos.jsonl")
+    bus = BusEventos([SumideroJSONL(ruta)])
+    simulador = Simulador(num_nucleos=2, eventos=bus)
+    for proceso in _procesos():
+        simulador.agregar_proceso(proceso)
+    while simulador.paso_simulacion():
+        pass
+    bus.cerrar()
+
+    with open(ruta, encoding="utf-8") as archivo:
+        eventos = [json.loads(linea) for linea in archivo]
+    assert eventos and all("tipo" in e and "tiempo" in e for e in eventos)
+    print(f"✓ {len(eventos)} líneas JSON escritas en {ruta}")
+    print()
+
+if __name__ == "__main__":
+    probar_sumidero_anillo()
+    probar_bus_inactivo()
+    probar_sumidero_jsonl()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Prueba de equivalencia entre el índice de bloques libres en árbol y la lista original
+"""
+
+import random
+
+from eventos import BusEventos
+from proceso import Proceso
+from memoria import Memoria
+
+def probar_equivalencia_indices(politica="first-fit", num_operaciones=3000, semilla=7):
+    print(f"🚀 === PRUEBA DE EQUIVALENCIA: ÍNDICE ÁRBOL vs LISTA ({politica}) ===\n")
+    azar = random.Random(semilla)
+
+    memoria_arbol = Memoria(tamano_total_gb=1, indice_libres="arbol", politica=politica, eventos=BusEventos())
+    memoria_lista = Memoria(tamano_total_gb=1, indice_libres="lista", politica=politica, eventos=BusEventos())
+
+    residentes = []
+    siguiente_pid = 1
+    for _ in range(num_operaciones):
+        if residentes and azar.random() < 0.45:
+            pid = residentes.pop(azar.randrange(len(residentes)))
+            memoria_arbol.liberar_memoria(pid[0])
+            memoria_lista.liberar_memoria(pid[1])
+        else:
+            tamano = azar.randint(1, 64) * 1024 * 1024
+            p_arbol = Proceso(siguiente_pid, 0, 1, tamano)
+            p_lista = Proceso(siguiente_pid, 0, 1, tamano)
+            siguiente_pid += 1
+            ok_arbol = memoria_arbol.asignar_memoria(p_arbol)
+            ok_lista = memoria_lista.asignar_memoria(p_lista)
+            assert ok_arbol == ok_lista, "Los índices difieren en el resultado de la asignación"
+            if ok_arbol:
+                assert p_arbol.bloques_memoria_asignados[0].inicio == p_lista.bloques_memoria_asignados[0].inicio
+                residentes.append((p_arbol, p_lista))
+
+        assert len(memoria_arbol.bloques_ocupados) == len(residentes)
+        libres_arbol = [(b.inicio, b.tamano) for b in memoria_arbol.bloques_libres]
+        libres_lista = [(b.inicio, b.tamano) for b in memoria_lista.bloques_libres]
+        assert libres_arbol == libres_lista, "Los bloques libres difieren entre índices"
+
+        # Los contadores incrementales deben coincidir con recalcular desde los bloques
+        uso = memoria_arbol.obtener_uso_memoria()
+        assert uso['libre'] == sum(tamano for _, tamano in libres_arbol)
+        assert uso['ocupada'] == sum(b.tamano for b in memoria_arbol.bloques_ocupados)
+        assert uso['mayor_bloque_libre'] == max((t for _, t in libres_arbol), default=0)
+        assert uso == memoria_lista.obtener_uso_memoria()
+
+    for p_arbol, _ in residentes:
+        assert memoria_arbol.bloques_de_proceso(p_arbol.pid) == p_arbol.bloques_memoria_asignados
+    uso = memoria_arbol.obtener_uso_memoria()
+    print(f"✓ {num_operaciones} operaciones equivalentes")
+    print(f"✓ Bloques libres finales: {uso['num_bloques_libres']}, ocupados: {uso['num_bloques_ocupados']}")
+    print("\n✅ === PRUEBA COMPLETADA ===\n")
+
+if __name__ == "__main__":
+    for nombre in ("first-fit", "best-fit", "worst-fit", "next-fit"):
+        probar_equivalencia_indices(nombre)
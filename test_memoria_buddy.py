@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Prueba del administrador de memoria con sistema buddy
+"""
+
+import random
+
+from eventos import BusEventos
+from proceso import Proceso
+from memoria_buddy import MemoriaBuddy
+
+MB = 1024 * 1024
+
+def probar_memoria_buddy():
+    print("🚀 === PRUEBA DE MEMORIA BUDDY (2 GB) ===\n")
+    memoria = MemoriaBuddy(tamano_total_gb=2)
+    print()
+
+    print("🔵 === PRUEBA 1: Redondeo a potencias de dos ===")
+    proceso1 = Proceso(pid=1, tiempo_llegada=0, duracion=5, tamano_memoria=300 * MB)  # → 512 MB
+    proceso2 = Proceso(pid=2, tiempo_llegada=0, duracion=5, tamano_memoria=512 * MB)  # → 512 MB
+    proceso3 = Proceso(pid=3, tiempo_llegada=0, duracion=5, tamano_memoria=1024 * MB) # → 1 GB
+    proceso4 = Proceso(pid=4, tiempo_llegada=0, duracion=5, tamano_memoria=100 * MB)  # no cabe
+    assert memoria.asignar_memoria(proceso1)
+    assert memoria.asignar_memoria(proceso2)
+    assert memoria.asignar_memoria(proceso3)
+    assert not memoria.asignar_memoria(proceso4)
+    uso = memoria.obtener_uso_memoria()
+    assert uso['ocupada'] == 2048 * MB and uso['libre'] == 0
+    assert uso['fragmentacion_interna'] == 212 * MB
+    print(f"✓ Fragmentación interna: {uso['fragmentacion_interna'] // MB} MB")
+    print()
+
+    print("🔵 === PRUEBA 2: Fusión de buddies al liberar ===")
+    memoria.liberar_memoria(proceso2)
+    memoria.liberar_memoria(proceso1)
+    uso = memoria.obtener_uso_memoria()
+    assert uso['num_bloques_libres'] == 1 and uso['libre'] == 1024 * MB
+    memoria.liberar_memoria(proceso3)
+    assert [(b.inicio, b.tamano) for b in memoria.bloques_libres] == [(0, 2048 * MB)]
+    print("✓ Los buddies se fusionan hasta recuperar el bloque de 2 GB")
+    print()
+
+def probar_operaciones_aleatorias(num_operaciones=5000, semilla=11):
+    print("🔵 === PRUEBA 3: Operaciones aleatorias y consistencia ===")
+    azar = random.Random(semilla)
+    memoria = MemoriaBuddy(tamano_total_gb=2, eventos=BusEventos())
+    residentes = []
+    for pid in range(num_operaciones):
+        if residentes and azar.random() < 0.5:
+            memoria.liberar_memoria(residentes.pop(azar.randrange(len(residentes))))
+        else:
+            proceso = Proceso(pid, 0, 1, azar.randint(1, 64 * MB))
+            if memoria.asignar_memoria(proceso):
+                residentes.append(proceso)
+
+    uso = memoria.obtener_uso_memoria()
+    libres = memoria.bloques_libres
+    assert uso['num_bloques_libres'] == len(libres)
+    assert uso['libre'] == sum(b.tamano for b in libres)
+    extents = sorted([(b.inicio, b.tamano) for b in libres] +
+                     [(b.inicio, b.tamano) for b in memoria.bloques_ocupados])
+    posicion = 0
+    for inicio, tamano in extents:
+        assert inicio == posicion, "Los bloques deben cubrir la memoria sin solaparse"
+        posicion += tamano
+    assert posicion == memoria.tamano_total
+    print(f"✓ {num_operaciones} operaciones consistentes, {len(residentes)} procesos residentes")
+    print()
+
+if __name__ == "__main__":
+    probar_memoria_buddy()
+    probar_operaciones_aleatorias()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Prueba de la memoria paginada: asignación de marcos, tablas de páginas y TLB
+"""
+
+import random
+import time
+
+from eventos import BusEventos
+from memoria_paginada import MemoriaPaginada, TLB
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+def probar_asignacion_marcos():
+    print("🔵 === PRUEBA 1: Asignación y reutilización de marcos ===")
+    memoria = MemoriaPaginada(1, eventos=BusEventos())
+    a = Proceso(1, 0, 5, 10 * MB + 1)
+    b = Proceso(2, 0, 5, 20 * MB)
+    assert memoria.asignar_memoria(a) and memoria.asignar_memoria(b)
+    assert len(a.tabla_paginas) == 10 * MB // 4096 + 1
+    assert memoria.obtener_uso_memoria()['fragmentacion_interna'] == 4095
+    marcos_a = set(a.tabla_paginas)
+    assert not marcos_a & set(b.tabla_paginas)
+
+    assert all(memoria.marco_ocupado(marco) for marco in marcos_a)
+    tabla_a = a.tabla_paginas
+    memoria.liberar_memoria(a)
+    assert a.tabla_paginas is None
+    assert not any(memoria.marco_ocupado(marco) for marco in marcos_a)
+    # Una tabla con marcos ya devueltos no se acepta: la pila no debe repetir marcos
+    a.tabla_paginas = tabla_a
+    memoria._procesos[a.pid] = a
+    try:
+        memoria.liberar_memoria(a)
+        assert False, "Debe rechazar marcos que no están asignados"
+    except ValueError:
+        del memoria._procesos[a.pid]
+        a.tabla_paginas = None
+    assert memoria.obtener_uso_memoria()['num_bloques_libres'] == memoria.num_marcos - len(b.tabla_paginas)
+    c = Proceso(3, 0, 5, 10 * MB + 1)
+    assert memoria.asignar_memoria(c)
+    assert set(c.tabla_paginas) == marcos_a, "Los marcos liberados deben reutilizarse primero"
+    print(f"   ✓ {memoria.obtener_uso_memoria()['num_bloques_ocupados']} marcos ocupados")
+
+    # Sin fragmentación externa: llenar toda la memoria con un proceso
+    memoria.liberar_memoria(b)
+    memoria.liberar_memoria(c)
+    assert memoria.memoria_libre == memoria.tamano_total
+    grande = Proceso(4, 0, 5, memoria.tamano_total)
+    assert memoria.asignar_memoria(grande)
+    assert not memoria.asignar_memoria(Proceso(5, 0, 5, 1))
+    print("   ✓ Un proceso del tamaño de toda la memoria cabe")
+    print()
+
+def probar_tlb():
+    print("🔵 === PRUEBA 2: TLB asociativa con LRU ===")
+    tlb = TLB(entradas=4, asociatividad=2)
+    for pagina in (0, 2):
+        assert tlb.buscar(1, pagina) is None
+        tlb.insertar(1, pagina, pagina + 100)
+    assert tlb.buscar(1, 0) == 100    # 0 pasa a ser la más reciente del conjunto 0
+    tlb.insertar(1, 4, 104)           # Desaloja la página 2 (LRU del conjunto 0)
+    assert tlb.buscar(1, 2) is None
+    assert tlb.buscar(1, 0) == 100 and tlb.buscar(1, 4) == 104
+    assert (tlb.aciertos, tlb.fallos) == (3, 3)
+
+    memoria = MemoriaPaginada(1, entradas_tlb=16, asociatividad_tlb=4, latencia_fallo_tlb=0.5,
+                              eventos=BusEventos())
+    proceso = Proceso(1, 0, 5, 8 * 4096)
+    memoria.asignar_memoria(proceso)
+    for _ in range(3):
+        for direccion in range(0, 8 * 4096, 4096):
+            fisica = memoria.traducir(proceso, direccion + 7)
+            assert fisica == proceso.tabla_paginas[direccion // 4096] * 4096 + 7
+    assert (memoria.tlb.fallos, memoria.tlb.aciertos) == (8, 16)
+    assert memoria.tomar_tiempo_pendiente() == 4
+    tasa = memoria.tlb.tasa_aciertos
+
+    # acceder() en forma cerrada deja la TLB igual que traducir cada unidad
+    rng = random.Random(5)
+    for entradas, asociatividad in ((16, 4), (8, 1), (4, 4)):
+        cerrada, directa = (MemoriaPaginada(0.01, entradas_tlb=entradas, asociatividad_tlb=asociatividad,
+                                            latencia_fallo_tlb=0.3, eventos=BusEventos()) for _ in range(2))
+        procesos = {}
+        for copia in (cerrada, directa):
+            procesos[copia] = [Proceso(pid, 0, 5, paginas * 4096) for pid, paginas in ((1, 3), (2, 13), (3, 90))]
+            for proceso in procesos[copia]:
+                copia.asignar_memoria(proceso)
+        for _ in range(60):
+            i, pasos = rng.randrange(3), rng.choice((1, rng.randint(1, 40), rng.randint(100, 1000)))
+            cerrada.acceder(procesos[cerrada][i], pasos)
+            for paso in range(pasos):
+                directa.acceder(procesos[directa][i])
+                procesos[directa][i].tiempo_en_cpu += 1
+            procesos[cerrada][i].tiempo_en_cpu += pasos
+            assert (cerrada.tlb.aciertos, cerrada.tlb.fallos) == (directa.tlb.aciertos, directa.tlb.fallos)
+            assert [list(c.items()) for c in cerrada.tlb._conjuntos] == \
+                [list(c.items()) for c in directa.tlb._conjuntos]
+            assert cerrada.tomar_tiempo_pendiente() == directa.tomar_tiempo_pendiente()
+    print(f"   ✓ Tasa de aciertos: {tasa:.2f}; acceso por ráfagas igual al unitario")
+    print()
+
+def probar_escala():
+    print("🔵 === PRUEBA 3: 2 GB con páginas de 4 KB ===")
+    inicio = time.perf_counter()
+    memoria = MemoriaPaginada(2, eventos=BusEventos())
+    procesos = [Proceso(pid, 0, 5, 64 * MB) for pid in range(32)]
+    for proceso in procesos:
+        assert memoria.asignar_memoria(proceso)
+    assert memoria.memoria_libre == 0
+    for proceso in procesos:
+        memoria.liberar_memoria(proceso)
+    print(f"   ✓ {memoria.num_marcos:,} marcos asignados y liberados en {time.perf_counter() - inicio:.2f}s")
+    print()
+
+def probar_simulador():
+    print("🔵 === PRUEBA 4: Simulación con memoria paginada ===")
+    simulador = Simulador(num_nucleos=2, tipo_memoria="paginada", eventos=BusEventos())
+    for pid in range(1, 4):
+        simulador.agregar_proceso(Proceso(pid, 0, 3, 100 * MB))
+    while simulador.paso_simulacion():
+        pass
+    uso = simulador.memoria.obtener_uso_memoria()
+    assert len(simulador.procesos_terminados) == 3
+    assert uso['tlb_fallos'] > 0 and uso['ocupada'] == 0
+
+    # La TLB se configura desde el simulador; su latencia por fallo detiene el reloj
+    relojes = []
+    for latencia in (0, 1):
+        configurado = Simulador(num_nucleos=1, tipo_memoria="paginada", entradas_tlb=8, asociatividad_tlb=2,
+                                latencia_fallo_tlb=latencia, eventos=BusEventos(), tiempo_limite=None)
+        assert (configurado.memoria.tlb.entradas, configurado.memoria.tlb.asociatividad) == (8, 2)
+        configurado.agregar_proceso(Proceso(1, 0, 20, 64 * 4096))
+        configurado.ejecutar()
+        relojes.append(configurado.reloj_global)
+    assert relojes[0] == 20 and relojes[1] > relojes[0], relojes
+    print(f"   ✓ TLB: {uso['tlb_aciertos']} aciertos, {uso['tlb_fallos']} fallos")
+    print()
+
+if __name__ == "__main__":
+    probar_asignacion_marcos()
+    probar_tlb()
+    probar_escala()
+    probar_simulador()
+    print("🎉 Todas las pruebas de memoria paginada pasaron")
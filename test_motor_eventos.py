@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Prueba del motor por eventos: mismos resultados que el modo por ticks y
+tiempo proporcional al número de eventos, no al tiempo simulado
+"""
+
+import random
+import time
+
+from cpu import CPU
+from eventos import BusEventos
+from proceso import Proceso
+from simulador import Simulador
+
+MB = 1024 * 1024
+
+def crear_carga(semilla, num_procesos=40, duracion_maxima=12, tamano_maximo_mb=300, nice=5):
+    rng = random.Random(semilla)
+    return [Proceso(pid, rng.randrange(60), rng.randint(1, duracion_maxima),
+                    rng.randint(1, tamano_maximo_mb) * MB, prioridad=rng.randint(-nice, nice))
+            for pid in range(1, num_procesos + 1)]
+
+def simular(algoritmo, semilla, por_eventos, **opciones):
+    simulador = Simulador(eventos=BusEventos(), tiempo_limite=None, **opciones)
+    simulador.configurar_algoritmo(algoritmo)
+    for proceso in crear_carga(semilla):
+        simulador.agregar_proceso(proceso)
+    estadisticas = simulador.ejecutar(por_eventos=por_eventos)
+    finales = sorted((p.pid, p.tiempo_inicio_ejecucion, p.tiempo_finalizacion, p.tiempo_en_cpu)
+                     for p in simulador.procesos_terminados)
+    return finales, estadisticas
+
+def probar_equivalencia_con_ticks():
+    print("🔵 === PRUEBA 1: Eventos y ticks producen la misma simulación ===")
+    configuraciones = [
+        {"num_nucleos": 2},
+        {"num_nucleos": 3, "memoria_gb": 1, "swap_gb": 2},
+        {"num_nucleos": 2, "memoria_gb": 1, "swap_gb": 1, "compactacion": "al_fallar"},
+        {"num_nucleos": 4, "colas_por_nucleo": True},
+        {"num_nucleos": 2, "tipo_memoria": "paginada"},
+    ]
+    for algoritmo in ("FCFS", "SJF", "SRTF", "RR", "MLFQ", "Prioridad", "Loteria", "Stride", "CFS"):
+        for opciones in configuraciones:
+            for semilla in range(3):
+                por_ticks, est_ticks = simular(algoritmo, semilla, False, **opciones)
+                por_eventos, est_eventos = simular(algoritmo, semilla, True, **opciones)
+                assert por_ticks == por_eventos, f"{algoritmo} {opciones} semilla {semilla}"
+                assert est_ticks == est_eventos, f"{algoritmo} {opciones} semilla {semilla}"
+                assert est_eventos["procesos_terminados"] == 40
+        print(f"   ✓ {algoritmo}: {len(configuraciones) * 3} simulaciones idénticas")
+    print()
+
+def probar_rafagas_largas():
+    print("🔵 === PRUEBA 2: Ráfagas de millones de unidades ===")
+    duraciones = {}
+    for tipo_memoria in ("contigua", "paginada"):
+        simulador = Simulador(num_nucleos=4, tipo_memoria=tipo_memoria, eventos=BusEventos(), tiempo_limite=None)
+        simulador.configurar_algoritmo("RR")
+        simulador.set_quantum(250000)
+        for pid in range(1, 201):
+            simulador.agregar_proceso(Proceso(pid, pid * 1000, 1000000 + pid, MB))
+        pasos = 0
+        inicio = time.perf_counter()
+        while simulador.paso_evento():
+            pasos += 1
+        duraciones[tipo_memoria] = time.perf_counter() - inicio
+        estadisticas = simulador.calcular_estadisticas()
+        assert estadisticas["procesos_terminados"] == 200
+        assert sum(simulador.cpu.tiempo_ocioso) + sum(p.duracion for p in simulador.procesos_terminados) \
+            == simulador.reloj_global * 4
+        assert pasos < 2000, "Un paso por evento, no por unidad de tiempo"
+        print(f"   ✓ {tipo_memoria}: {simulador.reloj_global:,} unidades simuladas en {pasos} pasos "
+              f"({duraciones[tipo_memoria]:.2f}s)")
+    # Un acceso a memoria por unidad de ejecución, contado sin recorrer cada unidad
+    tlb = simulador.memoria.tlb
+    assert tlb.aciertos + tlb.fallos == sum(p.duracion for p in simulador.procesos_terminados)
+    assert duraciones["paginada"] < 10 * duraciones["contigua"] + 1, "La TLB no debe costar por unidad simulada"
+    print()
+
+def probar_tiempo_limite():
+    print("🔵 === PRUEBA 3: El tiempo límite detiene ambos modos en el mismo instante ===")
+    for por_eventos in (False, True):
+        simulador = Simulador(num_nucleos=1, eventos=BusEventos(), tiempo_limite=25)
+        simulador.agregar_proceso(Proceso(1, 0, 100, MB))
+        simulador.ejecutar(por_eventos=por_eventos)
+        assert simulador.reloj_global == 25 and simulador.cpu.nucleos[0].tiempo_restante == 75
+    print("   ✓ Reloj en 25 con 75 unidades pendientes")
+    print()
+
+def probar_avance_de_cpu():
+    print("🔵 === PRUEBA 4: La CPU adelanta varias unidades en una sola llamada ===")
+    cpu = CPU(3)
+    largo, corto = Proceso(1, 0, 1000, MB), Proceso(2, 0, 40, MB)
+    cpu.asignar_proceso(0, largo)
+    cpu.asignar_proceso(1, corto)
+    cpu.penalizar(1, 5)
+    assert cpu.tiempo_hasta_desalojo([None, None, None]) == 45, "Ráfaga corta más su penalización"
+    assert cpu.tiempo_hasta_desalojo([30, None, None]) == 30, "Quantum restante del núcleo 0"
+    cpu.avanzar_tiempo(30)
+    assert largo.tiempo_restante == 970 and corto.tiempo_restante == 15
+    assert cpu.penalizacion == [0, 0, 0] and cpu.tiempo_migracion == [0, 5, 0]
+    assert cpu.tiempo_ocioso == [0, 0, 30]
+    assert cpu.tiempo_hasta_desalojo([None, None, None]) == 15
+    assert CPU(2).tiempo_hasta_desalojo([None, None]) is None
+    print("   ✓ Ráfaga, quantum, penalización y ocio avanzados en un paso")
+    print()
+
+if __name__ == "__main__":
+    probar_equivalencia_con_ticks()
+    probar_rafagas_largas()
+    probar_tiempo_limite()
+    probar_avance_de_cpu()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Prueba del registro de algoritmos: SRTF, prioridad con envejecimiento, lotería y stride
+"""
+
+import random
+
+from arbol_fenwick import ArbolFenwick
+from cola_listos import ColaLoteria, ColaPrioridad, ColaStride
+from eventos import BusEventos, SumideroAnillo, TipoEvento
+from planificador import ALGORITMOS, Planificador
+from proceso import Proceso
+from simulador import Simulador
+
+def probar_fenwick():
+    print("🔵 === PRUEBA 1: Árbol de Fenwick ===")
+    rng = random.Random(3)
+    pesos = [rng.randint(0, 9) for _ in range(100)]
+    arbol = ArbolFenwick.desde_valores(pesos)
+    for _ in range(200):
+        i, delta = rng.randrange(100), rng.randint(0, 5)
+        pesos[i] += delta
+        arbol.sumar(i, delta)
+    assert arbol.total() == sum(pesos)
+    for p in range(101):
+        assert arbol.prefijo(p) == sum(pesos[:p])
+    for valor in range(arbol.total()):
+        posicion = arbol.buscar(valor)
+        assert sum(pesos[:posicion]) <= valor < sum(pesos[:posicion + 1])
+    print("   ✓ Sumas de prefijos y búsqueda por peso correctas")
+    print()
+
+def probar_srtf():
+    print("🔵 === PRUEBA 2: SRTF expropia al llegar un trabajo más corto ===")
+    anillo = SumideroAnillo()
+    simulador = Simulador(num_nucleos=1, eventos=BusEventos([anillo]))
+    simulador.configurar_algoritmo("SRTF")
+    largo, corto = Proceso(1, 0, 8, 1024), Proceso(2, 2, 1, 1024)
+    simulador.agregar_proceso(largo)
+    simulador.agregar_proceso(corto)
+    while simulador.paso_simulacion():
+        pass
+    expropiaciones = anillo.de_tipo(TipoEvento.EXPROPIACION)
+    assert [(e.datos["pid"], e.datos["por"]) for e in expropiaciones] == [(1, 2)]
+    assert expropiaciones[0].tiempo == 2
+    assert simulador.procesos_terminados[0] is corto
+    print(f"   ✓ P1 expropiado por P2 en t={expropiaciones[0].tiempo}")
+    print()
+
+def probar_prioridad_con_envejecimiento():
+    print("🔵 === PRUEBA 3: Prioridad con envejecimiento ===")
+    cola = ColaPrioridad(intervalo_envejecimiento=2)
+    baja = Proceso(1, 0, 5, 1024, prioridad=5)
+    cola.agregar(baja)
+    cola.al_avanzar_tiempo(6)
+    alta = Proceso(2, 6, 5, 1024, prioridad=3)
+    cola.agregar(alta)
+    # baja: 5 - 6/2 = 2 < 3, ya envejeció lo suficiente para pasar primero
+    assert cola.prioridad_efectiva(baja) == 2
+    assert cola.ver_primero() is baja
+    assert [p.pid for p in cola.extraer_varios(2)] == [1, 2]
+
+    simulador = Simulador(num_nucleos=1, eventos=BusEventos())
+    simulador.configurar_algoritmo("Prioridad", intervalo_envejecimiento=100)
+    simulador.agregar_proceso(Proceso(1, 0, 20, 1024, prioridad=5))
+    simulador.agregar_proceso(Proceso(2, 1, 2, 1024, prioridad=0))
+    while simulador.paso_simulacion():
+        pass
+    assert [p.pid for p in simulador.procesos_terminados] == [2]
+
+    # Al expropiar, B conserva lo envejecido: A no puede recuperar la CPU enseguida
+    for por_eventos in (False, True):
+        anillo = SumideroAnillo()
+        simulador = Simulador(num_nucleos=1, eventos=BusEventos([anillo]), tiempo_limite=None)
+        simulador.configurar_algoritmo("Prioridad")
+        a, b = Proceso(1, 0, 100, 1024, prioridad=0), Proceso(2, 0, 5, 1024, prioridad=5)
+        simulador.agregar_procesos([a, b])
+        avanzar = simulador.paso_evento if por_eventos else simulador.paso_simulacion
+        while avanzar():
+            pass
+        assert b.tiempo_finalizacion < a.tiempo_finalizacion, (b.tiempo_finalizacion, a.tiempo_finalizacion)
+        primera = anillo.de_tipo(TipoEvento.EXPROPIACION)[0]
+        assert (primera.datos["pid"], primera.datos["por"], primera.tiempo) == (1, 2, 51)
+    print(f"   ✓ B termina en t={b.tiempo_finalizacion} antes que A (t={a.tiempo_finalizacion})")
+    print("   ✓ Envejecimiento y expropiación por prioridad correctos")
+    print()
+
+def probar_loteria_y_stride():
+    print("🔵 === PRUEBA 4: Lotería y stride reparten según boletos ===")
+    procesos = [Proceso(1, 0, 1, 1024, boletos=100), Proceso(2, 0, 1, 1024, boletos=300)]
+    for cola in (ColaLoteria(procesos, semilla=11), ColaStride(procesos)):
+        despachos = {1: 0, 2: 0}
+        for _ in range(4000):
+            proceso = cola.extraer()
+            despachos[proceso.pid] += 1
+            cola.agregar(proceso)
+        proporcion = despachos[2] / despachos[1]
+        assert 2.7 < proporcion < 3.3, proporcion
+        print(f"   ✓ {type(cola).__name__}: proporción de despachos {proporcion:.2f} (esperada 3)")
+
+    cola = ColaLoteria([Proceso(pid, 0, 1, 1024, boletos=pid) for pid in range(1, 201)])
+    assert len(cola) == 200 and cola.quitar(next(iter(cola)))
+    assert len({cola.extraer().pid for _ in range(199)}) == 199 and cola.extraer() is None
+    print("   ✓ La cola de lotería crece y se vacía correctamente")
+    print()
+
+def probar_registro():
+    print("🔵 === PRUEBA 5: Registro de algoritmos ===")
+    planificador = Planificador()
+    for nombre in ("FCFS", "SJF", "SRTF", "RR", "Round Robin", "MLFQ", "Prioridad", "Loteria", "Stride"):
+        assert nombre in ALGORITMOS
+        simulador = Simulador(num_nucleos=2, eventos=BusEventos())
+        simulador.configurar_algoritmo(nombre)
+        for pid in range(1, 5):
+            simulador.agregar_proceso(Proceso(pid, pid - 1, 2, 1024))
+        while simulador.paso_simulacion():
+            pass
+        assert len(simulador.procesos_terminados) == 4, nombre
+    try:
+        planificador.crear_algoritmo("Inexistente")
+        assert False, "Debe rechazar algoritmos desconocidos"
+    except ValueError:
+        pass
+    print(f"   ✓ {len(ALGORITMOS)} nombres registrados; todos completan la carga de prueba")
+    print()
+
+if __name__ == "__main__":
+    probar_fenwick()
+    probar_srtf()
+    probar_prioridad_con_envejecimiento()
+    probar_loteria_y_stride()
+    probar_registro()
+    print("🎉 Todas las pruebas de planificadores pasaron")
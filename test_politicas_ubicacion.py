@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Prueba de las políticas de ubicación de memoria (First/Best/Worst/Next-Fit)
+"""
+
+import random
+import time
+
+from eventos import BusEventos
+from proceso import Proceso
+from memoria import Memoria
+
+MB = 1024 * 1024
+
+def _memoria_fragmentada(politica):
+    """Deja huecos libres de 100, 300, 50 y 200 MB (más el resto al final)"""
+    memoria = Memoria(tamano_total_gb=1, politica=politica, eventos=BusEventos())
+    tamanos = [100, 10, 300, 10, 50, 10, 200, 10]
+    procesos = [Proceso(i + 1, 0, 1, t * MB) for i, t in enumerate(tamanos)]
+    for proceso in procesos:
+        memoria.asignar_memoria(proceso)
+    for proceso in procesos[0::2]:
+        memoria.liberar_memoria(proceso)
+    return memoria
+
+def probar_eleccion_de_bloque():
+    print("🔵 === PRUEBA 1: Bloque elegido por cada política ===")
+    esperado = {
+        "first-fit": 0,                 # primer hueco de 100 MB
+        "best-fit": 420 * MB,           # hueco de 50 MB
+        "worst-fit": 690 * MB,          # resto al final de la memoria
+    }
+    for politica, inicio_esperado in esperado.items():
+        memoria = _memoria_fragmentada(politica)
+        proceso = Proceso(99, 0, 1, 40 * MB)
+        assert memoria.asignar_memoria(proceso)
+        inicio = proceso.bloques_memoria_asignados[0].inicio
+        assert inicio == inicio_esperado, f"{politica}: inicio {inicio} != {inicio_esperado}"
+        print(f"   ✓ {politica}: bloque en posición {inicio // MB} MB")
+
+    # Next-Fit continúa desde la última asignación en lugar de volver al inicio
+    memoria = _memoria_fragmentada("next-fit")
+    memoria.politica.puntero = 110 * MB
+    primero, segundo = Proceso(98, 0, 1, 40 * MB), Proceso(99, 0, 1, 40 * MB)
+    memoria.asignar_memoria(primero)
+    memoria.asignar_memoria(segundo)
+    assert primero.bloques_memoria_asignados[0].inicio == 110 * MB
+    assert segundo.bloques_memoria_asignados[0].inicio == 150 * MB
+    print("   ✓ next-fit: continúa desde el puntero itinerante")
+    print()
+
+def comparar_politicas(num_operaciones=20000, semilla=3):
+    print("🔵 === PRUEBA 2: Latencia y fragmentación por política ===")
+    for politica in ("first-fit", "best-fit", "worst-fit", "next-fit"):
+        azar = random.Random(semilla)
+        memoria = Memoria(tamano_total_gb=2, politica=politica, eventos=BusEventos())
+        residentes, fallos = [], 0
+        comienzo = time.perf_counter()
+        for pid in range(num_operaciones):
+            if residentes and azar.random() < 0.5:
+                memoria.liberar_memoria(residentes.pop(azar.randrange(len(residentes))))
+            else:
+                proceso = Proceso(pid, 0, 1, azar.randint(1, 128) * MB)
+                if memoria.asignar_memoria(proceso):
+                    residentes.append(proceso)
+                else:
+                    fallos += 1
+        duracion = time.perf_counter() - comienzo
+        uso = memoria.obtener_uso_memoria()
+        print(f"   {politica:<10} {duracion * 1e6 / num_operaciones:7.1f} µs/op  "
+              f"fallos: {fallos:5d}  bloques libres: {uso['num_bloques_libres']}")
+    print()
+
+if __name__ == "__main__":
+    probar_eleccion_de_bloque()
+    comparar_politicas()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Prueba del simulador por lotes: mismas métricas por proceso que Simulador
+en cargas chicas, y miles de cargas simuladas de una vez
+"""
+
+import time
+
+from eventos import BusEventos
+from simulador import Simulador
+from simulador_lotes import SimuladorLotes, generar_cargas, procesos_de_carga
+
+def simular_una(algoritmo, carga, num_nucleos, quantum, memoria_gb, tiempo_limite):
+    simulador = Simulador(num_nucleos=num_nucleos, tipo_memoria="paginada", memoria_gb=memoria_gb,
+                          eventos=BusEventos(), tiempo_limite=tiempo_limite)
+    simulador.configurar_algoritmo(algoritmo)
+    simulador.set_quantum(quantum)
+    procesos = procesos_de_carga(*carga)
+    simulador.agregar_procesos(procesos)
+    estadisticas = simulador.ejecutar()
+    return [(p.tiempo_inicio_ejecucion, p.tiempo_finalizacion, p.tiempo_en_cpu) for p in procesos], estadisticas
+
+def probar_equivalencia_con_simulador():
+    print("🔵 === PRUEBA 1: Lotes y Simulador producen las mismas métricas ===")
+    # (núcleos, quantum, memoria_gb, tiempo_limite); 0.25 GB obliga a esperar memoria
+    configuraciones = [(2, 2, 2, None), (3, 3, 0.5, None), (1, 1, 1, None), (4, 2, 0.25, 40)]
+    for algoritmo in ("FCFS", "SJF", "RR"):
+        for num_nucleos, quantum, memoria_gb, tiempo_limite in configuraciones:
+            llegadas, duraciones, tamanos = generar_cargas(8, 20, semilla=num_nucleos)
+            lote = SimuladorLotes(llegadas, duraciones, tamanos, algoritmo=algoritmo, num_nucleos=num_nucleos,
+                                  quantum=quantum, memoria_gb=memoria_gb, tiempo_limite=tiempo_limite)
+            lote.ejecutar()
+            for carga in range(8):
+                por_proceso, estadisticas = simular_una(algoritmo, (llegadas[carga], duraciones[carga], tamanos[carga]),
+                                                        num_nucleos, quantum, memoria_gb, tiempo_limite)
+                del_lote = list(zip(lote.tiempo_inicio_ejecucion[carga].tolist(),
+                                    lote.tiempo_finalizacion[carga].tolist(), lote.tiempo_en_cpu[carga].tolist()))
+                assert por_proceso == del_lote, f"{algoritmo} carga {carga}"
+                resumen = lote.estadisticas_de(carga)
+                assert resumen == {clave: estadisticas[clave] for clave in resumen}, f"{algoritmo} carga {carga}"
+        print(f"   ✓ {algoritmo}: {len(configuraciones) * 8} cargas idénticas")
+    print()
+
+def probar_cargas_de_distinto_tamano():
+    print("🔵 === PRUEBA 2: Cargas con distinta cantidad de procesos ===")
+    cargas = [procesos_de_carga([0, 0, 3], [5, 2, 1], [1024] * 3), procesos_de_carga([2], [4], [1024])]
+    lote = SimuladorLotes.desde_procesos(cargas, algoritmo="SJF", num_nucleos=1)
+    estadisticas = lote.ejecutar()
+    assert estadisticas["total_procesos"].tolist() == [3, 1]
+    assert estadisticas["procesos_terminados"].tolist() == [3, 1]
+    assert estadisticas["tiempo_total_simulacion"].tolist() == [8, 6]
+    assert lote.tiempo_finalizacion[0].tolist() == [7, 2, 8] and lote.tiempo_ocioso[1].tolist() == [2]
+    print("   ✓ Las columnas de relleno no se simulan y cada carga termina en su propio reloj")
+    print()
+
+def probar_miles_de_cargas():
+    print("🔵 === PRUEBA 3: 5.000 cargas de 40 procesos ===")
+    llegadas, duraciones, tamanos = generar_cargas(5000, 40, semilla=3)
+    inicio = time.perf_counter()
+    estadisticas = SimuladorLotes(llegadas, duraciones, tamanos, algoritmo="RR", num_nucleos=4).ejecutar()
+    duracion = time.perf_counter() - inicio
+    assert (estadisticas["procesos_terminados"] == 40).all()
+    print(f"   ✓ 200.000 procesos en {duracion:.2f}s; "
+          f"retorno promedio {estadisticas['tiempo_promedio_retorno'].mean():.2f}")
+    print()
+
+if __name__ == "__main__":
+    probar_equivalencia_con_simulador()
+    probar_cargas_de_distinto_tamano()
+    probar_miles_de_cargas()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Prueba del subsistema de swap: selección de víctimas, capacidad y latencias
+"""
+
+from eventos import BusEventos, SumideroAnillo, TipoEvento
+from memoria import Memoria
+from proceso import Proceso
+from simulador import Simulador
+from swap import GestorSwap
+
+MB = 1024 * 1024
+
+def probar_politicas_victima():
+    print("🔵 === PRUEBA 1: Selección de víctima por política ===")
+    procesos = [
+        Proceso(1, 0, 5, 100 * MB, prioridad=0),
+        Proceso(2, 0, 5, 300 * MB, prioridad=5),
+        Proceso(3, 0, 5, 200 * MB, prioridad=1),
+    ]
+    procesos[0].ultimo_tiempo_ejecucion = 7
+    procesos[1].ultimo_tiempo_ejecucion = 9
+    procesos[2].ultimo_tiempo_ejecucion = 3
+    esperado = {"lru": 3, "mayor": 2, "prioridad": 2}
+    for politica, pid in esperado.items():
+        gestor = GestorSwap(Memoria(1, eventos=BusEventos()), capacidad_gb=1, politica_victima=politica)
+        for proceso in procesos:
+            gestor.registrar_candidato(proceso)
+        gestor.retirar_candidato(procesos[0])
+        victima = gestor.elegir_victima()
+        assert victima.pid == pid, f"{politica}: víctima {victima.pid} != {pid}"
+        print(f"   ✓ {politica}: víctima P{victima.pid}")
+    print()
+
+def probar_swap_en_simulador():
+    print("🔵 === PRUEBA 2: Swap dentro de la simulación ===")
+    anillo = SumideroAnillo()
+    simulador = Simulador(num_nucleos=1, memoria_gb=1, swap_gb=1, eventos=BusEventos([anillo]))
+    simulador.configurar_algoritmo("RR")
+    # Tres procesos de 400 MB en 1 GB de RAM: el tercero obliga a usar swap
+    for pid in range(1, 4):
+        simulador.agregar_proceso(Proceso(pid, 0, 3, 400 * MB))
+    simulador.agregar_proceso(Proceso(4, 0, 3, 2048 * MB))  # Nunca cabe: no debe desalojar a nadie
+    simulador.paso_simulacion()
+
+    salidas = anillo.de_tipo(TipoEvento.SWAP_OUT)
+    assert len(salidas) == 1, "Solo hace falta desalojar un proceso"
+    uso = simulador.swap.obtener_uso_swap()
+    assert uso['swap_outs'] == 1 and uso['ocupada'] == 400 * MB
+    assert simulador.memoria.obtener_uso_memoria()['ocupada'] == 800 * MB
+    assert len(simulador.procesos_suspendidos) == 1
+    # El proceso admitido espera en tránsito a que termine el swap-out de su víctima
+    tiempo_listo, _, proceso = simulador.procesos_en_transito[0]
+    assert proceso.pid == 3 and tiempo_listo == salidas[0].datos['latencia']
+    print(f"   ✓ P{salidas[0].datos['pid']} enviado a swap con latencia {salidas[0].datos['latencia']}")
+
+    for _ in range(10):
+        simulador.paso_simulacion()
+    assert anillo.de_tipo(TipoEvento.SWAP_IN), "El proceso suspendido vuelve a RAM al liberarse memoria"
+    estadisticas = simulador.calcular_estadisticas()
+    print(f"   ✓ Swap-ins: {estadisticas['swap']['swap_ins']}, terminados: {estadisticas['procesos_terminados']}")
+    print()
+
+def probar_plan_de_victimas():
+    print("🔵 === PRUEBA 3: Solo se desaloja si el plan de víctimas alcanza ===")
+    memoria = Memoria(1, eventos=BusEventos())
+    gestor = GestorSwap(memoria, capacidad_gb=2)
+    a, b, c = Proceso(1, 0, 5, 300 * MB), Proceso(2, 0, 5, 300 * MB), Proceso(3, 0, 5, 300 * MB)
+    for proceso in (a, b, c):
+        assert memoria.asignar_memoria(proceso)
+    gestor.registrar_candidato(a)
+    gestor.registrar_candidato(c)
+    # Libres: 124 MB al final. Desalojar A deja 300 MB sueltos y C deja 424 MB contiguos
+    assert memoria.planear_liberacion(400 * MB)(c) and not memoria.planear_liberacion(400 * MB)(a)
+    assert [p.pid for p in gestor.planear_victimas(Proceso(4, 0, 5, 400 * MB))] == [1, 3]
+    assert gestor.planear_victimas(Proceso(5, 0, 5, 800 * MB)) is None, "B no es candidato: no alcanza"
+    assert gestor.swap_outs == 0 and gestor.hay_candidatos()
+    print("   ✓ Plan contiguo correcto y ningún desalojo inútil")
+    print()
+
+def probar_sin_rebotes():
+    print("🔵 === PRUEBA 4: Sin desalojos inútiles ni rebotes entre RAM y swap ===")
+    for algoritmo in ("FCFS", "RR"):
+        anillo = SumideroAnillo(100000)
+        simulador = Simulador(num_nucleos=1, memoria_gb=1, swap_gb=2, eventos=BusEventos([anillo]), tiempo_limite=None)
+        simulador.configurar_algoritmo(algoritmo)
+        # P3 no cabe ni desalojando a P1 mientras P2 ocupa la CPU
+        for proceso in (Proceso(1, 0, 50, 600 * MB), Proceso(2, 0, 60, 300 * MB),
+                        Proceso(3, 5, 5, 800 * MB), Proceso(4, 50, 8, 100 * MB)):
+            simulador.agregar_proceso(proceso)
+        estadisticas = simulador.ejecutar()
+        assert estadisticas["procesos_terminados"] == 4
+        salidas = [evento.datos["pid"] for evento in anillo.de_tipo(TipoEvento.SWAP_OUT)]
+        assert len(salidas) <= 2 and len(set(salidas)) == len(salidas), f"{algoritmo}: {salidas}"
+        print(f"   ✓ {algoritmo}: {len(salidas)} swap-outs ({salidas})")
+    print()
+
+def probar_reintentos_sin_pasos_extra():
+    print("🔵 === PRUEBA 5: Un plan imposible no fuerza pasos de una unidad ===")
+    simulador = Simulador(num_nucleos=2, memoria_gb=1, swap_gb=0.5, eventos=BusEventos(), tiempo_limite=None)
+    simulador.configurar_algoritmo("RR")
+    simulador.set_quantum(1000)
+    for pid in range(1, 5):
+        simulador.agregar_proceso(Proceso(pid, 0, 100000, 200 * MB))
+    # Mientras corren los cuatro, ni desalojando los dos listos que caben en swap se liberan 900 MB
+    simulador.agregar_proceso(Proceso(5, 1, 10, 900 * MB))
+    pasos = 0
+    while simulador.paso_evento():
+        pasos += 1
+    assert simulador.calcular_estadisticas()["procesos_terminados"] == 5
+    # Un paso por cada fin de quantum simultáneo en ambos núcleos (unos 200); antes cada cambio
+    # de candidatos sumaba otro paso de una unidad para reintentar
+    assert pasos < 250, pasos
+    print(f"   ✓ {pasos} pasos para {simulador.reloj_global:,} unidades")
+    print()
+
+if __name__ == "__main__":
+    probar_politicas_victima()
+    probar_swap_en_simulador()
+    probar_plan_de_victimas()
+    probar_sin_rebotes()
+    probar_reintentos_sin_pasos_extra()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Prueba de la tabla de bloques en columnas y de las vistas BloqueMemoria
+"""
+
+from bloque_memoria import BloqueMemoria
+from eventos import BusEventos
+from memoria import Memoria
+from proceso import Proceso
+from tabla_bloques import TablaBloques
+
+MB = 1024 * 1024
+
+def probar_tabla():
+    print("🔵 === PRUEBA 1: Filas, vistas y reutilización de filas ===")
+    tabla = TablaBloques()
+    a = tabla.agregar(1, 0, 100, ocupado=True, pid_proceso=7)
+    b = tabla.agregar(2, 100, 50)
+    vista = tabla.vista(a)
+    assert (vista.id, vista.inicio, vista.tamano, vista.ocupado, vista.pid_proceso) == (1, 0, 100, True, 7)
+    assert tabla.vista(b).pid_proceso is None and not tabla.vista(b).ocupado
+
+    vista.inicio = 500
+    assert tabla.inicio[a] == 500, "Escribir en la vista escribe en la columna"
+    vista.desvincular()
+    tabla.quitar(a)
+    assert len(tabla) == 1
+    c = tabla.agregar(3, 900, 10, ocupado=True, pid_proceso=8)
+    assert c == a and tabla.capacidad == 2, "La fila libre debe reutilizarse"
+    assert vista.id == 1 and vista.inicio == 500, "La vista desvinculada conserva sus valores"
+    assert vista == BloqueMemoria(1, 500, 100, ocupado=True, pid_proceso=7)
+    assert not hasattr(vista, "__dict__")
+    print("   ✓ Vistas, desvinculación y reutilización correctas")
+    print()
+
+def probar_memoria():
+    print("🔵 === PRUEBA 2: Memoria sobre la tabla ===")
+    memoria = Memoria(1, eventos=BusEventos())
+    procesos = [Proceso(pid, 0, 5, 10 * MB) for pid in range(1, 101)]
+    for ronda in range(5):
+        for proceso in procesos:
+            assert memoria.asignar_memoria(proceso)
+        bloque = procesos[0].bloques_memoria_asignados[0]
+        assert memoria.bloque_en(bloque.inicio) == bloque
+        for proceso in procesos:
+            memoria.liberar_memoria(proceso)
+    assert memoria._tabla.capacidad == len(procesos), "Las filas se reciclan entre rondas"
+    assert len(memoria._tabla) == 0
+    assert bloque.pid_proceso == 1 and bloque.tamano == 10 * MB
+    print(f"   ✓ {memoria._tabla.capacidad} filas para 500 asignaciones")
+    print()
+
+def probar_pid_no_entero_y_vistas_recicladas():
+    print("🔵 === PRUEBA 3: PIDs de texto y vistas de filas reutilizadas ===")
+    memoria = Memoria(1, eventos=BusEventos())
+    # La interfaz asigna memoria con PIDs como "P1"
+    p1, p2 = Proceso("P1", 0, 1, 300 * MB), Proceso("P2", 0, 1, 300 * MB)
+    assert memoria.asignar_memoria(p1)
+    guardada = memoria.bloques_de_proceso("P1")[0]
+    assert guardada.pid_proceso == "P1" and memoria.bloque_en(guardada.inicio) is guardada
+    memoria.liberar_memoria(p1)
+    assert memoria.asignar_memoria(p2)
+    nueva = memoria.bloques_de_proceso("P2")[0]
+    assert nueva._fila == 0, "La fila de P1 se reutiliza para P2"
+    assert guardada.pid_proceso == "P1" and guardada.tamano == 300 * MB, "La vista vieja conserva sus datos"
+    assert nueva.pid_proceso == "P2" and guardada != nueva
+    print("   ✓ PID 'P1' aceptado y la vista liberada no ve el bloque de P2")
+    print()
+
+if __name__ == "__main__":
+    probar_tabla()
+    probar_memoria()
+    probar_pid_no_entero_y_vistas_recicladas()
+    print("🎉 Todas las pruebas de la tabla de bloques pasaron")
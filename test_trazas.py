@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Prueba de la lectura perezosa de trazas CSV/JSONL y su uso en el simulador
+"""
+
+import os
+import random
+import tempfile
+
+from eventos import BusEventos
+from proceso import Proceso
+from simulador import Simulador
+from trazas import escribir_traza, leer_traza
+
+MB = 1024 * 1024
+
+def crear_procesos(cantidad, semilla=0):
+    rng = random.Random(semilla)
+    llegada = 0
+    procesos = []
+    for pid in range(1, cantidad + 1):
+        llegada += rng.randint(0, 3)
+        procesos.append(Proceso(pid, llegada, rng.randint(1, 8), rng.randint(1, 200) * MB,
+                                prioridad=rng.randint(-5, 5)))
+    return procesos
+
+def probar_formatos():
+    print("🔵 === PRUEBA 1: CSV y JSONL, con y sin gzip ===")
+    procesos = crear_procesos(50)
+    esperado = [(p.pid, p.tiempo_llegada, p.duracion, p.tamano_memoria, p.prioridad) for p in procesos]
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre in ("traza.csv", "traza.jsonl", "traza.csv.gz", "traza.jsonl.gz"):
+            ruta = os.path.join(directorio, nombre)
+            assert escribir_traza(procesos, ruta) == 50
+            leidos = [(p.pid, p.tiempo_llegada, p.duracion, p.tamano_memoria, p.prioridad)
+                      for p in leer_traza(ruta)]
+            assert leidos == esperado, nombre
+            print(f"   ✓ {nombre}")
+        ruta = os.path.join(directorio, "mb.csv")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("pid,tiempo_llegada,duracion,memoria_mb\n1,0,3,100\n")
+        assert next(leer_traza(ruta)).tamano_memoria == 100 * MB
+        # Los PID de texto se conservan; los numéricos se leen como enteros
+        for nombre in ("pids.csv", "pids.jsonl"):
+            ruta = os.path.join(directorio, nombre)
+            escribir_traza([Proceso("P1", 0, 3, MB), Proceso(2, 1, 3, MB), Proceso("web-3", 2, 3, MB)], ruta)
+            assert [p.pid for p in leer_traza(ruta)] == ["P1", 2, "web-3"], nombre
+        ruta = os.path.join(directorio, "pid_vacio.csv")
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            archivo.write("pid,tiempo_llegada,duracion,tamano_memoria\n,0,3,1024\n")
+        try:
+            list(leer_traza(ruta))
+            assert False, "Un PID vacío debe fallar"
+        except ValueError as error:
+            assert ":2:" in str(error)
+    print("   ✓ Tamaño en memoria_mb y PID de texto")
+    print()
+
+def probar_validacion():
+    print("🔵 === PRUEBA 2: Errores con archivo y línea ===")
+    casos = {
+        "desordenada.csv": ("pid,tiempo_llegada,duracion,tamano_memoria\n1,5,3,1024\n2,4,3,1024\n", ":3: llegada 4"),
+        "sin_campo.jsonl": ('{"pid": 1, "tiempo_llegada": 0, "tamano_memoria": 1024}\n', ":1: falta el campo duracion"),
+        "rota.jsonl": ('{"pid": 1, "tiempo_llegada": 0, "duracion": 2, "tamano_memoria": 1024}\n\n{"pid": 2\n',
+                       ":3: JSON inválido"),
+        "negativa.csv": ("pid,tiempo_llegada,duracion,tamano_memoria\n1,0,0,1024\n", ":2: la llegada"),
+    }
+    with tempfile.TemporaryDirectory() as directorio:
+        for nombre, (contenido, mensaje) in casos.items():
+            ruta = os.path.join(directorio, nombre)
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(contenido)
+            try:
+                list(leer_traza(ruta))
+                assert False, f"{nombre} debe fallar"
+            except ValueError as error:
+                assert mensaje in str(error), str(error)
+            print(f"   ✓ {nombre}: {mensaje.strip(':')}")
+        ruta = os.path.join(directorio, "desordenada.csv")
+        assert len(list(leer_traza(ruta, validar_orden=False))) == 2
+        try:
+            leer_traza(os.path.join(directorio, "traza.txt")).__next__()
+            assert False, "Debe rechazar extensiones desconocidas"
+        except ValueError:
+            pass
+    print()
+
+def probar_alimentacion_perezosa():
+    print("🔵 === PRUEBA 3: El simulador lee la traza a medida que avanza el reloj ===")
+    procesos = crear_procesos(3000, semilla=4)
+    completo = Simulador(num_nucleos=2, eventos=BusEventos(), tiempo_limite=None)
+    completo.configurar_algoritmo("RR")
+    completo.agregar_procesos(procesos)
+    esperado = completo.ejecutar()
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "traza.jsonl.gz")
+        escribir_traza(crear_procesos(3000, semilla=4), ruta)
+        simulador = Simulador(num_nucleos=2, eventos=BusEventos(), tiempo_limite=None, conservar_terminados=False)
+        simulador.configurar_algoritmo("RR")
+        simulador.agregar_traza(leer_traza(ruta))
+        maximo_pendientes = 0
+        while simulador.paso_evento():
+            maximo_pendientes = max(maximo_pendientes, len(simulador.procesos_nuevos))
+        estadisticas = simulador.calcular_estadisticas()
+    assert maximo_pendientes == 1, "Solo el próximo proceso de la traza está en memoria"
+    assert not simulador.procesos_terminados and estadisticas["procesos_terminados"] == 3000
+    for clave in ("total_procesos", "tiempo_promedio_retorno", "tiempo_promedio_respuesta",
+                  "tiempo_promedio_espera", "tiempo_total_simulacion", "indice_equidad_jain"):
+        assert estadisticas[clave] == esperado[clave], clave
+
+    simulador = Simulador(num_nucleos=1, eventos=BusEventos(), tiempo_limite=None)
+    simulador.agregar_traza(Proceso(pid, llegada, 1, MB) for pid, llegada in ((1, 0), (2, 5), (3, 2)))
+    try:
+        simulador.ejecutar()
+        assert False, "Una fuente desordenada debe fallar"
+    except ValueError:
+        pass
+    print(f"   ✓ 3000 procesos con a lo sumo {maximo_pendientes} pendiente leído; mismas estadísticas")
+    print()
+
+if __name__ == "__main__":
+    probar_formatos()
+    probar_validacion()
+    probar_alimentacion_perezosa()
+    print("✅ === PRUEBAS COMPLETADAS ===")
@@ -0,0 +1,108 @@
+import csv
+import gzip
+import json
+
+from proceso import Proceso
+
+MB = 1024 * 1024
+
+FORMATOS = ("csv", "jsonl")
+
+
+def detectar_formato(ruta):
+    """'csv' o 'jsonl' según la extensión (se ignora un .gz final)"""
+    nombre = ruta[:-3] if ruta.endswith(".gz") else ruta
+    for formato in FORMATOS:
+        if nombre.endswith("." + formato):
+            return formato
+    raise ValueError(f"No se reconoce el formato de la traza: {ruta} (se espera .csv o .jsonl, opcionalmente .gz)")
+
+
+def _abrir(ruta, modo):
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, modo + "t", encoding="utf-8", newline="")
+    return open(ruta, modo, encoding="utf-8", newline="")
+
+
+def leer_traza(ruta, formato=None, validar_orden=True):
+    """
+    Genera, de a uno y sin cargar el archivo entero, los procesos de una traza CSV
+    o JSONL (opcionalmente comprimida con gzip). Cada registro tiene pid,
+    tiempo_llegada, duracion y tamano_memoria en bytes (o memoria_mb), y
+    opcionalmente prioridad y boletos. El PID se conserva tal como viene ("P1");
+    solo se convierte a entero si es un número escrito como texto. Con validar_orden, una llegada anterior a
+    la del registro previo es un error: la traza debe venir ordenada por llegada.
+    """
+    formato = formato or detectar_formato(ruta)
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato de traza no reconocido: {formato}")
+    with _abrir(ruta, "r") as archivo:
+        if formato == "csv":
+            lector = csv.DictReader(archivo)
+            # La línea 1 es el encabezado
+            registros = ((lector.line_num, fila) for fila in lector)
+        else:
+            registros = ((numero, linea) for numero, linea in enumerate(archivo, start=1) if linea.strip())
+        llegada_anterior = None
+        for numero, registro in registros:
+            ubicacion = f"{ruta}:{numero}"
+            if formato == "jsonl":
+                try:
+                    registro = json.loads(registro)
+                except json.JSONDecodeError as error:
+                    raise ValueError(f"{ubicacion}: JSON inválido ({error.msg})") from None
+            proceso = _crear_proceso(registro, ubicacion)
+            if validar_orden and llegada_anterior is not None and proceso.tiempo_llegada < llegada_anterior:
+                raise ValueError(f"{ubicacion}: llegada {proceso.tiempo_llegada} anterior a la del registro "
+                                 f"previo ({llegada_anterior}); la traza debe estar ordenada por llegada")
+            llegada_anterior = proceso.tiempo_llegada
+            yield proceso
+
+
+def _crear_proceso(registro, ubicacion):
+    try:
+        if registro.get("tamano_memoria") not in (None, ""):
+            tamano = int(registro["tamano_memoria"])
+        else:
+            tamano = int(registro["memoria_mb"]) * MB
+        proceso = Proceso(_leer_pid(registro["pid"]), int(registro["tiempo_llegada"]), int(registro["duracion"]), tamano,
+                          prioridad=int(registro.get("prioridad") or 0),
+                          boletos=int(registro.get("boletos") or 100))
+    except KeyError as error:
+        raise ValueError(f"{ubicacion}: falta el campo {error.args[0]}") from None
+    except (TypeError, ValueError) as error:
+        raise ValueError(f"{ubicacion}: valor inválido ({error})") from None
+    if proceso.tiempo_llegada < 0 or proceso.duracion <= 0 or proceso.tamano_memoria <= 0:
+        raise ValueError(f"{ubicacion}: la llegada no puede ser negativa y la duración y el tamaño deben ser positivos")
+    return proceso
+
+
+def _leer_pid(valor):
+    if isinstance(valor, str):
+        valor = valor.strip()
+        try:
+            return int(valor)
+        except ValueError:
+            pass
+    if valor in (None, ""):
+        raise ValueError("el PID no puede estar vacío")
+    return valor
+
+
+def escribir_traza(procesos, ruta, formato=None):
+    """Guarda los procesos como traza CSV o JSONL (gzip si la ruta termina en .gz). Retorna cuántos escribió"""
+    formato = formato or detectar_formato(ruta)
+    campos = ("pid", "tiempo_llegada", "duracion", "tamano_memoria", "prioridad", "boletos")
+    cantidad = 0
+    with _abrir(ruta, "w") as archivo:
+        escritor = csv.DictWriter(archivo, fieldnames=campos) if formato == "csv" else None
+        if escritor:
+            escritor.writeheader()
+        for proceso in procesos:
+            registro = {campo: getattr(proceso, campo) for campo in campos}
+            if escritor:
+                escritor.writerow(registro)
+            else:
+                archivo.write(json.dumps(registro) + "\n")
+            cantidad += 1
+    return cantidad
@@ -0,0 +1,258 @@
+import random
+
+
+class _Nodo:
+    __slots__ = ("clave", "valor", "maximo", "prioridad", "izq", "der")
+
+    def __init__(self, clave, valor, prioridad):
+        self.clave = clave
+        self.valor = valor
+        self.maximo = valor
+        self.prioridad = prioridad
+        self.izq = None
+        self.der = None
+
+
+class Treap:
+    """
+    Árbol binario de búsqueda balanceado (treap) ordenado por clave.
+
+    Si aumentado=True cada nodo guarda además el valor máximo de su subárbol,
+    lo que permite encontrar en O(log n) la primera clave cuyo valor alcanza
+    un mínimo (por ejemplo, el primer bloque libre suficientemente grande).
+    """
+
+    def __init__(self, aumentado=False, semilla=0):
+        self._raiz = None
+        self._tamano = 0
+        self._aumentado = aumentado
+        # Generador propio para no alterar el estado global de random
+        self._azar = random.Random(semilla)
+
+    def __len__(self):
+        return self._tamano
+
+    def __bool__(self):
+        return self._tamano > 0
+
+    def __contains__(self, clave):
+        return self._buscar_nodo(clave) is not None
+
+    def __iter__(self):
+        """Recorre los pares (clave, valor) en orden de clave"""
+        pila = []
+        nodo = self._raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo)
+                nodo = nodo.izq
+            nodo = pila.pop()
+            yield nodo.clave, nodo.valor
+            nodo = nodo.der
+
+    @property
+    def valor_maximo(self):
+        """Mayor valor almacenado (solo si el árbol es aumentado)"""
+        return self._raiz.maximo if self._raiz is not None else None
+
+    # --- Operaciones de modificación ---
+
+    def insertar(self, clave, valor=None):
+        """Inserta una clave nueva (la clave no debe existir)"""
+        nodo = _Nodo(clave, valor, self._azar.random())
+        self._raiz = self._insertar(self._raiz, nodo)
+        self._tamano += 1
+
+    def eliminar(self, clave):
+        """Elimina una clave existente y devuelve su valor"""
+        nodo = self._buscar_nodo(clave)
+        if nodo is None:
+            raise KeyError(clave)
+        self._raiz = self._eliminar(self._raiz, clave)
+        self._tamano -= 1
+        return nodo.valor
+
+    def actualizar(self, clave, valor):
+        """Cambia el valor de una clave existente"""
+        if not self._actualizar_valor(self._raiz, clave, valor):
+            raise KeyError(clave)
+
+    def limpiar(self):
+        self._raiz = None
+        self._tamano = 0
+
+    # --- Consultas ---
+
+    def obtener(self, clave, defecto=None):
+        nodo = self._buscar_nodo(clave)
+        return nodo.valor if nodo is not None else defecto
+
+    def minimo(self):
+        """Par (clave, valor) con la menor clave, o None"""
+        nodo = self._raiz
+        if nodo is None:
+            return None
+        while nodo.izq is not None:
+            nodo = nodo.izq
+        return nodo.clave, nodo.valor
+
+    def maximo(self):
+        """Par (clave, valor) con la mayor clave, o None"""
+        nodo = self._raiz
+        if nodo is None:
+            return None
+        while nodo.der is not None:
+            nodo = nodo.der
+        return nodo.clave, nodo.valor
+
+    def predecesor(self, clave):
+        """Par con la mayor clave estrictamente menor que 'clave'"""
+        nodo, mejor = self._raiz, None
+        while nodo is not None:
+            if nodo.clave < clave:
+                mejor = nodo
+                nodo = nodo.der
+            else:
+                nodo = nodo.izq
+        return (mejor.clave, mejor.valor) if mejor is not None else None
+
+    def sucesor(self, clave):
+        """Par con la menor clave estrictamente mayor que 'clave'"""
+        nodo, mejor = self._raiz, None
+        while nodo is not None:
+            if clave < nodo.clave:
+                mejor = nodo
+                nodo = nodo.izq
+            else:
+                nodo = nodo.der
+        return (mejor.clave, mejor.valor) if mejor is not None else None
+
+    def techo(self, clave):
+        """Par con la menor clave mayor o igual que 'clave'"""
+        nodo, mejor = self._raiz, None
+        while nodo is not None:
+            if nodo.clave < clave:
+                nodo = nodo.der
+            else:
+                mejor = nodo
+                nodo = nodo.izq
+        return (mejor.clave, mejor.valor) if mejor is not None else None
+
+    def suelo(self, clave):
+        """Par con la mayor clave menor o igual que 'clave'"""
+        nodo, mejor = self._raiz, None
+        while nodo is not None:
+            if clave < nodo.clave:
+                nodo = nodo.izq
+            else:
+                mejor = nodo
+                nodo = nodo.der
+        return (mejor.clave, mejor.valor) if mejor is not None else None
+
+    def primero_con_valor(self, valor_minimo, desde=None):
+        """
+        Devuelve el par de menor clave (>= desde) cuyo valor sea >= valor_minimo.
+        Requiere aumentado=True. Descarta subárboles completos usando el máximo.
+        """
+        nodo = self._primero_con_valor(self._raiz, valor_minimo, desde)
+        return (nodo.clave, nodo.valor) if nodo is not None else None
+
+    # --- Implementación interna ---
+
+    def _buscar_nodo(self, clave):
+        nodo = self._raiz
+        while nodo is not None:
+            if clave < nodo.clave:
+                nodo = nodo.izq
+            elif nodo.clave < clave:
+                nodo = nodo.der
+            else:
+                return nodo
+        return None
+
+    def _recalcular(self, nodo):
+        if not self._aumentado:
+            return
+        maximo = nodo.valor
+        if nodo.izq is not None and nodo.izq.maximo > maximo:
+            maximo = nodo.izq.maximo
+        if nodo.der is not None and nodo.der.maximo > maximo:
+            maximo = nodo.der.maximo
+        nodo.maximo = maximo
+
+    def _dividir(self, nodo, clave):
+        """Separa en (claves < clave, claves >= clave)"""
+        if nodo is None:
+            return None, None
+        if nodo.clave < clave:
+            menores, mayores = self._dividir(nodo.der, clave)
+            nodo.der = menores
+            self._recalcular(nodo)
+            return nodo, mayores
+        menores, mayores = self._dividir(nodo.izq, clave)
+        nodo.izq = mayores
+        self._recalcular(nodo)
+        return menores, nodo
+
+    def _unir(self, izq, der):
+        if izq is None:
+            return der
+        if der is None:
+            return izq
+        if izq.prioridad > der.prioridad:
+            izq.der = self._unir(izq.der, der)
+            self._recalcular(izq)
+            return izq
+        der.izq = self._unir(izq, der.izq)
+        self._recalcular(der)
+        return der
+
+    def _insertar(self, raiz, nodo):
+        if raiz is None:
+            return nodo
+        if nodo.prioridad > raiz.prioridad:
+            nodo.izq, nodo.der = self._dividir(raiz, nodo.clave)
+            self._recalcular(nodo)
+            return nodo
+        if nodo.clave < raiz.clave:
+            raiz.izq = self._insertar(raiz.izq, nodo)
+        else:
+            raiz.der = self._insertar(raiz.der, nodo)
+        self._recalcular(raiz)
+        return raiz
+
+    def _eliminar(self, raiz, clave):
+        if clave < raiz.clave:
+            raiz.izq = self._eliminar(raiz.izq, clave)
+        elif raiz.clave < clave:
+            raiz.der = self._eliminar(raiz.der, clave)
+        else:
+            return self._unir(raiz.izq, raiz.der)
+        self._recalcular(raiz)
+        return raiz
+
+    def _actualizar_valor(self, nodo, clave, valor):
+        if nodo is None:
+            return False
+        if clave < nodo.clave:
+            encontrado = self._actualizar_valor(nodo.izq, clave, valor)
+        elif nodo.clave < clave:
+            encontrado = self._actualizar_valor(nodo.der, clave, valor)
+        else:
+            nodo.valor = valor
+            encontrado = True
+        if encontrado:
+            self._recalcular(nodo)
+        return encontrado
+
+    def _primero_con_valor(self, nodo, valor_minimo, desde):
+        if nodo is None or nodo.maximo < valor_minimo:
+            return None
+        if desde is not None and nodo.clave < desde:
+            return self._primero_con_valor(nodo.der, valor_minimo, desde)
+        encontrado = self._primero_con_valor(nodo.izq, valor_minimo, desde)
+        if encontrado is not None:
+            return encontrado
+        if nodo.valor >= valor_minimo:
+            return nodo
+        return self._primero_con_valor(nodo.der, valor_minimo, desde)